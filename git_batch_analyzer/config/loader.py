@@ -111,6 +111,10 @@ def _parse_config_dict(config_dict: Dict[str, Any]) -> AnalysisConfig:
     stale_days = _parse_optional_int_param(config_dict, 'stale_days', 'stale_days')
     fetch_depth = _parse_int_param(config_dict, 'fetch_depth', 200, 'fetch_depth')
     top_k_files = _parse_int_param(config_dict, 'top_k_files', 10, 'top_k_files')
+    first_parent_merges = _parse_bool_param(
+        config_dict, 'first_parent_merges', False, 'first_parent_merges'
+    )
+    partial_clone = _parse_bool_param(config_dict, 'partial_clone', False, 'partial_clone')
     
     # Parse path parameters
     cache_dir = _parse_path_param(config_dict, 'cache_dir', 
@@ -150,6 +154,8 @@ def _parse_config_dict(config_dict: Dict[str, Any]) -> AnalysisConfig:
             stale_days=stale_days,
             fetch_depth=fetch_depth,
             top_k_files=top_k_files,
+            first_parent_merges=first_parent_merges,
+            partial_clone=partial_clone,
             llm=llm_config,
             email=email_config
         )
@@ -177,6 +183,16 @@ def _parse_int_param(config_dict: Dict[str, Any], key: str, default: int, param_
     return value
 
 
+def _parse_bool_param(config_dict: Dict[str, Any], key: str, default: bool, param_name: str) -> bool:
+    """Parse and validate a boolean parameter."""
+    value = config_dict.get(key, default)
+    
+    if not isinstance(value, bool):
+        raise ConfigurationError(f"'{param_name}' must be true or false")
+    
+    return value
+
+
 def _parse_optional_int_param(config_dict: Dict[str, Any], key: str, param_name: str) -> Optional[int]:
     """Parse and validate an optional integer parameter."""
     if key not in config_dict:
@@ -269,6 +285,8 @@ def _parse_llm_config(llm_data: Dict[str, Any]) -> LLMConfig:
     api_key = llm_data.get('api_key')
     base_url = llm_data.get('base_url')
     max_tokens = llm_data.get('max_tokens')
+    users_per_prompt = llm_data.get('users_per_prompt', 1)
+    cache_nondeterministic = llm_data.get('cache_nondeterministic', False)
     
     # Validate types
     if not isinstance(provider, str):
@@ -289,6 +307,12 @@ def _parse_llm_config(llm_data: Dict[str, Any]) -> LLMConfig:
     if max_tokens is not None and not isinstance(max_tokens, int):
         raise ConfigurationError("LLM 'max_tokens' must be an integer or null")
     
+    if not isinstance(users_per_prompt, int) or isinstance(users_per_prompt, bool):
+        raise ConfigurationError("LLM 'users_per_prompt' must be an integer")
+    
+    if not isinstance(cache_nondeterministic, bool):
+        raise ConfigurationError("LLM 'cache_nondeterministic' must be true or false")
+    
     # Set default base_url for OpenRouter
     if provider.lower() == 'openrouter' and base_url is None:
         base_url = 'https://openrouter.ai/api/v1'
@@ -299,7 +323,9 @@ def _parse_llm_config(llm_data: Dict[str, Any]) -> LLMConfig:
         temperature=float(temperature),
         api_key=api_key.strip() if api_key else None,
         base_url=base_url.strip() if base_url else None,
-        max_tokens=max_tokens
+        max_tokens=max_tokens,
+        users_per_prompt=users_per_prompt,
+        cache_nondeterministic=cache_nondeterministic
     )
 
 
@@ -439,6 +465,9 @@ def _validate_llm_config(llm: LLMConfig) -> None:
         if llm.max_tokens > 100000:  # Reasonable upper limit
             raise ConfigurationError("LLM max_tokens cannot exceed 100000")
     
+    if llm.users_per_prompt < 1 or llm.users_per_prompt > 50:
+        raise ConfigurationError("LLM users_per_prompt must be between 1 and 50")
+    
     # Validate base_url if specified
     if llm.base_url is not None:
         if not llm.base_url.strip():
@@ -22,6 +22,8 @@ class LLMConfig:
     api_key: Optional[str] = None
     base_url: Optional[str] = None  # For custom API endpoints like OpenRouter
     max_tokens: Optional[int] = None  # For controlling response length
+    users_per_prompt: int = 1  # Developers per recommendations request
+    cache_nondeterministic: bool = False  # Reuse responses sampled above temperature 0 across runs
 
 
 @dataclass
@@ -57,6 +59,8 @@ class AnalysisConfig:
     stale_days: Optional[int] = None  # Defaults to period_days if not specified
     fetch_depth: int = 200
     top_k_files: int = 10
+    first_parent_merges: bool = False  # Only count merges made on the analyzed branch itself
+    partial_clone: bool = False  # Clone with --filter=blob:none; blobs are fetched on demand
     llm: Optional[LLMConfig] = None
     email: Optional[EmailConfig] = None
     max_workers: int = 4  # Number of parallel workers for repository processing
@@ -13,6 +13,7 @@ from .config.models import AnalysisConfig, EmailConfig
 from .workflow.graph import process_repositories
 from .tools.email_tool import EmailTool
 from .tools.git_tool import GitTool
+from .tools.llm_tool import LLMTool
 
 
 # Configure logging
@@ -241,6 +242,8 @@ def _process_all_repositories(config: AnalysisConfig) -> Dict[str, Any]:
         "stale_days": config.stale_days,
         "fetch_depth": config.fetch_depth,
         "top_k_files": config.top_k_files,
+        "first_parent_merges": config.first_parent_merges,
+        "partial_clone": config.partial_clone,
         "cache_dir": str(config.cache_dir),
         "output_file": str(config.output_file),
         "max_workers": config.max_workers,
@@ -248,7 +251,9 @@ def _process_all_repositories(config: AnalysisConfig) -> Dict[str, Any]:
             "provider": config.llm.provider,
             "model": config.llm.model,
             "temperature": config.llm.temperature,
-            "api_key": config.llm.api_key
+            "api_key": config.llm.api_key,
+            "users_per_prompt": config.llm.users_per_prompt,
+            "cache_nondeterministic": config.llm.cache_nondeterministic
         } if config.llm else None
     }
     
@@ -261,7 +266,10 @@ def _process_all_repositories(config: AnalysisConfig) -> Dict[str, Any]:
         repositories.append(repo_dict)
     
     # Process repositories with progress tracking
-    results = process_repositories(repositories, config_dict)
+    try:
+        results = process_repositories(repositories, config_dict)
+    finally:
+        LLMTool.close_all()
     
     # Initialize inactive_repositories list if not present
     if "inactive_repositories" not in results:
@@ -1,16 +1,286 @@
 """Git operations tool for repository analysis."""
 
+import atexit
 import json
 import logging
+import os
+import re
+import shutil
 import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..types import ToolResponse, MergeCommit, DiffStats, BranchInfo
 
 logger = logging.getLogger(__name__)
 
+# How long ls-remote output is reused before asking the remote again
+LS_REMOTE_TTL_SECONDS = 60
+
+# How long after a fetch (or clone) fetch() skips asking the remotes again
+FETCH_TTL_SECONDS = 300
+
+# Upper bound on concurrent git processes for batch reads. The work happens
+# in the git subprocesses, so threads only wait on pipes and the GIL is idle.
+MAX_GIT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Numstat results kept per GitTool, keyed by full commit hash
+NUMSTAT_CACHE_SIZE = 8192
+
+# Upper bound on persistent "git diff-tree --stdin" processes per repository
+DIFF_TREE_MAX_PROCS = 4
+
+# Files excluded from analysis: projen-generated files and common
+# generated/build output, matched in one pass instead of per pattern
+_EXCLUDED_FILE_RE = re.compile(
+    r"(?:"
+    r"\.projen/|node_modules/|\.git/|dist/|build/|out/|\.vscode/|\.idea/|__pycache__/"  # Directories
+    r"|\.projenrc\.py\Z|\.DS_Store\Z"  # Exact file names
+    r"|.*\.pyc\Z"  # File extensions
+    r")"
+)
+
+# The same exclusions as git pathspecs, so git can drop those files from
+# per-commit numstat output before it reaches Python
+_EXCLUDED_PATHSPECS = [
+    ":(exclude,glob).projen/**",
+    ":(exclude,glob)node_modules/**",
+    ":(exclude,glob)dist/**",
+    ":(exclude,glob)build/**",
+    ":(exclude,glob)out/**",
+    ":(exclude,glob).vscode/**",
+    ":(exclude,glob).idea/**",
+    ":(exclude,glob)__pycache__/**",
+    ":(exclude,literal).projenrc.py",
+    ":(exclude,literal).DS_Store",
+    ":(exclude)*.pyc",
+]
+
+# git log placeholder for each MergeCommit field, in MergeCommit order
+MERGE_FIELD_FORMATS = {
+    "hash": "%H",
+    "timestamp": "%ct",
+    "message": "%s",
+    "parents": "%P",
+    "author": "%an",
+}
+FULL_MERGE_FIELDS = frozenset(MERGE_FIELD_FORMATS)
+
+# Full SHA-1 or SHA-256 object name, the only input diff-tree --stdin diffs
+_FULL_HASH_RE = re.compile(r"(?:[0-9a-f]{40}|[0-9a-f]{64})\Z")
+
+# One "git shortlog -sne" line: "   <count>\t<name> <<email>>"
+_SHORTLOG_EMAIL_RE = re.compile(r"\s*\d+\t.*<([^<>]*)>\s*$")
+
+
+# Background deletions of replaced clones, joined before the interpreter exits
+_pending_deletes: List[threading.Thread] = []
+
+
+def _join_pending_deletes() -> None:
+    for thread in _pending_deletes:
+        thread.join()
+
+
+atexit.register(_join_pending_deletes)
+
+
+def _discard_directory(path: Path) -> None:
+    """Move a directory out of the way and delete it in the background.
+
+    Renaming is a single metadata operation, so a re-clone can start
+    immediately instead of waiting for a large .git directory to be removed.
+
+    Args:
+        path: Directory to remove
+    """
+    pending = path.with_name(f"{path.name}.delete-pending-{uuid.uuid4().hex[:8]}")
+    try:
+        os.rename(path, pending)
+    except OSError as e:
+        logger.debug(f"Could not rename {path} for background delete: {e}")
+        shutil.rmtree(path)
+        return
+
+    thread = threading.Thread(
+        target=shutil.rmtree, args=(pending,), kwargs={"ignore_errors": True}, daemon=False
+    )
+    thread.start()
+    _pending_deletes.append(thread)
+
+
+_UTC = timezone.utc
+_from_timestamp = datetime.fromtimestamp
+
+
+@lru_cache(maxsize=4096)
+def _ts_to_dt(timestamp: int) -> datetime:
+    """Convert a unix timestamp to a UTC datetime, memoized.
+
+    Commits created by the same batch or CI job often share a second.
+    """
+    return _from_timestamp(timestamp, _UTC)
+
+
+@lru_cache(maxsize=4096)
+def _ts_to_iso(timestamp: int) -> str:
+    """Convert a unix timestamp to a UTC ISO 8601 string, memoized.
+
+    Same text as ``datetime.isoformat()`` on an aware UTC datetime, without
+    building the datetime first.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(timestamp))
+
+
+def _git_env() -> Dict[str, str]:
+    """Environment for git subprocesses.
+
+    GIT_OPTIONAL_LOCKS=0 stops read commands from taking the index lock to
+    write back refreshed stat data, so concurrent reads never contend on it.
+    """
+    return {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+
+class GitDiffTreeWorkerPool:
+    """Pool of persistent ``git diff-tree --stdin --numstat`` processes.
+
+    Each worker is fed one commit hash followed by a sentinel line; diff-tree
+    echoes lines that are not object names, so everything before the echoed
+    sentinel is that commit's numstat. A worker is checked out by a single
+    thread at a time and at most ``max_procs`` processes are ever started.
+    """
+
+    SENTINEL = "__END_OF_COMMIT__"
+
+    def __init__(self, repo_path: Path, max_procs: int = DIFF_TREE_MAX_PROCS):
+        """Initialize the pool; workers are started on demand.
+
+        Args:
+            repo_path: Path to the git repository
+            max_procs: Maximum number of concurrent diff-tree processes
+        """
+        self.repo_path = Path(repo_path)
+        self.max_procs = max_procs
+        self._idle: List[subprocess.Popen] = []
+        self._procs: List[subprocess.Popen] = []
+        # Guards both lists; notified whenever a worker is returned or discarded
+        self._changed = threading.Condition()
+
+    def __enter__(self) -> "GitDiffTreeWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _spawn(self) -> subprocess.Popen:
+        # Same diff as "git show --numstat": renames detected, merges against
+        # their first parent, root commits against the empty tree
+        args = [
+            "git", "diff-tree", "--stdin", "--numstat", "-r", "--root", "-M",
+            "--no-commit-id", "--diff-merges=first-parent", "--",
+        ] + _EXCLUDED_PATHSPECS
+        return subprocess.Popen(
+            args,
+            cwd=self.repo_path,
+            env=_git_env(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+
+    def acquire(self) -> subprocess.Popen:
+        """Check out an idle worker, starting one if the pool is not full.
+
+        Waits while every worker is checked out. A discarded worker frees its
+        slot, so a waiting thread starts a replacement instead of waiting on
+        workers that will never come back.
+        """
+        with self._changed:
+            while not self._idle and len(self._procs) >= self.max_procs:
+                self._changed.wait()
+            if self._idle:
+                return self._idle.pop()
+            proc = self._spawn()
+            self._procs.append(proc)
+            return proc
+
+    def release(self, proc: subprocess.Popen) -> None:
+        """Return a worker to the pool."""
+        with self._changed:
+            self._idle.append(proc)
+            self._changed.notify()
+
+    def _discard(self, proc: subprocess.Popen) -> None:
+        proc.kill()
+        proc.wait()
+        with self._changed:
+            self._procs.remove(proc)
+            self._changed.notify()
+
+    def numstat(self, commit_hash: str) -> List[str]:
+        """Get the numstat lines for one commit.
+
+        Args:
+            commit_hash: Full hash of the commit
+
+        Returns:
+            List of "additions\tdeletions\tfilename" lines
+
+        Raises:
+            ValueError: If commit_hash is not a full object name
+            OSError: If the worker process failed
+        """
+        if not _FULL_HASH_RE.match(commit_hash):
+            raise ValueError(f"Not a full commit hash: {commit_hash}")
+
+        proc = self.acquire()
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(f"{commit_hash}\n{self.SENTINEL}\n")
+            proc.stdin.flush()
+
+            lines = []
+            while True:
+                line = proc.stdout.readline()
+                if not line:
+                    raise OSError("git diff-tree worker exited unexpectedly")
+                line = line.rstrip("\n")
+                if line == self.SENTINEL:
+                    break
+                lines.append(line)
+        except OSError:
+            self._discard(proc)
+            raise
+
+        self.release(proc)
+        return lines
+
+    def close(self) -> None:
+        """Stop all workers."""
+        with self._changed:
+            procs, self._procs = self._procs, []
+            self._idle = []
+        for proc in procs:
+            assert proc.stdin is not None and proc.stdout is not None
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
 
 class GitTool:
     """Tool for performing git operations with structured JSON responses."""
@@ -22,7 +292,63 @@ class GitTool:
             repo_path: Path to the git repository
         """
         self.repo_path = Path(repo_path)
+
+        # Per-instance caches for values that don't change during an analysis run
+        self._default_branch: Optional[str] = None
+        self._remote_url: Optional[str] = None
+        self._ls_remote_heads: Optional[Tuple[float, str]] = None  # (fetched at, output)
+        self._last_fetch: Optional[float] = None  # monotonic time of last fetch
+
+        # Commits are immutable, so numstat output for a full hash never changes
+        self._numstat_cache: Dict[str, List[str]] = {}
+        self._numstat_lock = threading.Lock()
+
+        # Merges seen by the last complete commit walk per (branch, since_days),
+        # as (hash, timestamp, message, parents, author) rows
+        self._walked_merges: Dict[Tuple[str, int], List[Tuple[str, int, str, str, str]]] = {}
+
+    def _clear_caches(self) -> None:
+        """Forget cached repository metadata, e.g. after re-cloning."""
+        self._default_branch = None
+        self._remote_url = None
+        self._ls_remote_heads = None
+        self._last_fetch = None
+        self._walked_merges = {}
     
+    def _cached_numstat(self, commit_hash: str) -> Optional[List[str]]:
+        """Return cached numstat lines for a commit, if any."""
+        return self._numstat_cache.get(commit_hash)
+
+    def _store_numstat(self, commit_hash: str, lines: List[str]) -> None:
+        """Cache numstat lines for a full commit hash; refs like HEAD can move."""
+        if not _FULL_HASH_RE.match(commit_hash):
+            return
+        with self._numstat_lock:
+            if len(self._numstat_cache) >= NUMSTAT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._numstat_cache.pop(next(iter(self._numstat_cache)))
+            self._numstat_cache[commit_hash] = lines
+
+    def _commit_numstat(self, commit_hash: str) -> ToolResponse:
+        """Get numstat lines for one commit, from cache or ``git show``."""
+        cached = self._cached_numstat(commit_hash)
+        if cached is not None:
+            return ToolResponse.success_response(cached)
+
+        # Get numstat for the commit, leaving out excluded files inside git.
+        # Merges are diffed against their first parent; with a pathspec, git
+        # would otherwise print nothing for them.
+        args = [
+            "show", "--numstat", "--format=", "--diff-merges=first-parent", commit_hash, "--"
+        ] + _EXCLUDED_PATHSPECS
+        response = self._run_git_command(args)
+        if not response.success:
+            return response
+
+        lines = response.data.splitlines() if response.data else []
+        self._store_numstat(commit_hash, lines)
+        return ToolResponse.success_response(lines)
+
     def _should_exclude_file(self, filename: str) -> bool:
         """Check if a file should be excluded from analysis.
         
@@ -32,39 +358,7 @@ class GitTool:
         Returns:
             True if file should be excluded, False otherwise
         """
-        # Exclude projen-generated files and directories
-        if filename.startswith('.projen/') or filename == '.projenrc.py':
-            return True
-        
-        # Exclude other common generated/build files
-        excluded_patterns = [
-            'node_modules/',
-            '.git/',
-            'dist/',
-            'build/',
-            'out/',
-            '.vscode/',
-            '.idea/',
-            '__pycache__/',
-            '*.pyc',
-            '.DS_Store'
-        ]
-        
-        for pattern in excluded_patterns:
-            if pattern.endswith('/'):
-                # Directory pattern
-                if filename.startswith(pattern):
-                    return True
-            elif pattern.startswith('*.'):
-                # File extension pattern
-                if filename.endswith(pattern[1:]):
-                    return True
-            else:
-                # Exact match
-                if filename == pattern:
-                    return True
-        
-        return False
+        return _EXCLUDED_FILE_RE.match(filename) is not None
 
     def _run_git_command(
         self, args: List[str], cwd: Optional[Path] = None
@@ -83,7 +377,13 @@ class GitTool:
 
         try:
             result = subprocess.run(
-                cmd, cwd=work_dir, capture_output=True, text=True, check=True, timeout=60
+                cmd,
+                cwd=work_dir,
+                env=_git_env(),
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=60,
             )
             return ToolResponse.success_response(result.stdout.strip())
         except subprocess.TimeoutExpired as e:
@@ -96,40 +396,149 @@ class GitTool:
             error_msg = f"Unexpected error running git command: {' '.join(cmd)}\nError: {str(e)}"
             return ToolResponse.error_response(error_msg)
 
-    def clone(self, url: str, depth: int = 200) -> ToolResponse:
-        """Clone a repository with shallow clone support.
+    def _run_git_command_streaming(
+        self, args: List[str], cwd: Optional[Path] = None, timeout: float = 60
+    ) -> Iterator[str]:
+        """Run a git command and yield its output line by line.
+
+        Unlike ``_run_git_command`` the output is never buffered as a whole, so
+        large ``git log`` output is parsed while git is still producing it.
+        stderr is drained on a separate thread so a chatty git cannot block on
+        a full pipe, and git is killed once the deadline passes.
+
+        Args:
+            args: Git command arguments (without 'git')
+            cwd: Working directory for the command
+            timeout: Seconds the whole command, including consumption, may take
+
+        Yields:
+            Output lines without the trailing newline
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with a non-zero status
+            subprocess.TimeoutExpired: If git does not finish within ``timeout``
+        """
+        cmd = ["git"] + args
+        work_dir = cwd or self.repo_path
+
+        proc = subprocess.Popen(
+            cmd,
+            cwd=work_dir,
+            env=_git_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        assert proc.stdout is not None and proc.stderr is not None
+        stdout, stderr = proc.stdout, proc.stderr
+
+        stderr_chunks: List[str] = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(stderr.read()), daemon=True
+        )
+        stderr_reader.start()
+
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            proc.kill()
+
+        deadline = threading.Timer(timeout, expire)
+        deadline.daemon = True
+        deadline.start()
+        try:
+            for line in stdout:
+                yield line.rstrip("\n")
+            returncode = proc.wait()
+            stderr_reader.join()
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(
+                    returncode, cmd, stderr="".join(stderr_chunks)
+                )
+        finally:
+            deadline.cancel()
+            # Consumer stopped early or parsing failed: don't leave git running
+            if proc.poll() is None:
+                proc.kill()
+            stdout.close()
+            stderr_reader.join()
+            stderr.close()
+            proc.wait()
+
+    def clone(
+        self,
+        url: str,
+        depth: int = 200,
+        filter_spec: Optional[str] = None,
+        since_days: Optional[int] = None,
+    ) -> ToolResponse:
+        """Clone a repository with shallow and partial clone support.
 
         Args:
             url: Repository URL to clone
             depth: Fetch depth for shallow clone (use None for full clone)
+            filter_spec: Partial clone filter passed as ``--filter``, e.g.
+                ``"blob:none"``. Missing blobs are then fetched from the remote
+                on demand, one ``git fetch`` per numstat or diff that needs
+                them, so this only pays off for runs that read commit
+                metadata alone. None (the default) downloads all objects.
+            since_days: Analysis window in days. For shallow clones, history is
+                bounded by date (``--shallow-since``) instead of commit count,
+                falling back to ``depth`` if the remote rejects it.
 
         Returns:
             ToolResponse indicating success or failure
         """
         # Ensure parent directory exists
         self.repo_path.parent.mkdir(parents=True, exist_ok=True)
+        self._clear_caches()
 
         # Remove existing directory if it exists
         if self.repo_path.exists():
-            import shutil
+            _discard_directory(self.repo_path)
 
-            shutil.rmtree(self.repo_path)
+        base_args = ["clone"]
+        if filter_spec:
+            base_args.append(f"--filter={filter_spec}")
 
         # For multi-branch analysis, do a full clone to get all branches
-        if depth is None or depth <= 0:
-            args = ["clone", url, str(self.repo_path)]
-        else:
-            args = ["clone", "--depth", str(depth), url, str(self.repo_path)]
+        shallow = depth is not None and depth > 0
+        depth_args = ["--depth", str(depth)] if shallow else []
+        args = base_args + depth_args + [url, str(self.repo_path)]
 
         try:
-            result = subprocess.run(
-                ["git"] + args, capture_output=True, text=True, check=True, timeout=300
-            )
+            if shallow and since_days:
+                # A week of slack covers merges whose parents predate the window
+                since_args = [f"--shallow-since={since_days + 7} days ago"]
+                try:
+                    subprocess.run(
+                        ["git"] + base_args + since_args + [url, str(self.repo_path)],
+                        capture_output=True, text=True, check=True, timeout=300
+                    )
+                except subprocess.CalledProcessError as e:
+                    logger.warning(
+                        f"Shallow-since clone failed, falling back to --depth {depth}: {e.stderr}"
+                    )
+                    if self.repo_path.exists():
+                        _discard_directory(self.repo_path)
+                    subprocess.run(
+                        ["git"] + args, capture_output=True, text=True, check=True, timeout=300
+                    )
+            else:
+                subprocess.run(
+                    ["git"] + args, capture_output=True, text=True, check=True, timeout=300
+                )
+            self._last_fetch = time.monotonic()
             return ToolResponse.success_response(
                 {
                     "message": f"Successfully cloned {url}",
                     "path": str(self.repo_path),
                     "depth": depth,
+                    "filter": filter_spec,
                 }
             )
         except subprocess.TimeoutExpired as e:
@@ -142,6 +551,74 @@ class GitTool:
             error_msg = f"Unexpected error cloning {url}: {str(e)}"
             return ToolResponse.error_response(error_msg)
 
+    def incremental_update(
+        self,
+        url: str,
+        depth: int = 200,
+        filter_spec: Optional[str] = None,
+        since_days: Optional[int] = None,
+    ) -> ToolResponse:
+        """Bring an existing clone of ``url`` up to date, cloning only if needed.
+
+        A re-run against the same repository then transfers only new commits
+        instead of downloading the whole pack again. An existing full clone is
+        never made shallow, and a shallow one is deepened when full history
+        (depth 0 or None) is requested.
+
+        Args:
+            url: Repository URL
+            depth: Fetch depth for shallow history (use None or 0 for full history)
+            filter_spec: Partial clone filter used if a fresh clone is needed
+            since_days: Analysis window in days, bounds shallow history by date
+
+        Returns:
+            ToolResponse indicating success or failure; ``incremental`` in the
+            data tells whether the existing clone was reused
+        """
+        if (self.repo_path / ".git").is_dir():
+            origin = self._run_git_command(["config", "--get", "remote.origin.url"])
+            if origin.success and origin.data == url:
+                self._clear_caches()
+                shallow = depth is not None and depth > 0
+                is_shallow = self._run_git_command(["rev-parse", "--is-shallow-repository"])
+                repo_shallow = is_shallow.success and is_shallow.data == "true"
+                fetch_args = ["fetch", "--prune", "origin"]
+                if not shallow:
+                    # Full history requested: deepen a clone an earlier run left shallow
+                    response = self._run_git_command(
+                        fetch_args + ["--unshallow"] if repo_shallow else fetch_args
+                    )
+                elif not repo_shallow:
+                    # Keep a full clone full, so a later full-history run needs no refetch
+                    response = self._run_git_command(fetch_args)
+                elif since_days:
+                    response = self._run_git_command(
+                        fetch_args + [f"--shallow-since={since_days + 7} days ago"]
+                    )
+                    if not response.success:
+                        response = self._run_git_command(fetch_args + ["--depth", str(depth)])
+                else:
+                    response = self._run_git_command(fetch_args + ["--depth", str(depth)])
+
+                if response.success:
+                    self._last_fetch = time.monotonic()
+                    return ToolResponse.success_response(
+                        {
+                            "message": f"Updated existing clone of {url}",
+                            "path": str(self.repo_path),
+                            "depth": depth,
+                            "incremental": True,
+                        }
+                    )
+                logger.warning(
+                    f"Incremental fetch failed, re-cloning {url}: {response.error}"
+                )
+
+        response = self.clone(url, depth=depth, filter_spec=filter_spec, since_days=since_days)
+        if response.success and response.data is not None:
+            response.data["incremental"] = False
+        return response
+
     def fetch(self, branch: Optional[str] = None) -> ToolResponse:
         """Fetch latest changes from remote and checkout branch if specified.
 
@@ -153,9 +630,19 @@ class GitTool:
         """
         if not self.repo_path.exists():
             return ToolResponse.error_response("Repository path does not exist")
+        self._walked_merges = {}
 
-        # First fetch all branches (including remote branches not locally tracked)
-        response = self._run_git_command(["fetch", "--all"])
+        # First fetch all branches (including remote branches not locally tracked),
+        # unless a clone or fetch moments ago already did
+        fresh = (
+            self._last_fetch is not None
+            and time.monotonic() - self._last_fetch < FETCH_TTL_SECONDS
+        )
+        response = (
+            ToolResponse.success_response("")
+            if fresh
+            else self._run_git_command(["fetch", "--all"])
+        )
         if not response.success:
             # Try alternative fetch strategies for corrupted repositories
             logger.warning(
@@ -180,9 +667,24 @@ class GitTool:
                         "Could not unshallow repository, continuing with shallow clone"
                     )
                 response = shallow_response
+        if not fresh:
+            self._last_fetch = time.monotonic()
 
         # If a specific branch is requested, ensure it's available locally
         if branch:
+            # One command creates or resets the local branch at the fetched remote
+            # tip and checks it out; the steps below only run if origin lacks it
+            sync_response = self._run_git_command(
+                ["checkout", "-B", branch, f"origin/{branch}"]
+            )
+            if sync_response.success:
+                return ToolResponse.success_response(
+                    {"message": "Successfully fetched from remote", "branch": branch}
+                )
+            logger.warning(
+                f"Could not check out '{branch}' at origin/{branch}: {sync_response.error}"
+            )
+
             # Check if branch exists locally
             local_check = self._run_git_command(["rev-parse", "--verify", branch])
 
@@ -194,34 +696,25 @@ class GitTool:
                 if not create_response.success:
                     return create_response
             else:
-                # Branch exists locally, just checkout and pull
+                # Branch exists locally, just checkout and move it to the remote tip
                 checkout_response = self._run_git_command(["checkout", branch])
                 if not checkout_response.success:
                     return checkout_response
 
-                # Configure pull strategy to handle divergent branches
-                config_response = self._run_git_command(
-                    ["config", "pull.rebase", "false"]
-                )
-                if not config_response.success:
-                    logger.warning(f"Could not configure pull strategy: {config_response.data}")
-                
-                # Pull with merge strategy to handle divergent branches
-                pull_response = self._run_git_command(
-                    ["pull", "origin", branch]
+                # The fetch above already has origin's commits, so a pull would
+                # only repeat it before merging; the clone is read-only anyway
+                reset_response = self._run_git_command(
+                    ["reset", "--hard", f"origin/{branch}"]
                 )
-                if not pull_response.success:
-                    # If pull fails due to divergent branches, try reset to remote
+                if not reset_response.success:
                     logger.warning(
-                        f"Pull failed, trying reset to remote: {pull_response.data}"
-                    )
-                    reset_response = self._run_git_command(
-                        ["reset", "--hard", f"origin/{branch}"]
+                        f"Reset to remote failed, trying pull: {reset_response.data}"
                     )
-                    if not reset_response.success:
-                        # If reset also fails, try force pull with merge
+                    pull_response = self._run_git_command(["pull", "origin", branch])
+                    if not pull_response.success:
+                        # If pull also fails, try force pull with merge
                         logger.warning(
-                            f"Reset failed, trying force pull: {reset_response.data}"
+                            f"Pull failed, trying force pull: {pull_response.data}"
                         )
                         force_pull_response = self._run_git_command(
                             [
@@ -263,7 +756,7 @@ class GitTool:
                         else:
                             logger.info(f"Force pull successful for branch '{branch}'")
                     else:
-                        logger.info(f"Reset to remote successful for branch '{branch}'")
+                        logger.info(f"Pull successful for branch '{branch}'")
 
         return ToolResponse.success_response(
             {"message": "Successfully fetched from remote", "branch": branch}
@@ -305,45 +798,65 @@ class GitTool:
             {"message": f"Successfully checked out branch '{branch}'", "branch": branch}
         )
 
-    def log_merges(self, branch: str, since_days: int) -> ToolResponse:
+    def log_merges(
+        self,
+        branch: str,
+        since_days: int,
+        fields: frozenset = FULL_MERGE_FIELDS,
+        first_parent: bool = False,
+    ) -> ToolResponse:
         """Get merge commits from the specified branch and time period.
 
         Args:
             branch: Branch to analyze
             since_days: Number of days to look back
+            fields: MergeCommit fields to return; git is only asked for these,
+                so callers that need e.g. just the author read less output
+            first_parent: Only follow the branch's own history, skipping merges
+                made inside feature branches before they landed
 
         Returns:
-            ToolResponse with list of MergeCommit data
+            ToolResponse with list of MergeCommit data, limited to ``fields``
         """
         if not self.repo_path.exists():
             return ToolResponse.error_response("Repository path does not exist")
 
-        # Format for git log: hash|timestamp|message|parents|author
-        format_str = "%H|%ct|%s|%P|%an"
+        unknown = set(fields) - FULL_MERGE_FIELDS
+        if unknown or not fields:
+            return ToolResponse.error_response(
+                f"Unknown merge commit fields: {', '.join(sorted(unknown)) or 'none requested'}"
+            )
+        walked = None if first_parent else self._walked_merges.get((branch, since_days))
+        if walked is not None:
+            # log_all_commits already walked this window; its merges are the answer
+            return ToolResponse.success_response(
+                [self._walked_merge_dict(row, fields) for row in walked]
+            )
+        if fields != FULL_MERGE_FIELDS:
+            return self._log_merge_fields(branch, since_days, fields, first_parent)
+
+        # Format for git log: hash, timestamp, message, parents, author separated
+        # by NUL, which unlike "|" cannot appear in commit subjects or names
+        format_str = "%H%x00%ct%x00%s%x00%P%x00%an"
         args = [
             "log",
             f"--since={since_days} days ago",
             "--merges",
+            *(["--first-parent"] if first_parent else []),
             f"--format={format_str}",
             branch,  # Use local branch instead of origin/{branch}
         ]
 
-        response = self._run_git_command(args)
-        if not response.success:
-            return response
-
         merge_commits = []
-        if response.data:
-            for line in response.data.split("\n"):
-                if line.strip():
-                    parts = line.split("|", 4)
+        try:
+            for line in self._run_git_command_streaming(args):
+                if line:
+                    parts = line.split("\0", 4)
                     if len(parts) == 5:
                         hash_val, timestamp_str, message, parents_str, author = parts
 
                         # Convert timestamp
-                        timestamp = datetime.fromtimestamp(
-                            int(timestamp_str), tz=timezone.utc
-                        )
+                        timestamp = _ts_to_dt(int(timestamp_str))
 
                         # Parse parents
                         parents = parents_str.split() if parents_str else []
@@ -356,9 +869,170 @@ class GitTool:
                             author=author,
                         )
                         merge_commits.append(merge_commit.to_dict())
+        except subprocess.CalledProcessError as e:
+            return ToolResponse.error_response(
+                f"Git command failed: {' '.join(e.cmd)}\nError: {e.stderr}"
+            )
+        except subprocess.TimeoutExpired as e:
+            return ToolResponse.error_response(
+                f"Git command timed out after {e.timeout} seconds: {' '.join(e.cmd)}"
+            )
+        except OSError as e:
+            return ToolResponse.error_response(
+                f"Unexpected error running git command: git {' '.join(args)}\nError: {str(e)}"
+            )
+
+        return ToolResponse.success_response(merge_commits)
+
+    @staticmethod
+    def _walked_merge_dict(row: Tuple[str, int, str, str, str], fields: frozenset) -> dict:
+        """Build a log_merges entry, limited to ``fields``, from a remembered row."""
+        hash_val, timestamp, message, parents_str, author = row
+        merge_commit = MergeCommit(
+            hash=hash_val,
+            timestamp=_ts_to_dt(timestamp),
+            message=message,
+            parents=parents_str.split(),
+            author=author,
+        ).to_dict()
+        if fields == FULL_MERGE_FIELDS:
+            return merge_commit
+        return {name: merge_commit[name] for name in MERGE_FIELD_FORMATS if name in fields}
+
+    def _log_merge_fields(
+        self, branch: str, since_days: int, fields: frozenset, first_parent: bool = False
+    ) -> ToolResponse:
+        """Get merge commits with only the requested fields, see ``log_merges``."""
+        names = [name for name in MERGE_FIELD_FORMATS if name in fields]
+        format_str = "%x00".join(MERGE_FIELD_FORMATS[name] for name in names)
+        args = [
+            "log",
+            f"--since={since_days} days ago",
+            "--merges",
+            *(["--first-parent"] if first_parent else []),
+            f"--format={format_str}",
+            branch,
+        ]
+
+        merge_commits = []
+        try:
+            for line in self._run_git_command_streaming(args):
+                if line:
+                    parts = line.split("\0", len(names) - 1)
+                    if len(parts) == len(names):
+                        merge_commit: Dict[str, Any] = dict(zip(names, parts))
+                        if "timestamp" in merge_commit:
+                            merge_commit["timestamp"] = _ts_to_dt(
+                                int(merge_commit["timestamp"])
+                            ).isoformat()
+                        if "parents" in merge_commit:
+                            merge_commit["parents"] = merge_commit["parents"].split()
+                        merge_commits.append(merge_commit)
+        except subprocess.CalledProcessError as e:
+            return ToolResponse.error_response(
+                f"Git command failed: {' '.join(e.cmd)}\nError: {e.stderr}"
+            )
+        except subprocess.TimeoutExpired as e:
+            return ToolResponse.error_response(
+                f"Git command timed out after {e.timeout} seconds: {' '.join(e.cmd)}"
+            )
+        except OSError as e:
+            return ToolResponse.error_response(
+                f"Unexpected error running git command: git {' '.join(args)}\nError: {str(e)}"
+            )
 
         return ToolResponse.success_response(merge_commits)
 
+    def log_merges_with_stats(
+        self, branch: str, since_days: int, first_parent: bool = False
+    ) -> ToolResponse:
+        """Get merge commits together with their diff statistics in one git call.
+
+        Equivalent to calling ``log_merges`` followed by ``diff_stats`` for every
+        merge, but metadata and numstat rows are streamed by a single
+        ``git log --merges --numstat`` process instead of one process per merge.
+
+        Args:
+            branch: Branch to analyze
+            since_days: Number of days to look back
+            first_parent: Only follow the branch's own history, see ``log_merges``
+
+        Returns:
+            ToolResponse with list of {"commit": MergeCommit, "diff_stats": DiffStats} data
+        """
+        if not self.repo_path.exists():
+            return ToolResponse.error_response("Repository path does not exist")
+
+        # Each commit starts with a sentinel header line, followed by its numstat rows
+        format_str = "__COMMIT__%x00%H%x00%ct%x00%s%x00%P%x00%an"
+        args = [
+            "log",
+            f"--since={since_days} days ago",
+            "--merges",
+            *(["--first-parent"] if first_parent else []),
+            "--numstat",
+            "--diff-merges=first-parent",  # Same diff `git show` reports for a merge
+            f"--format={format_str}",
+            branch,
+        ]
+
+        results = []
+        header = None
+        numstat_lines: List[str] = []
+        try:
+            for line in self._run_git_command_streaming(args):
+                if line.startswith("__COMMIT__\0"):
+                    if header is not None:
+                        results.append(self._merge_with_stats_entry(header, numstat_lines))
+                    header = line[len("__COMMIT__\0"):].split("\0", 4)
+                    numstat_lines = []
+                elif line:
+                    numstat_lines.append(line)
+            if header is not None:
+                results.append(self._merge_with_stats_entry(header, numstat_lines))
+        except subprocess.CalledProcessError as e:
+            return ToolResponse.error_response(
+                f"Git command failed: {' '.join(e.cmd)}\nError: {e.stderr}"
+            )
+        except subprocess.TimeoutExpired as e:
+            return ToolResponse.error_response(
+                f"Git command timed out after {e.timeout} seconds: {' '.join(e.cmd)}"
+            )
+        except OSError as e:
+            return ToolResponse.error_response(
+                f"Unexpected error running git command: git {' '.join(args)}\nError: {str(e)}"
+            )
+
+        return ToolResponse.success_response([entry for entry in results if entry])
+
+    def _merge_with_stats_entry(self, header: List[str], numstat_lines: List[str]) -> dict:
+        """Build a merge commit / diff stats pair from one ``git log`` record.
+
+        Args:
+            header: NUL-split header fields (hash, timestamp, message, parents, author)
+            numstat_lines: Numstat rows that followed the header
+
+        Returns:
+            Dictionary with "commit" and "diff_stats" entries, or {} if malformed
+        """
+        if len(header) != 5:
+            return {}
+        hash_val, timestamp_str, message, parents_str, author = header
+        self._store_numstat(hash_val, numstat_lines)
+
+        merge_commit = MergeCommit(
+            hash=hash_val,
+            timestamp=_ts_to_dt(int(timestamp_str)),
+            message=message,
+            parents=parents_str.split() if parents_str else [],
+            author=author,
+        )
+
+        return {
+            "commit": merge_commit.to_dict(),
+            "diff_stats": self._diff_stats_from_numstat(numstat_lines),
+        }
+
     def diff_stats(self, commit_hash: str) -> ToolResponse:
         """Get diff statistics for a specific commit.
 
@@ -371,20 +1045,20 @@ class GitTool:
         if not self.repo_path.exists():
             return ToolResponse.error_response("Repository path does not exist")
 
-        # Get numstat for the commit
-        args = ["show", "--numstat", "--format=", commit_hash]
-        response = self._run_git_command(args)
-
+        response = self._commit_numstat(commit_hash)
         if not response.success:
             return response
 
+        return ToolResponse.success_response(self._diff_stats_from_numstat(response.data or []))
+
+    def _diff_stats_from_numstat(self, lines: Iterable[str]) -> dict:
+        """Sum numstat lines into DiffStats data, skipping excluded files."""
         files_changed = 0
         insertions = 0
         deletions = 0
 
-        if response.data:
-            for line in response.data.split("\n"):
-                line = line.strip()
+        if lines:
+            for line in lines:
                 if line and not line.startswith("commit"):
                     parts = line.split("\t")
                     if len(parts) >= 3:
@@ -392,7 +1066,7 @@ class GitTool:
                             # Handle binary files (marked with '-')
                             add_str, del_str, filename = parts[0], parts[1], parts[2]
                             
-                            # Skip excluded files (projen, build artifacts, etc.)
+                            # Safety net: excluded files are already filtered by pathspec
                             if self._should_exclude_file(filename):
                                 continue
                             
@@ -411,7 +1085,7 @@ class GitTool:
             total_changes=insertions + deletions,
         )
 
-        return ToolResponse.success_response(diff_stats.to_dict())
+        return diff_stats.to_dict()
 
     def remote_branches(self) -> ToolResponse:
         """Get information about all remote branches.
@@ -423,64 +1097,74 @@ class GitTool:
             return ToolResponse.error_response("Repository path does not exist")
 
         # Get remote URL from git config
-        remote_url_response = self._run_git_command(
-            ["config", "--get", "remote.origin.url"]
-        )
-        if not remote_url_response.success:
-            return ToolResponse.error_response(
-                "Could not get remote URL from git config"
+        if self._remote_url is None:
+            remote_url_response = self._run_git_command(
+                ["config", "--get", "remote.origin.url"]
             )
+            if not remote_url_response.success:
+                return ToolResponse.error_response(
+                    "Could not get remote URL from git config"
+                )
+            self._remote_url = str(remote_url_response.data)
 
-        remote_url = remote_url_response.data
+        remote_url = self._remote_url
 
-        # Use ls-remote to get all branch heads from remote
-        ls_remote_response = self._run_git_command(["ls-remote", "--heads", remote_url])
-        if not ls_remote_response.success:
-            return ToolResponse.error_response(
-                f"Failed to list remote branches: {ls_remote_response.error}"
-            )
+        # Use ls-remote to get all branch heads from remote, reusing a recent answer
+        now = time.monotonic()
+        if (
+            self._ls_remote_heads is not None
+            and now - self._ls_remote_heads[0] < LS_REMOTE_TTL_SECONDS
+        ):
+            ls_remote_response = ToolResponse.success_response(self._ls_remote_heads[1])
+        else:
+            ls_remote_response = self._run_git_command(["ls-remote", "--heads", remote_url])
+            if not ls_remote_response.success:
+                return ToolResponse.error_response(
+                    f"Failed to list remote branches: {ls_remote_response.error}"
+                )
+            self._ls_remote_heads = (now, str(ls_remote_response.data))
 
         # Parse ls-remote output to get branch names
         remote_branches: List[str] = []
         if ls_remote_response.data:
-            lines = ls_remote_response.data.split("\n")
-            for line in lines:
-                line = line.strip()
+            for line in ls_remote_response.data.splitlines():
                 if line:
                     parts = line.split("\t")
                     if len(parts) == 2 and parts[1] and parts[1].startswith("refs/heads/"):
                         branch_name = parts[1].replace("refs/heads/", "")
                         remote_branches.append(branch_name)
 
-        # Now fetch each remote branch to make it available locally
-        for branch in remote_branches:
-            fetch_branch_response = self._run_git_command(["fetch", "origin", branch])
-            if not fetch_branch_response.success:
-                print(
-                    f"Warning: Failed to fetch branch {branch}: {fetch_branch_response.error}"
-                )
+        # Now fetch the remote branches to make them available locally
+        self.fetch_branches(remote_branches)
+
+        return self._branch_refs()
 
+    def _branch_refs(self) -> ToolResponse:
+        """List local and origin branches, newest first, one entry per name.
+
+        Returns:
+            ToolResponse with list of BranchInfo data
+        """
         # Get all branches (local and remote) with last commit info
-        # Format: hash|timestamp|branch_name
+        # Format: hash, timestamp, branch_name separated by NUL; symbolic refs
+        # such as origin/HEAD come out as empty lines
         args = [
             "for-each-ref",
-            "--format=%(objectname)|%(committerdate:unix)|%(refname:short)",
+            "--sort=-committerdate",
+            # NUL-separated, since "|" is legal in branch names
+            "--format=%(if)%(symref)%(then)%(else)"
+            "%(objectname)%00%(committerdate:unix)%00%(refname:short)%(end)",
             "refs/heads",  # Local branches
             "refs/remotes/origin",  # Remote branches
         ]
 
-        response = self._run_git_command(args)
-        if not response.success:
-            return response
-
         branches = []
         seen_branches = set()  # Track unique branch names
 
-        if response.data:
-            for line in response.data.split("\n"):
-                line = line.strip()
-                if line and not line.endswith("/HEAD"):
-                    parts = line.split("|", 2)
+        try:
+            for line in self._run_git_command_streaming(args):
+                if line:
+                    parts = line.split("\0", 2)
                     if len(parts) == 3:
                         hash_val, timestamp_str, ref_name = parts
 
@@ -489,14 +1173,13 @@ class GitTool:
                         if branch_name.startswith("origin/"):
                             branch_name = branch_name.replace("origin/", "", 1)
 
-                        # Skip duplicates (prefer local branch info over remote)
+                        # Skip duplicates; refs are newest first, so the most
+                        # recent of the local and remote tip is kept
                         if branch_name not in seen_branches and branch_name != "HEAD":
                             seen_branches.add(branch_name)
 
                             # Convert timestamp
-                            timestamp = datetime.fromtimestamp(
-                                int(timestamp_str), tz=timezone.utc
-                            )
+                            timestamp = _ts_to_dt(int(timestamp_str))
 
                             branch_info = BranchInfo(
                                 name=branch_name,
@@ -504,45 +1187,125 @@ class GitTool:
                                 last_commit_timestamp=timestamp,
                             )
                             branches.append(branch_info.to_dict())
+        except subprocess.CalledProcessError as e:
+            return ToolResponse.error_response(
+                f"Git command failed: {' '.join(e.cmd)}\nError: {e.stderr}"
+            )
+        except subprocess.TimeoutExpired as e:
+            return ToolResponse.error_response(
+                f"Git command timed out after {e.timeout} seconds: {' '.join(e.cmd)}"
+            )
+        except OSError as e:
+            return ToolResponse.error_response(
+                f"Unexpected error running git command: git {' '.join(args)}\nError: {str(e)}"
+            )
 
         return ToolResponse.success_response(branches)
 
+    def fetch_branches(self, branches: List[str], batch_size: int = 100) -> ToolResponse:
+        """Fetch several branches from origin in parallel batches.
+
+        git accepts several refspecs per fetch and negotiates them in one round
+        trip, so branches are fetched in batches rather than one process per
+        branch. Batches keep the argv length bounded on repos with many
+        branches and run concurrently on a thread pool.
+
+        Args:
+            branches: Branch names to fetch
+            batch_size: Maximum number of branches per git fetch
+
+        Returns:
+            ToolResponse with the list of branches that could not be fetched
+        """
+        batches = [
+            branches[i:i + batch_size] for i in range(0, len(branches), batch_size)
+        ]
+        failed: List[str] = []
+        if not batches:
+            return ToolResponse.success_response(failed)
+        self._walked_merges = {}
+
+        def fetch_batch(batch: List[str]) -> ToolResponse:
+            return self._run_git_command(["fetch", "origin"] + batch)
+
+        with ThreadPoolExecutor(max_workers=min(MAX_GIT_WORKERS, len(branches))) as executor:
+            results = list(zip(batches, executor.map(fetch_batch, batches)))
+
+            # One bad refspec fails its whole batch, so retry those branches singly
+            retry = [
+                [branch]
+                for batch, fetch_response in results
+                if not fetch_response.success and len(batch) > 1
+                for branch in batch
+            ]
+            results = [
+                (batch, fetch_response) for batch, fetch_response in results
+                if fetch_response.success or len(batch) == 1
+            ]
+            results.extend(zip(retry, executor.map(fetch_batch, retry)))
+
+        for batch, fetch_response in results:
+            if not fetch_response.success:
+                logger.warning(
+                    f"Failed to fetch branches {', '.join(batch)}: {fetch_response.error}"
+                )
+                failed.extend(batch)
+
+        return ToolResponse.success_response(failed)
+
     def get_default_branch(self) -> ToolResponse:
         """Get the default branch of the repository.
 
+        The branch is looked up once per GitTool instance and then reused.
+
         Returns:
             ToolResponse with the default branch name
         """
         if not self.repo_path.exists():
             return ToolResponse.error_response("Repository path does not exist")
 
+        if self._default_branch is None:
+            self._default_branch = self._detect_default_branch()
+            if self._default_branch is None:
+                return ToolResponse.error_response("Could not determine default branch")
+
+        return ToolResponse.success_response(self._default_branch)
+
+    def _detect_default_branch(self) -> Optional[str]:
+        """Ask git for the default branch.
+
+        Returns:
+            The default branch name, or None if it could not be determined
+        """
         # Get the default branch from remote
         response = self._run_git_command(["symbolic-ref", "refs/remotes/origin/HEAD"])
         if response.success and response.data:
             # Output format: refs/remotes/origin/main
-            default_branch = response.data.split("/")[-1]
-            return ToolResponse.success_response(default_branch)
+            return str(response.data).split("/")[-1]
 
         # Fallback: try to get the current branch
         response = self._run_git_command(["branch", "--show-current"])
         if response.success and response.data:
-            return ToolResponse.success_response(response.data)
+            return str(response.data)
 
         # Final fallback: assume 'main' or 'master'
         # Check which one exists
         main_check = self._run_git_command(["rev-parse", "--verify", "origin/main"])
         if main_check.success:
-            return ToolResponse.success_response("main")
+            return "main"
 
         master_check = self._run_git_command(["rev-parse", "--verify", "origin/master"])
         if master_check.success:
-            return ToolResponse.success_response("master")
+            return "master"
 
-        return ToolResponse.error_response("Could not determine default branch")
+        return None
 
     def log_all_commits(self, branch: str, since_days: int) -> ToolResponse:
         """Get all commits (not just merges) from the specified branch and time period.
 
+        Merges seen on the walk are remembered, so a following ``log_merges``
+        for the same branch and window needs no second walk.
+
         Args:
             branch: Branch to analyze
             since_days: Number of days to look back
@@ -553,8 +1316,9 @@ class GitTool:
         if not self.repo_path.exists():
             return ToolResponse.error_response("Repository path does not exist")
 
-        # Format for git log: hash|timestamp|message|author_name|author_email
-        format_str = "%H|%ct|%s|%an|%ae"
+        # Format for git log: hash, timestamp, message, author_name, author_email,
+        # parents separated by NUL so "|" in subjects or names cannot shift fields
+        format_str = "%H%x00%ct%x00%s%x00%an%x00%ae%x00%P"
         args = [
             "log",
             f"--since={since_days} days ago",
@@ -562,38 +1326,53 @@ class GitTool:
             branch,
         ]
 
-        response = self._run_git_command(args)
-        if not response.success:
-            return response
-
         commits = []
-        if response.data:
-            for line in response.data.split("\n"):
-                if line.strip():
-                    parts = line.split("|", 4)
-                    if len(parts) == 5:
-                        hash_val, timestamp_str, message, author_name, author_email = (
-                            parts
-                        )
-
-                        # Convert timestamp
+        merges = []
+        try:
+            for line in self._run_git_command_streaming(args):
+                if line:
+                    parts = line.split("\0", 5)
+                    if len(parts) == 6:
+                        (
+                            hash_val, timestamp_str, message, author_name, author_email,
+                            parents_str,
+                        ) = parts
+
+                        # Convert timestamp straight to its ISO string
                         try:
-                            timestamp = datetime.fromtimestamp(
-                                int(timestamp_str), tz=timezone.utc
-                            )
+                            timestamp_int = int(timestamp_str)
+                            timestamp = _ts_to_iso(timestamp_int)
                         except (ValueError, OSError):
                             continue
 
+                        if " " in parents_str:
+                            merges.append(
+                                (hash_val, timestamp_int, message, parents_str, author_name)
+                            )
+
                         commits.append(
                             {
                                 "hash": hash_val,
-                                "timestamp": timestamp.isoformat(),
+                                "timestamp": timestamp,
                                 "message": message,
                                 "author_name": author_name,
                                 "author_email": author_email,
                             }
                         )
+        except subprocess.CalledProcessError as e:
+            return ToolResponse.error_response(
+                f"Git command failed: {' '.join(e.cmd)}\nError: {e.stderr}"
+            )
+        except subprocess.TimeoutExpired as e:
+            return ToolResponse.error_response(
+                f"Git command timed out after {e.timeout} seconds: {' '.join(e.cmd)}"
+            )
+        except OSError as e:
+            return ToolResponse.error_response(
+                f"Unexpected error running git command: git log {branch}\nError: {str(e)}"
+            )
 
+        self._walked_merges[(branch, since_days)] = merges
         return ToolResponse.success_response(commits)
 
     def get_commit_files(self, commit_hash: str) -> ToolResponse:
@@ -609,23 +1388,24 @@ class GitTool:
             return ToolResponse.error_response("Repository path does not exist")
 
         # Get files changed with stats: additions, deletions, filename
-        args = ["show", "--numstat", "--format=", commit_hash]
-
-        response = self._run_git_command(args)
+        response = self._commit_numstat(commit_hash)
         if not response.success:
             return response
 
+        return ToolResponse.success_response(self._commit_files_from_numstat(response.data or []))
+
+    def _commit_files_from_numstat(self, lines: Iterable[str]) -> List[dict]:
+        """Turn numstat lines into per-file change data, skipping excluded files."""
         file_changes = []
-        if response.data:
-            for line in response.data.split("\n"):
-                line = line.strip()
+        if lines:
+            for line in lines:
                 if line:
                     parts = line.split("\t")
                     if len(parts) >= 3:
                         try:
                             add_str, del_str, filename = parts[0], parts[1], parts[2]
 
-                            # Skip excluded files (projen, build artifacts, etc.)
+                            # Safety net: excluded files are already filtered by pathspec
                             if self._should_exclude_file(filename):
                                 continue
 
@@ -652,7 +1432,77 @@ class GitTool:
                             # Skip lines that can't be parsed
                             continue
 
-        return ToolResponse.success_response(file_changes)
+        return file_changes
+
+    def _map_parallel(
+        self, func: Callable[[str], ToolResponse], keys: List[str]
+    ) -> Dict[str, ToolResponse]:
+        """Call func for each key on a thread pool, keyed by input in input order."""
+        keys = list(dict.fromkeys(keys))
+        if len(keys) <= 1:
+            return {key: func(key) for key in keys}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_GIT_WORKERS, len(keys))) as executor:
+            return dict(zip(keys, executor.map(func, keys)))
+
+    def _numstat_batch(
+        self,
+        commit_hashes: List[str],
+        parse: Callable[[List[str]], object],
+        fallback: Callable[[str], ToolResponse],
+    ) -> Dict[str, ToolResponse]:
+        """Parse numstat for several commits through a diff-tree worker pool.
+
+        At most DIFF_TREE_MAX_PROCS git processes are started for the whole
+        batch. Commits a worker cannot serve go through ``fallback``.
+        """
+        commit_hashes = list(dict.fromkeys(commit_hashes))
+        uncached = [h for h in commit_hashes if self._cached_numstat(h) is None]
+        if len(uncached) <= 1 or not self.repo_path.exists():
+            return {commit_hash: fallback(commit_hash) for commit_hash in commit_hashes}
+
+        max_procs = min(DIFF_TREE_MAX_PROCS, len(commit_hashes))
+        with GitDiffTreeWorkerPool(self.repo_path, max_procs=max_procs) as pool:
+
+            def run(commit_hash: str) -> ToolResponse:
+                cached = self._cached_numstat(commit_hash)
+                if cached is not None:
+                    return ToolResponse.success_response(parse(cached))
+                try:
+                    lines = pool.numstat(commit_hash)
+                    self._store_numstat(commit_hash, lines)
+                    return ToolResponse.success_response(parse(lines))
+                except (OSError, ValueError) as e:
+                    logger.debug(f"diff-tree worker failed for {commit_hash}: {e}")
+                    return fallback(commit_hash)
+
+            return self._map_parallel(run, commit_hashes)
+
+    def diff_stats_batch(self, commit_hashes: List[str]) -> Dict[str, ToolResponse]:
+        """Get ``diff_stats`` for several commits in parallel.
+
+        Args:
+            commit_hashes: Hashes of the commits to analyze
+
+        Returns:
+            Dict mapping each commit hash to its diff_stats ToolResponse
+        """
+        return self._numstat_batch(
+            commit_hashes, self._diff_stats_from_numstat, self.diff_stats
+        )
+
+    def get_commit_files_batch(self, commit_hashes: List[str]) -> Dict[str, ToolResponse]:
+        """Get ``get_commit_files`` for several commits in parallel.
+
+        Args:
+            commit_hashes: Hashes of the commits to analyze
+
+        Returns:
+            Dict mapping each commit hash to its get_commit_files ToolResponse
+        """
+        return self._numstat_batch(
+            commit_hashes, self._commit_files_from_numstat, self.get_commit_files
+        )
 
     def get_committers(self, since_days: int, branch: Optional[str] = None) -> ToolResponse:
         """Get the names and email addresses of committers within a given period.
@@ -667,22 +1517,23 @@ class GitTool:
         if not self.repo_path.exists():
             return ToolResponse.error_response("Repository path does not exist")
 
-        # Format for git log: author_email
-        format_str = "%ae"
+        # shortlog groups commits per author inside git, so only one line per
+        # author crosses the pipe: "   <count>\t<name> <<email>>"
         args = [
-            "log",
+            "shortlog",
+            "-sne",
             f"--since={since_days} days ago",
-            f"--format={format_str}",
         ]
+        revision = "HEAD"
 
-        # If specific branch is provided, add it to the git log command
+        # If specific branch is provided, add it to the git shortlog command
         if branch:
             # Check if branch exists first
             check_response = self._run_git_command(
                 ["show-ref", "--verify", "--quiet", f"refs/heads/{branch}"]
             )
             if check_response.success:
-                args.append(branch)
+                revision = branch
                 logger.debug(f"Getting committers from branch: {branch}")
             else:
                 # Try as remote branch
@@ -690,21 +1541,28 @@ class GitTool:
                     ["show-ref", "--verify", "--quiet", f"refs/remotes/origin/{branch}"]
                 )
                 if remote_check.success:
-                    args.append(f"origin/{branch}")
+                    revision = f"origin/{branch}"
                     logger.debug(
                         f"Getting committers from remote branch: origin/{branch}"
                     )
                 else:
                     logger.warning(f"Branch {branch} not found, using current branch")
 
+        # Always pass a revision: without one, shortlog reads a log from stdin
+        args.append(revision)
+
         response = self._run_git_command(args)
         if not response.success:
             return response
 
         if response.data:
-            # Split by newline and filter out empty strings
-            emails = set(filter(None, response.data.split("\n")))
-            logger.debug(f"Found {len(emails)} unique committers: {list(emails)}")
-            return ToolResponse.success_response(list(emails))
+            # The same email can appear under several author names, so dedupe
+            emails = list(dict.fromkeys(
+                match.group(1)
+                for match in map(_SHORTLOG_EMAIL_RE.match, response.data.splitlines())
+                if match and match.group(1)
+            ))
+            logger.debug(f"Found {len(emails)} unique committers: {emails}")
+            return ToolResponse.success_response(emails)
 
         return ToolResponse.success_response([])
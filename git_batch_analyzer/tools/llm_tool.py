@@ -1,12 +1,500 @@
 """LLM integration tool for generating insights and summaries."""
 
+import hashlib
+import json
+import logging
 import os
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from collections import ChainMap, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from langchain_openai import ChatOpenAI
+import httpx
+import tiktoken
 from langchain.schema import HumanMessage
+from langchain_openai import ChatOpenAI
+from openai import DefaultHttpxClient
 
 from ..types import ToolResponse
+from .cache_tool import CacheTool
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on LLM requests in flight at once from one LLMTool. Requests
+# spend their time waiting on the provider, so threads overlap the round trips.
+MAX_CONCURRENT_REQUESTS = 8
+
+# Connection pool shared by every LLMTool, so TLS connections to the provider
+# are reused across tools and threads instead of being opened per client
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+# Upper bound on LLM requests in flight across the whole process. Repositories,
+# analysis nodes and batch calls each run concurrently, so per-call limits
+# alone multiply; this keeps the total within the pool's keep-alive connections.
+MAX_INFLIGHT_REQUESTS = 32
+_request_slots = threading.BoundedSemaphore(MAX_INFLIGHT_REQUESTS)
+
+# Rate limits and connection errors are retried with backoff by the OpenAI
+# client; after this many failed calls in a row further calls fail fast
+LLM_MAX_RETRIES = 5
+CIRCUIT_FAILURE_THRESHOLD = 10
+CIRCUIT_RESET_SECONDS = 30
+
+# Responses kept in cache_dir are reused for this long; the data they were
+# built from is re-fetched on every run, so older answers are rarely hit
+RESPONSE_CACHE_TTL_SECONDS = 7 * 86400
+
+# Most recent weeks of aggregated data described to the trends prompt
+MAX_TREND_WEEKS = 52
+
+# Executive summaries are asked for in 120 words; this allows a small buffer
+SUMMARY_MAX_WORDS = 130
+
+# Response token caps for prompts that declare a length: a 120-word summary
+# and up to three 50-word recommendations per developer, with headroom
+SUMMARY_MAX_TOKENS = 250
+RECOMMENDATIONS_MAX_TOKENS = 400
+
+# Developers described per request by generate_user_recommendations_grouped
+RECOMMENDATION_USERS_PER_PROMPT = 8
+
+# Below this many commits there is too little history for useful recommendations
+MIN_COMMITS_FOR_RECOMMENDATIONS = 3
+
+# Answers for inputs too thin to be worth an LLM call
+_NO_PRS_SUMMARY = "No pull requests were merged during the analysis period, so there is no delivery activity to summarize."
+_TOO_FEW_COMMITS_RECOMMENDATIONS = ["Insufficient commit history for personalized recommendations."]
+
+# Source files longer than this are reviewed as their first and last halves
+MAX_REVIEW_FILE_CHARS = 10000
+TRUNCATION_MARKER = "\n... [TRUNCATED] ...\n"
+# Token budget per reviewed file, applied after the cheaper character cut
+MAX_REVIEW_FILE_TOKENS = 3000
+
+# Fragments that only show up in source code, matched against lower-cased text
+_CODE_INDICATORS = tuple(indicator.lower() for indicator in (
+    'def __init__(', 'function main(', 'class extends', 'import sys',
+    'if __name__ == "__main__"', 'return null;', 'console.log(',
+    '#!/usr/bin/', '<?php echo', '<script type=', '<html lang=',
+    'select * from', 'insert into', 'create table if',
+    'drop table if', 'rm -rf /', 'os.system(', 'eval(',
+    'exec(', 'subprocess.call', '${', '<!--', '-->', '{%', '%}',
+    'package.json:', 'requirements.txt:', 'import React'
+))
+
+
+# Lead-in sentences the model puts before its recommendations, lower-cased
+_INTRO_PHRASES = (
+    'based on the provided',
+    'based on the following',
+    'here are',
+    'recommendations to help',
+    'personalized recommendations',
+)
+
+
+# Prompt skeletons, filled with str.format_map so each call only substitutes values.
+# Fixed instructions come first and data last, so repeated calls share a prompt
+# prefix that providers with prompt caching can reuse.
+_EXEC_SUMMARY_PROMPT = """Write a concise executive summary of the development metrics below in exactly 120 words or less. Focus on development velocity, code review efficiency, and overall team productivity trends. Keep it professional and data-driven. Maximum 120 words.
+
+PR Metrics:
+- Total PRs: {total_prs}
+- Lead Time 50th percentile: {lead_time_p50:.1f} hours
+- Lead Time 75th percentile: {lead_time_p75:.1f} hours
+- Change Size 50th percentile: {change_size_p50} lines
+- Change Size 75th percentile: {change_size_p75} lines
+
+Weekly PR Activity:
+{weekly_data}"""
+
+_PR_METRICS_DEFAULTS = {
+    "total_prs": 0,
+    "lead_time_p50": 0,
+    "lead_time_p75": 0,
+    "change_size_p50": 0,
+    "change_size_p75": 0,
+}
+
+_NO_ACTIVITY_TRENDS_PROMPT = """Analyze the development situation where no pull requests (PRs) were created during the analysis period.
+
+Weekly Aggregated Data: No PR activity during the analysis period
+
+Provide insights on:
+1. Development velocity trends (lack of activity)
+2. Team productivity patterns (identifying potential blockers)
+3. Code quality indicators (impact of low activity)
+4. Resource allocation observations (potential causes)
+5. Recommendations for improvement (actionable steps)
+
+Focus on organizational-level patterns and provide actionable insights for teams with low or no development activity. Keep the analysis professional and data-driven."""
+
+_TRENDS_PROMPT = """Analyze the weekly aggregated development data across multiple repositories below and provide organizational insights.
+
+Provide insights on:
+1. Development velocity trends
+2. Team productivity patterns
+3. Code quality indicators
+4. Resource allocation observations
+5. Recommendations for improvement
+
+Focus on organizational-level patterns and trends. Be specific about what the data shows and provide actionable insights. Keep the analysis professional and data-driven.
+
+Weekly Aggregated Data:
+{weekly_aggregated_data}"""
+
+_DEVELOPER_PROFILE = """- Username: {username}
+- Total Commits: {total_commits}
+- Total Merges: {total_merges}
+- Total Changes: {total_changes} lines
+- Work Type Distribution: {work_type_summary}
+- Top Files: {top_files}
+- Message Patterns: {commit_message_patterns}"""
+
+_RECOMMENDATIONS_PROMPT = """Based on the developer statistics below, provide 1-3 personalized recommendations to help improve their coding practices and career development.
+
+Requirements:
+- Provide ONLY the recommendations, no introductory text
+- Each recommendation should be maximum 50 words
+- Focus on improvement or recognition of good practices
+- Base recommendations on the actual data patterns shown
+- Be professional and constructive
+
+Format as a simple list of recommendations, one per line, without numbers or bullets.
+
+Developer Profile:
+""" + _DEVELOPER_PROFILE
+
+# Recommendations for several developers in one request, answered as JSON
+_GROUP_RECOMMENDATIONS_PROMPT = """Based on the developer statistics below, provide 1-3 personalized recommendations for each developer to help improve their coding practices and career development.
+
+Requirements:
+- Each recommendation should be maximum 50 words
+- Focus on improvement or recognition of good practices
+- Base each developer's recommendations on their own data patterns
+- Be professional and constructive
+
+Respond with ONLY a JSON array holding one object per developer, no other text:
+[{"developer": 1, "recommendations": ["first recommendation", "second recommendation"]}]
+"""
+
+_GROUP_DEVELOPER_ENTRY = """
+Developer {index}:
+""" + _DEVELOPER_PROFILE + "\n"
+
+
+# Commit message quality prompt: fixed instructions, then one entry per sampled commit
+_COMMIT_QUALITY_HEADER = """As a senior developer performing code review, analyze how well each commit message describes the actual changes made. Rate the quality of commit messages based on:
+
+**Evaluation Criteria:**
+1. **Descriptiveness**: Does the message clearly explain what was changed?
+2. **Accuracy**: Does the message match the actual files and scope of changes?
+3. **Convention**: Does it follow good commit message practices (imperative mood, proper scope)?
+4. **Completeness**: Does it capture the essence of what was modified?
+
+**Analysis Instructions:**
+- For each commit, provide a quality score (1-5 scale where 5 is excellent)
+- Briefly explain your reasoning for the score
+- Identify patterns across commits (good practices or areas for improvement)
+- Provide 2-3 actionable recommendations for better commit messages
+
+**Example Analysis Format:**
+### Commit 1 (abc123): Score 3/5
+**Reasoning:** Message is vague ("fix bug") but changes suggest specific form validation fixes. Should be more specific about what was fixed.
+
+### Summary & Recommendations:
+1. Use more descriptive verbs and specific details
+2. Include the component or feature being modified
+3. Follow conventional commit format when possible
+
+Be concise but specific in your analysis. Focus on how well messages communicate the intent and scope of changes.
+
+**Commit Analysis Data:**
+"""
+
+_COMMIT_QUALITY_ENTRY = """
+**Commit {index}:** {hash}
+**Message:** "{message}"
+**Changes:** {total_files} files, {total_changes} lines
+**Files Modified:** {files}
+{more}
+
+"""
+
+
+# Code review prompt: fixed instructions, then the developer and their files
+_CODE_REVIEW_INSTRUCTIONS = """As a senior software developer conducting a comprehensive code review, analyze the code files provided at the end of this prompt. Focus on the following criteria:
+
+# Code Review Criteria:
+1.  **Naming Conventions**: Assess clarity, consistency, and adherence to established patterns (e.g., camelCase, snake_case, PascalCase for variables, functions, classes).
+2.  **Design Patterns**: Identify adherence to or deviation from common design patterns (e.g., Singleton, Factory, Observer, Strategy) where applicable. Suggest improvements if a pattern could enhance maintainability or scalability.
+3.  **Complexity Levels**: Evaluate for overly long methods/functions, deep nesting of `if`/`else` statements or loops, and overall cyclomatic complexity. Suggest refactoring for readability and testability.
+4.  **Formatting and Style**: Check for consistency with general coding style guidelines (e.g., indentation, line breaks, spacing, brace placement). Point out any deviations.
+5.  **Comments and Documentation**: Assess the presence, clarity, and quality of inline comments, function/method docstrings, and class documentation. Ensure they explain *why* code exists, not just *what* it does.
+
+Based on the code and the specified criteria, provide your review. If you find problems, give concrete recommendations for improvements. If no significant issues are found, give a brief confirmation that the file is in good condition. Be concise and professional.
+
+Provide your review in a structured format, addressing each file individually. For each file, clearly state any issues found, categorized by the criteria, and provide actionable recommendations. If a file is in good condition, state that explicitly.
+
+Example format for a file with issues:
+
+### File: example.py
+
+**Naming Conventions**: Issue - Variable `x` is too generic. Recommendation - Rename to `user_count` for clarity.
+**Complexity**: Issue - `process_data` method has 5 nested if statements. Recommendation - Refactor using Strategy pattern or extract helper methods.
+**Comments**: Issue - No docstring for `calculate_total`. Recommendation - Add a docstring explaining its purpose and parameters.
+
+Example format for a file in good condition:
+
+### File: good_code.js
+
+This file appears to be in good condition, adhering to all specified code review criteria.
+
+---
+
+Remember to be specific and actionable in your recommendations. If a file is very large and truncated, focus on the visible parts and general patterns.
+
+"""
+
+_CODE_REVIEW_CONTEXT = """# Developer Context (for reference, do not directly review these metrics):
+- **Username**: {username}
+- **Top Modified Files**: {top_files}
+
+# Files for Review:
+"""
+
+_CODE_REVIEW_FILE = """
+---
+File: {filename} ---
+```
+{code_content}
+```
+
+"""
+
+
+def truncate_code(code: str) -> str:
+    """Cut code longer than MAX_REVIEW_FILE_CHARS down to its head and tail.
+    
+    Truncating an already truncated file returns it unchanged.
+    """
+    if len(code) <= MAX_REVIEW_FILE_CHARS:
+        return code
+    half = MAX_REVIEW_FILE_CHARS // 2
+    return f"{code[:half]}{TRUNCATION_MARKER}{code[-half:]}"
+
+
+def truncate_tokens(
+    code: str, encoding: tiktoken.Encoding, max_tokens: int = MAX_REVIEW_FILE_TOKENS
+) -> str:
+    """Cut code longer than max_tokens tokens down to its head and tail.
+    
+    Args:
+        code: Source text
+        encoding: tiktoken encoding of the model the code is sent to
+        max_tokens: Token budget for the returned text, excluding the marker
+        
+    Returns:
+        The code unchanged if within budget, else its first and last
+        max_tokens / 2 tokens around TRUNCATION_MARKER
+    """
+    tokens = encoding.encode(code, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return code
+    half = max_tokens // 2
+    return f"{encoding.decode(tokens[:half])}{TRUNCATION_MARKER}{encoding.decode(tokens[-half:])}"
+
+
+def _content_text(content: Union[str, List[Union[str, Dict[Any, Any]]]]) -> str:
+    """Flatten message content to its text; non-text parts are dropped."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else str(part.get("text", "")) for part in content
+    )
+
+
+def _shared_http_client() -> httpx.Client:
+    """Return the HTTP client all LLMTools share, creating it on first use."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = DefaultHttpxClient(limits=_HTTP_LIMITS)
+        return _http_client
+
+
+class _CircuitBreaker:
+    """Fails LLM calls fast while the provider keeps failing."""
+    
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        """Initialize the breaker.
+        
+        Args:
+            failure_threshold: Consecutive failed calls that open the breaker
+            reset_seconds: How long an open breaker rejects calls
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def check(self) -> None:
+        """Raise if the breaker is open.
+        
+        Raises:
+            RuntimeError: If the provider failed too often too recently
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self.reset_seconds - time.monotonic()
+            if remaining > 0:
+                raise RuntimeError(
+                    f"LLM provider unavailable after {self._failures} consecutive failures; "
+                    f"retrying in {remaining:.0f}s"
+                )
+            # Let calls through again; the next failure reopens the breaker
+            self._opened_at = None
+            self._failures = self.failure_threshold - 1
+    
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+# Shared like the connection pool: every LLMTool talks to the same provider
+_circuit_breaker = _CircuitBreaker(CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS)
+
+
+def _compact_json(data: Any) -> str:
+    """Serialize prompt data as compact JSON, which takes fewer tokens than repr."""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def _compress_weekly(weekly_data: List[Dict[str, Any]], max_weeks: int = MAX_TREND_WEEKS) -> Any:
+    """Shrink weekly rows before they are embedded in a prompt.
+    
+    Keeps the latest max_weeks rows in week order and rounds floats to one
+    decimal. Values that are the same in every row, such as the repository
+    name or period-wide percentiles, are stated once instead of per week.
+    
+    Args:
+        weekly_data: One dict of metrics per week
+        max_weeks: Number of most recent weeks to keep
+        
+    Returns:
+        The list of rows, or {"every_week": {...}, "weeks": [...]} when some
+        values are shared by all rows
+    """
+    rows = sorted(weekly_data, key=lambda row: str(row.get("week", "")))[-max_weeks:]
+    rows = [
+        {key: round(value, 1) if isinstance(value, float) else value for key, value in row.items()}
+        for row in rows
+    ]
+    if len(rows) < 2:
+        return rows
+    
+    first = rows[0]
+    shared = {
+        key: value for key, value in first.items()
+        if key != "week" and all(key in row and row[key] == value for row in rows[1:])
+    }
+    if not shared:
+        return rows
+    return {
+        "every_week": shared,
+        "weeks": [{key: value for key, value in row.items() if key not in shared} for row in rows],
+    }
+
+
+def _iter_strings(data: Any) -> Iterator[str]:
+    """Yield the text in nested dicts, lists, tuples and sets, keys included.
+    
+    Numbers, booleans and None carry no text and are skipped; any other object
+    is rendered with str().
+    """
+    if isinstance(data, str):
+        yield data
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            yield from _iter_strings(key)
+            yield from _iter_strings(value)
+    elif isinstance(data, (list, tuple, set, frozenset)):
+        for item in data:
+            yield from _iter_strings(item)
+    elif data is not None and not isinstance(data, (int, float)):
+        yield str(data)
+
+
+class _PromptCache:
+    """Exact-match cache of LLM responses, in memory and optionally on disk.
+    
+    Disk entries older than RESPONSE_CACHE_TTL_SECONDS are ignored and get
+    overwritten by the next answer to the same prompt.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the cache.
+        
+        Args:
+            cache_dir: Directory for responses that should outlive the process,
+                or None to keep them in memory only
+        """
+        self._memory: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._disk = CacheTool(cache_dir) if cache_dir else None
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, if any."""
+        with self._lock:
+            content = self._memory.get(key)
+        if content is None and self._disk is not None:
+            response = self._disk.read_json(key)
+            if response.success and isinstance(response.data, dict):
+                cached_at = response.data.get("cached_at", 0)
+                stored = response.data.get("content")
+                fresh = time.time() - cached_at < RESPONSE_CACHE_TTL_SECONDS
+                if fresh and isinstance(stored, str) and stored:
+                    content = stored
+                if content is not None:
+                    with self._lock:
+                        self._memory[key] = content
+        return content
+    
+    def put(self, key: str, content: str) -> None:
+        """Store a response under key.
+        
+        Empty or non-text content is not stored, so it is requested again.
+        """
+        if not isinstance(content, str) or not content:
+            return
+        with self._lock:
+            self._memory[key] = content
+        if self._disk is not None:
+            # A failed write only costs a future cache miss
+            self._disk.write_json(key, {"content": content, "cached_at": time.time()})
+    
+    def discard(self, key: str) -> None:
+        """Forget the response stored under key, e.g. one that proved unusable."""
+        with self._lock:
+            self._memory.pop(key, None)
+        if self._disk is not None:
+            self._disk.clear_cache(key)
 
 
 class LLMTool:
@@ -14,7 +502,8 @@ class LLMTool:
     
     def __init__(self, provider: str = "openai", model: str = "gpt-3.5-turbo", 
                  temperature: float = 0.7, api_key: Optional[str] = None,
-                 base_url: Optional[str] = None, max_tokens: Optional[int] = None):
+                 base_url: Optional[str] = None, max_tokens: Optional[int] = None,
+                 cache_dir: Optional[Path] = None):
         """Initialize LLMTool with configuration.
         
         Args:
@@ -24,6 +513,8 @@ class LLMTool:
             api_key: API key (if None, will use environment variable)
             base_url: Custom API base URL (for OpenRouter, etc.)
             max_tokens: Maximum tokens for response
+            cache_dir: Directory to keep responses in across runs; identical
+                prompts are always answered from memory within one LLMTool
         """
         self.provider = provider
         self.model = model
@@ -49,8 +540,8 @@ class LLMTool:
             elif not os.getenv("OPENAI_API_KEY"):
                 raise ValueError("OpenAI API key not provided and OPENAI_API_KEY environment variable not set")
         
-        # Initialize the LLM with appropriate configuration
-        llm_kwargs = {
+        # LLM configuration; the client itself is built on first use
+        llm_kwargs: Dict[str, Any] = {
             "model": model,
             "temperature": temperature
         }
@@ -61,7 +552,161 @@ class LLMTool:
         if max_tokens:
             llm_kwargs["max_tokens"] = max_tokens
         
-        self.llm = ChatOpenAI(**llm_kwargs)
+        self._llm_kwargs = llm_kwargs
+        self._capped_llms: Dict[int, ChatOpenAI] = {}
+        self._cache = _PromptCache(cache_dir)
+        self._base_url = base_url
+    
+    @cached_property
+    def llm(self) -> ChatOpenAI:
+        """Chat model client, created on first use.
+        
+        Runs answered entirely from the prompt cache never build the client.
+        Requests go through the connection pool shared by all LLMTools.
+        """
+        return ChatOpenAI(
+            http_client=_shared_http_client(),
+            max_retries=LLM_MAX_RETRIES,
+            **self._llm_kwargs,
+        )
+    
+    def _response_cap(self, max_tokens: Optional[int]) -> Optional[int]:
+        """Combine a per-call token cap with the configured max_tokens."""
+        if max_tokens is None or (self.max_tokens and self.max_tokens <= max_tokens):
+            return self.max_tokens
+        return max_tokens
+    
+    def _client(self, max_tokens: Optional[int] = None) -> ChatOpenAI:
+        """Return the client, or a sibling that stops after max_tokens tokens.
+        
+        Capped clients share the connection pool and are built once per cap.
+        """
+        cap = self._response_cap(max_tokens)
+        if cap is None or cap == self.max_tokens:
+            return self.llm
+        if cap not in self._capped_llms:
+            self._capped_llms[cap] = ChatOpenAI(
+                http_client=_shared_http_client(),
+                max_retries=LLM_MAX_RETRIES,
+                **{**self._llm_kwargs, "max_tokens": cap},
+            )
+        return self._capped_llms[cap]
+    
+    @staticmethod
+    def close_all() -> None:
+        """Close the connection pool shared by all LLMTools.
+        
+        Call once at shutdown. Clients built before the call cannot send
+        further requests; LLMTools created afterwards get a fresh pool.
+        """
+        global _http_client
+        with _http_client_lock:
+            if _http_client is not None:
+                _http_client.close()
+                _http_client = None
+    
+    @cached_property
+    def _encoding(self) -> Optional[tiktoken.Encoding]:
+        """tiktoken encoding for the model, or None if it cannot be loaded."""
+        try:
+            try:
+                return tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                # Models tiktoken does not know, e.g. OpenRouter names
+                return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # Encodings are downloaded on first use; without one the
+            # character limit alone applies
+            logger.warning(f"No tokenizer for {self.model}, truncating by characters: {e}")
+            return None
+    
+    def _truncate_for_review(self, code: str) -> str:
+        """Fit a source file into the per-file review budget.
+        
+        Args:
+            code: Source text
+            
+        Returns:
+            Code cut to MAX_REVIEW_FILE_CHARS characters and, when a tokenizer
+            is available, MAX_REVIEW_FILE_TOKENS tokens
+        """
+        code = truncate_code(code)
+        if self._encoding is not None:
+            code = truncate_tokens(code, self._encoding)
+        return code
+    
+    def _cache_key(self, prompt: str, max_words: Optional[int] = None,
+                   max_tokens: Optional[int] = None) -> str:
+        """Key a prompt together with every setting that shapes the response."""
+        settings = [self.provider, self.model, self.temperature, self._response_cap(max_tokens),
+                    max_words, self._base_url, prompt]
+        return hashlib.sha256(json.dumps(settings).encode("utf-8")).hexdigest()
+    
+    def _cached_invoke(self, prompt: str, max_words: Optional[int] = None,
+                       max_tokens: Optional[int] = None) -> str:
+        """Send a prompt to the LLM unless the same prompt was answered before.
+        
+        Args:
+            prompt: Prompt text
+            max_words: Stop generating once the response runs past this many
+                words; the cut-off response is returned as is but not cached
+            max_tokens: Response token cap for this prompt, on top of the
+                configured max_tokens
+            
+        Returns:
+            Response content
+        """
+        key = self._cache_key(prompt, max_words, max_tokens)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        truncated = False
+        _circuit_breaker.check()
+        try:
+            with _request_slots:
+                llm = self._client(max_tokens)
+                if max_words is None:
+                    response = llm.invoke([HumanMessage(content=prompt)])
+                    content = _content_text(response.content)
+                else:
+                    content, truncated = self._stream_words(llm, prompt, max_words)
+        except Exception:
+            _circuit_breaker.record_failure()
+            raise
+        _circuit_breaker.record_success()
+        # An abandoned stream is not an answer; the next run asks again
+        if not truncated:
+            self._cache.put(key, content)
+        return content
+    
+    def _stream_words(self, llm: ChatOpenAI, prompt: str, max_words: int) -> Tuple[str, bool]:
+        """Stream a response, abandoning it once it has more than max_words words.
+        
+        Args:
+            llm: Client to stream from
+            prompt: Prompt text
+            max_words: Word count past which the rest is not worth generating
+            
+        Returns:
+            Response content, cut off after max_words + 1 words if too long, and
+            whether it was cut off
+        """
+        parts = []
+        word_count = 0
+        in_word = False
+        for chunk in llm.stream([HumanMessage(content=prompt)]):
+            text = _content_text(chunk.content)
+            parts.append(text)
+            if text:
+                word_count += len(text.split())
+                # A chunk that continues the previous chunk's last word
+                if in_word and not text[0].isspace():
+                    word_count -= 1
+                in_word = not text[-1].isspace()
+            if word_count > max_words:
+                return "".join(parts), True
+        return "".join(parts), False
     
     def _validate_no_source_code(self, data: Any) -> bool:
         """Validate that data contains no source code.
@@ -74,21 +719,12 @@ class LLMTool:
         Returns:
             True if data is safe (no source code detected)
         """
-        # Convert data to string for analysis
-        data_str = str(data).lower()
+        # Only the text in the data is scanned, not its repr with every number,
+        # quote and bracket; NUL keeps separate strings from forming a match
+        data_str = "\0".join(_iter_strings(data)).lower()
         
         # Check for actual source code patterns (more specific to avoid false positives)
-        code_indicators = [
-            'def __init__(', 'function main(', 'class extends', 'import sys',
-            'if __name__ == "__main__"', 'return null;', 'console.log(',
-            '#!/usr/bin/', '<?php echo', '<script type=', '<html lang=',
-            'select * from', 'insert into', 'create table if',
-            'drop table if', 'rm -rf /', 'os.system(', 'eval(',
-            'exec(', 'subprocess.call', '${', '<!--', '-->', '{%', '%}',
-            'package.json:', 'requirements.txt:', 'import React'
-        ]
-        
-        for indicator in code_indicators:
+        for indicator in _CODE_INDICATORS:
             if indicator in data_str:
                 return False
         
@@ -109,31 +745,23 @@ class LLMTool:
         if not self._validate_no_source_code(pr_metrics) or not self._validate_no_source_code(weekly_data):
             return ToolResponse.error_response("Safety check failed: potential source code detected in metrics data")
         
+        if not pr_metrics.get('total_prs', 0):
+            return ToolResponse.success_response(_NO_PRS_SUMMARY)
+        
         try:
             # Prepare the prompt with aggregated metrics only
-            prompt = f"""Based on the following development metrics, write a concise executive summary in exactly 120 words or less:
-
-PR Metrics:
-- Total PRs: {pr_metrics.get('total_prs', 0)}
-- Lead Time 50th percentile: {pr_metrics.get('lead_time_p50', 0):.1f} hours
-- Lead Time 75th percentile: {pr_metrics.get('lead_time_p75', 0):.1f} hours
-- Change Size 50th percentile: {pr_metrics.get('change_size_p50', 0)} lines
-- Change Size 75th percentile: {pr_metrics.get('change_size_p75', 0)} lines
+            prompt = _EXEC_SUMMARY_PROMPT.format_map(
+                ChainMap({"weekly_data": _compact_json(weekly_data)}, pr_metrics, _PR_METRICS_DEFAULTS)
+            )
 
-Weekly PR Activity:
-{weekly_data}
-
-Focus on development velocity, code review efficiency, and overall team productivity trends. Keep it professional and data-driven. Maximum 120 words."""
-
-            # Generate summary
-            message = HumanMessage(content=prompt)
-            response = self.llm.invoke([message])
-            
-            summary = response.content.strip()
+            # Generate summary, giving up as soon as it is known to be too long
+            summary = self._cached_invoke(
+                prompt, max_words=SUMMARY_MAX_WORDS, max_tokens=SUMMARY_MAX_TOKENS
+            ).strip()
             
             # Validate word count (approximately)
             word_count = len(summary.split())
-            if word_count > 130:  # Allow small buffer
+            if word_count > SUMMARY_MAX_WORDS:
                 return ToolResponse.error_response(f"Generated summary too long: {word_count} words (max 120)")
             
             return ToolResponse.success_response(summary)
@@ -157,121 +785,247 @@ Focus on development velocity, code review efficiency, and overall team producti
         try:
             # Handle case when there's no weekly data (empty list)
             if not weekly_aggregated_data:
-                prompt = """Analyze the development situation where no pull requests (PRs) were created during the analysis period.
-
-Weekly Aggregated Data: No PR activity during the analysis period
-
-Provide insights on:
-1. Development velocity trends (lack of activity)
-2. Team productivity patterns (identifying potential blockers)
-3. Code quality indicators (impact of low activity)
-4. Resource allocation observations (potential causes)
-5. Recommendations for improvement (actionable steps)
-
-Focus on organizational-level patterns and provide actionable insights for teams with low or no development activity. Keep the analysis professional and data-driven."""
+                prompt = _NO_ACTIVITY_TRENDS_PROMPT
             else:
                 # Prepare the prompt with aggregated data
-                prompt = f"""Analyze the following weekly aggregated development data across multiple repositories and provide organizational insights:
-
-Weekly Aggregated Data:
-{weekly_aggregated_data}
-
-Provide insights on:
-1. Development velocity trends
-2. Team productivity patterns
-3. Code quality indicators
-4. Resource allocation observations
-5. Recommendations for improvement
-
-Focus on organizational-level patterns and trends. Be specific about what the data shows and provide actionable insights. Keep the analysis professional and data-driven."""
+                compressed = _compact_json(_compress_weekly(weekly_aggregated_data))
+                logger.debug(f"Trends prompt data: {len(weekly_aggregated_data)} weeks in {len(compressed)} bytes")
+                prompt = _TRENDS_PROMPT.format(weekly_aggregated_data=compressed)
 
             # Generate analysis
-            message = HumanMessage(content=prompt)
-            response = self.llm.invoke([message])
-            
-            analysis = response.content.strip()
+            analysis = self._cached_invoke(prompt).strip()
             
             return ToolResponse.success_response(analysis)
             
         except Exception as e:
             return ToolResponse.error_response(f"Failed to generate organizational trends: {str(e)}")
     
-    def generate_user_recommendations(self, user_stats: Dict[str, Any]) -> ToolResponse:
-        """Generate personalized recommendations for a specific developer.
+    def _check_recommendation_input(self, user_stats: Dict[str, Any]) -> Optional[ToolResponse]:
+        """Answer developers whose stats must not or need not go to the LLM.
         
         Args:
             user_stats: UserStats.to_dict() format with user's coding patterns
             
         Returns:
-            ToolResponse with list of personalized recommendations (max 50 words each)
+            The response to return without an LLM call, or None to ask the LLM
         """
         # Safety check - ensure no source code is being sent
         if not self._validate_no_source_code(user_stats):
             return ToolResponse.error_response("Safety check failed: potential source code detected in user stats")
         
+        if user_stats.get('total_commits', 0) < MIN_COMMITS_FOR_RECOMMENDATIONS:
+            return ToolResponse.success_response(list(_TOO_FEW_COMMITS_RECOMMENDATIONS))
+        
+        return None
+    
+    @staticmethod
+    def _profile_fields(user_stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the aggregated statistics that fill _DEVELOPER_PROFILE."""
+        work_type_summary = dict(Counter(
+            c['work_type'] for c in user_stats.get('commit_classifications', [])
+        ))
+        return {
+            'username': user_stats.get('username', 'Unknown'),
+            'total_commits': user_stats.get('total_commits', 0),
+            'total_merges': user_stats.get('total_merges', 0),
+            'total_changes': user_stats.get('total_changes', 0),
+            'work_type_summary': work_type_summary,
+            'top_files': [f['filename'] for f in user_stats.get('top_files', [])[:3]],
+            'commit_message_patterns': user_stats.get('commit_message_patterns', []),
+        }
+    
+    @staticmethod
+    def _clean_recommendations(lines: List[str]) -> List[str]:
+        """Keep the actual recommendations from lines of LLM output.
+        
+        Args:
+            lines: Candidate recommendation lines
+            
+        Returns:
+            Up to 5 recommendations without introductory text or list markers
+        """
+        recommendations = []
+        
+        # Filter out introductory text and keep only actual recommendations
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                # Skip introductory sentences that contain "based on", "here are", etc.
+                lowered = line.lower()
+                if any(phrase in lowered for phrase in _INTRO_PHRASES):
+                    continue
+                
+                # Remove list markers like "1.", "-", "*", numbered lists
+                clean_line = line.lstrip('0123456789.-* ')
+                
+                # Skip if it's just a number or empty after cleaning
+                word_count = len(clean_line.split())
+                if 3 < word_count <= 50:
+                    recommendations.append(clean_line)
+        
+        return recommendations[:5]  # Max 5 recommendations
+    
+    def generate_user_recommendations(self, user_stats: Dict[str, Any]) -> ToolResponse:
+        """Generate personalized recommendations for a specific developer.
+        
+        Args:
+            user_stats: UserStats.to_dict() format with user's coding patterns
+            
+        Returns:
+            ToolResponse with list of personalized recommendations (max 50 words each)
+        """
+        response = self._check_recommendation_input(user_stats)
+        if response is not None:
+            return response
+        
         try:
             # Prepare the prompt with aggregated user statistics only
-            work_types = [c['work_type'] for c in user_stats.get('commit_classifications', [])]
-            work_type_summary = {}
-            for work_type in set(work_types):
-                work_type_summary[work_type] = work_types.count(work_type)
-            
-            prompt = f"""Based on the following developer statistics, provide 1-3 personalized recommendations to help improve their coding practices and career development:
-
-Developer Profile:
-- Username: {user_stats.get('username', 'Unknown')}
-- Total Commits: {user_stats.get('total_commits', 0)}
-- Total Merges: {user_stats.get('total_merges', 0)}
-- Total Changes: {user_stats.get('total_changes', 0)} lines
-- Work Type Distribution: {work_type_summary}
-- Top Files: {[f['filename'] for f in user_stats.get('top_files', [])][:3]}
-- Message Patterns: {user_stats.get('commit_message_patterns', [])}
-
-Requirements:
-- Provide ONLY the recommendations, no introductory text
-- Each recommendation should be maximum 50 words
-- Focus on improvement or recognition of good practices
-- Base recommendations on the actual data patterns shown
-- Be professional and constructive
-
-Format as a simple list of recommendations, one per line, without numbers or bullets."""
+            prompt = _RECOMMENDATIONS_PROMPT.format(**self._profile_fields(user_stats))
 
             # Generate recommendations
-            message = HumanMessage(content=prompt)
-            response = self.llm.invoke([message])
-            
-            recommendations_text = response.content.strip()
+            recommendations_text = self._cached_invoke(prompt, max_tokens=RECOMMENDATIONS_MAX_TOKENS).strip()
             
             # Parse recommendations into list (split by newlines and clean up)
-            recommendations = []
-            lines = recommendations_text.split('\n')
-            
-            # Filter out introductory text and keep only actual recommendations
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    # Skip introductory sentences that contain "based on", "here are", etc.
-                    if any(phrase in line.lower() for phrase in [
-                        'based on the provided',
-                        'based on the following', 
-                        'here are',
-                        'recommendations to help',
-                        'personalized recommendations'
-                    ]):
-                        continue
-                    
-                    # Remove list markers like "1.", "-", "*", numbered lists
-                    clean_line = line.lstrip('0123456789.-* ')
-                    
-                    # Skip if it's just a number or empty after cleaning
-                    if clean_line and len(clean_line.split()) > 3 and len(clean_line.split()) <= 50:
-                        recommendations.append(clean_line)
-            
-            return ToolResponse.success_response(recommendations[:5])  # Max 5 recommendations
+            return ToolResponse.success_response(
+                self._clean_recommendations(recommendations_text.split('\n'))
+            )
             
         except Exception as e:
             return ToolResponse.error_response(f"Failed to generate user recommendations: {str(e)}")
     
+    def generate_user_recommendations_batch(
+        self, user_stats_list: List[Dict[str, Any]],
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[ToolResponse]:
+        """Generate personalized recommendations for several developers concurrently.
+        
+        Args:
+            user_stats_list: UserStats.to_dict() entries, one per developer
+            max_concurrent: Maximum number of LLM requests in flight
+            
+        Returns:
+            One ToolResponse per developer, in the order given, as returned by
+            ``generate_user_recommendations``
+        """
+        if not user_stats_list:
+            return []
+        
+        workers = max(1, min(max_concurrent, len(user_stats_list)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.generate_user_recommendations, user_stats_list))
+    
+    def generate_user_recommendations_grouped(
+        self, user_stats_list: List[Dict[str, Any]],
+        users_per_prompt: int = RECOMMENDATION_USERS_PER_PROMPT,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[ToolResponse]:
+        """Generate personalized recommendations, several developers per LLM request.
+        
+        Makes about len(user_stats_list) / users_per_prompt requests instead of
+        one per developer, for teams large enough to hit provider rate limits.
+        Developers missing from a grouped answer are asked about on their own.
+        
+        Args:
+            user_stats_list: UserStats.to_dict() entries, one per developer
+            users_per_prompt: Developers described in each request
+            max_concurrent: Maximum number of LLM requests in flight
+            
+        Returns:
+            One ToolResponse per developer, in the order given, shaped like
+            ``generate_user_recommendations`` results
+        """
+        responses: List[Optional[ToolResponse]] = [
+            self._check_recommendation_input(user_stats) for user_stats in user_stats_list
+        ]
+        pending = [i for i, response in enumerate(responses) if response is None]
+        users_per_prompt = max(1, users_per_prompt)
+        groups = [
+            pending[start:start + users_per_prompt]
+            for start in range(0, len(pending), users_per_prompt)
+        ]
+        if not groups:
+            return [response for response in responses if response is not None]
+        
+        def run(group: List[int]) -> List[ToolResponse]:
+            return self._recommendations_for_group([user_stats_list[i] for i in group])
+        
+        workers = max(1, min(max_concurrent, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for group, group_responses in zip(groups, executor.map(run, groups)):
+                for i, response in zip(group, group_responses):
+                    responses[i] = response
+        return [response for response in responses if response is not None]
+    
+    def _recommendations_for_group(self, group: List[Dict[str, Any]]) -> List[ToolResponse]:
+        """Ask for recommendations for a group of developers in one request.
+        
+        Args:
+            group: UserStats.to_dict() entries that passed the input checks
+            
+        Returns:
+            One ToolResponse per developer in group
+        """
+        if len(group) == 1:
+            return [self.generate_user_recommendations(group[0])]
+        
+        parts = [_GROUP_RECOMMENDATIONS_PROMPT]
+        for index, user_stats in enumerate(group, 1):
+            parts.append(_GROUP_DEVELOPER_ENTRY.format(index=index, **self._profile_fields(user_stats)))
+        prompt = "".join(parts)
+        
+        max_tokens = RECOMMENDATIONS_MAX_TOKENS * len(group)
+        answers: Dict[int, List[str]] = {}
+        try:
+            text = self._cached_invoke(prompt, max_tokens=max_tokens)
+            # Tolerate prose or code fences around the array
+            for entry in json.loads(text[text.index('['):text.rindex(']') + 1]):
+                if isinstance(entry, dict) and isinstance(entry.get('recommendations'), list):
+                    try:
+                        # Models sometimes number developers as strings
+                        developer = int(entry['developer'])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    answers[developer] = [str(line) for line in entry['recommendations']]
+        except Exception as e:
+            logger.warning(f"Grouped recommendations failed, asking per developer: {e}")
+        if not answers:
+            # An answer nobody could be matched to must not be replayed next run
+            self._cache.discard(self._cache_key(prompt, max_tokens=max_tokens))
+        
+        responses = []
+        for index, user_stats in enumerate(group, 1):
+            recommendations = self._clean_recommendations(answers.get(index, []))
+            if recommendations:
+                responses.append(ToolResponse.success_response(recommendations))
+            else:
+                responses.append(self.generate_user_recommendations(user_stats))
+        return responses
+    
+    def generate_code_review_insights_batch(
+        self, user_stats_list: List[Dict[str, Any]],
+        file_contents_list: List[Dict[str, str]],
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[ToolResponse]:
+        """Generate code review insights for several developers concurrently.
+        
+        Args:
+            user_stats_list: UserStats.to_dict() entries, one per developer
+            file_contents_list: Filename to code content mappings, one per developer
+            max_concurrent: Maximum number of LLM requests in flight
+            
+        Returns:
+            One ToolResponse per developer, in the order given, as returned by
+            ``generate_code_review_insights``
+        """
+        if not user_stats_list:
+            return []
+        
+        workers = max(1, min(max_concurrent, len(user_stats_list)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                self.generate_code_review_insights, user_stats_list, file_contents_list
+            ))
+    
     def generate_code_review_insights(self, user_stats: Dict[str, Any], file_contents: Dict[str, str]) -> ToolResponse:
         """Generate senior developer code review insights for user's top modified files.
         
@@ -292,21 +1046,16 @@ Format as a simple list of recommendations, one per line, without numbers or bul
             
             username = user_stats.get('username', 'Unknown')
             total_commits = user_stats.get('total_commits', 0)
-            work_types = [c['work_type'] for c in user_stats.get('commit_classifications', [])]
-            work_type_summary = {}
-            for work_type in set(work_types):
-                work_type_summary[work_type] = work_types.count(work_type)
+            work_type_summary = dict(Counter(
+                c['work_type'] for c in user_stats.get('commit_classifications', [])
+            ))
             
             # Prepare detailed file analysis including code content
             detailed_file_analysis = []
             for file_info in top_files:
                 filename = file_info.get('filename', 'unknown')
-                code_content = file_contents.get(filename, "")
-                
-                # Truncate large files to avoid token limits, if necessary
-                # This is a basic truncation; more sophisticated methods might be needed for very large files.
-                if len(code_content) > 10000: # Example limit, adjust as needed
-                    code_content = code_content[:5000] + "\n... [TRUNCATED] ...\n" + code_content[-5000:]
+                # Truncate large files to avoid token limits
+                code_content = self._truncate_for_review(file_contents.get(filename, ""))
                 
                 detailed_file_analysis.append({
                     'filename': filename,
@@ -315,61 +1064,16 @@ Format as a simple list of recommendations, one per line, without numbers or bul
                     'total_changes': file_info.get('total_changes', 0),
                 })
             
-            prompt = f"""As a senior software developer conducting a comprehensive code review, analyze the provided code files for developer {username}. Focus on the following criteria:
-
-# Code Review Criteria:
-1.  **Naming Conventions**: Assess clarity, consistency, and adherence to established patterns (e.g., camelCase, snake_case, PascalCase for variables, functions, classes).
-2.  **Design Patterns**: Identify adherence to or deviation from common design patterns (e.g., Singleton, Factory, Observer, Strategy) where applicable. Suggest improvements if a pattern could enhance maintainability or scalability.
-3.  **Complexity Levels**: Evaluate for overly long methods/functions, deep nesting of `if`/`else` statements or loops, and overall cyclomatic complexity. Suggest refactoring for readability and testability.
-4.  **Formatting and Style**: Check for consistency with general coding style guidelines (e.g., indentation, line breaks, spacing, brace placement). Point out any deviations.
-5.  **Comments and Documentation**: Assess the presence, clarity, and quality of inline comments, function/method docstrings, and class documentation. Ensure they explain *why* code exists, not just *what* it does.
-
-# Developer Context (for reference, do not directly review these metrics):
-- **Username**: {username}
-- **Top Modified Files**: {[f['filename'] for f in top_files]}
-
-# Files for Review:
-"""
-            
+            parts = [_CODE_REVIEW_INSTRUCTIONS, _CODE_REVIEW_CONTEXT.format(
+                username=username,
+                top_files=[f['filename'] for f in top_files],
+            )]
             for file_data in detailed_file_analysis:
-                prompt += f"""
----
-File: {file_data['filename']} ---
-```
-{file_data['code_content']}
-```
-
-"""
-            
-            prompt += f"""
-Based on the above code and the specified criteria, provide your review. If you find problems, give concrete recommendations for improvements. If no significant issues are found, give a brief confirmation that the file is in good condition. Be concise and professional.
-
-Provide your review in a structured format, addressing each file individually. For each file, clearly state any issues found, categorized by the criteria, and provide actionable recommendations. If a file is in good condition, state that explicitly.
-
-Example format for a file with issues:
-
-### File: example.py
-
-**Naming Conventions**: Issue - Variable `x` is too generic. Recommendation - Rename to `user_count` for clarity.
-**Complexity**: Issue - `process_data` method has 5 nested if statements. Recommendation - Refactor using Strategy pattern or extract helper methods.
-**Comments**: Issue - No docstring for `calculate_total`. Recommendation - Add a docstring explaining its purpose and parameters.
-
-Example format for a file in good condition:
-
-### File: good_code.js
-
-This file appears to be in good condition, adhering to all specified code review criteria.
-
----
-
-Remember to be specific and actionable in your recommendations. If a file is very large and truncated, focus on the visible parts and general patterns.
-"""
+                parts.append(_CODE_REVIEW_FILE.format(**file_data))
+            prompt = "".join(parts)
 
             # Generate code review insights
-            message = HumanMessage(content=prompt)
-            response = self.llm.invoke([message])
-            
-            insights = response.content.strip()
+            insights = self._cached_invoke(prompt).strip()
             
             return ToolResponse.success_response(insights)
             
@@ -389,13 +1093,22 @@ Remember to be specific and actionable in your recommendations. If a file is ver
             if not commits_data:
                 return ToolResponse.success_response("No commits available for message quality analysis.")
             
-            # Sample a subset of commits to analyze (to avoid token limits)
+            # Sample a subset of commits to analyze (to avoid token limits),
+            # skipping repeats of an earlier commit's message and files
             max_commits = 10
-            sample_commits = commits_data[:max_commits] if len(commits_data) > max_commits else commits_data
+            sample_commits: Dict[Tuple[str, Tuple[str, ...]], Dict[str, Any]] = {}
+            for commit in commits_data:
+                fingerprint = (
+                    commit.get('message', ''),
+                    tuple(sorted(f.get('filename', '') for f in commit.get('files_changed', [])[:5])),
+                )
+                sample_commits.setdefault(fingerprint, commit)
+                if len(sample_commits) == max_commits:
+                    break
             
             # Prepare analysis data
             commit_analysis = []
-            for commit in sample_commits:
+            for commit in sample_commits.values():
                 commit_hash = commit.get('hash', 'unknown')[:8]  # Short hash
                 message = commit.get('message', 'No message')
                 files_changed = commit.get('files_changed', [])
@@ -420,50 +1133,21 @@ Remember to be specific and actionable in your recommendations. If a file is ver
                     'total_changes': diff_stats.get('total_changes', 0)
                 })
             
-            prompt = f"""As a senior developer performing code review, analyze how well each commit message describes the actual changes made. Rate the quality of commit messages based on:
-
-**Evaluation Criteria:**
-1. **Descriptiveness**: Does the message clearly explain what was changed?
-2. **Accuracy**: Does the message match the actual files and scope of changes?
-3. **Convention**: Does it follow good commit message practices (imperative mood, proper scope)?
-4. **Completeness**: Does it capture the essence of what was modified?
-
-**Commit Analysis Data:**
-"""
-            
+            parts = [_COMMIT_QUALITY_HEADER]
             for i, commit in enumerate(commit_analysis, 1):
-                prompt += f"""
-**Commit {i}:** {commit['hash']}
-**Message:** "{commit['message']}"
-**Changes:** {commit['total_files']} files, {commit['total_changes']} lines
-**Files Modified:** {', '.join([f"{f['file']} ({f['changes']})" for f in commit['files_summary']])}
-{'...' if len(commits_data) > len(commit['files_summary']) else ''}
-
-"""
-            
-            prompt += f"""
-**Analysis Instructions:**
-- For each commit, provide a quality score (1-5 scale where 5 is excellent)
-- Briefly explain your reasoning for the score
-- Identify patterns across commits (good practices or areas for improvement)
-- Provide 2-3 actionable recommendations for better commit messages
-
-**Example Analysis Format:**
-### Commit 1 (abc123): Score 3/5
-**Reasoning:** Message is vague ("fix bug") but changes suggest specific form validation fixes. Should be more specific about what was fixed.
-
-### Summary & Recommendations:
-1. Use more descriptive verbs and specific details
-2. Include the component or feature being modified
-3. Follow conventional commit format when possible
-
-Be concise but specific in your analysis. Focus on how well messages communicate the intent and scope of changes."""
+                parts.append(_COMMIT_QUALITY_ENTRY.format(
+                    index=i,
+                    hash=commit['hash'],
+                    message=commit['message'],
+                    total_files=commit['total_files'],
+                    total_changes=commit['total_changes'],
+                    files=', '.join(f"{f['file']} ({f['changes']})" for f in commit['files_summary']),
+                    more='...' if len(commits_data) > len(commit['files_summary']) else '',
+                ))
+            prompt = "".join(parts)
 
             # Generate analysis
-            message = HumanMessage(content=prompt)
-            response = self.llm.invoke([message])
-            
-            analysis = response.content.strip()
+            analysis = self._cached_invoke(prompt).strip()
             
             return ToolResponse.success_response(analysis)
             
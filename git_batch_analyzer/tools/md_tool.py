@@ -1,9 +1,39 @@
 """Markdown generation tool for deterministic table rendering."""
 
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Union
 
 from ..types import ToolResponse
 
+# Characters not allowed in report filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\-_.]')
+
+
+@lru_cache(maxsize=256)
+def _create_separator(width: int, alignment: str) -> str:
+    """Create a table separator cell with proper alignment markers.
+    
+    Column widths repeat across tables, so cells are built once per
+    (width, alignment) pair.
+    
+    Args:
+        width: Column width
+        alignment: Alignment type ('left', 'center', 'right')
+        
+    Returns:
+        Separator string for the column
+    """
+    if alignment == 'center':
+        return ":" + "-" * (width - 2) + ":"
+    elif alignment == 'right':
+        return "-" * (width - 1) + ":"
+    else:  # left or default
+        return "-" * width
+
 
 class MdTool:
     """Tool for generating deterministic markdown tables and content."""
@@ -43,41 +73,28 @@ class MdTool:
             str_headers = [str(h) for h in headers]
             str_rows = [[str(cell) for cell in row] for row in rows]
             
-            # Calculate minimum column widths
-            col_widths = [len(header) for header in str_headers]
-            for row in str_rows:
-                for i, cell in enumerate(row):
-                    col_widths[i] = max(col_widths[i], len(cell))
-            
-            # Ensure minimum width of 3 for alignment markers
-            col_widths = [max(3, width) for width in col_widths]
-            
-            # Build the table
-            table_lines = []
-            
-            # Header row
-            header_cells = [
-                str_headers[i].ljust(col_widths[i])
-                for i in range(len(str_headers))
+            # Column widths from one pass over the transposed rows, at least 3
+            # wide for the alignment markers
+            col_widths = [
+                max(3, len(header), *map(len, column))
+                for header, column in zip(str_headers, zip(*str_rows))
             ]
-            table_lines.append("| " + " | ".join(header_cells) + " |")
+            
+            # Build the table: the cells of each line, joined by " | "
+            table_lines = [" | ".join(map(str.ljust, str_headers, col_widths))]
             
             # Separator row
             separator_cells = []
             for i, width in enumerate(col_widths):
                 align = alignment[i] if alignment and i < len(alignment) else 'left'
-                separator_cells.append(self._create_separator(width, align))
-            table_lines.append("| " + " | ".join(separator_cells) + " |")
+                separator_cells.append(_create_separator(width, align))
+            table_lines.append(" | ".join(separator_cells))
             
             # Data rows
-            for row in str_rows:
-                row_cells = [
-                    row[i].ljust(col_widths[i])
-                    for i in range(len(row))
-                ]
-                table_lines.append("| " + " | ".join(row_cells) + " |")
+            table_lines.extend(" | ".join(map(str.ljust, row, col_widths)) for row in str_rows)
             
-            markdown_table = "\n".join(table_lines)
+            # Every line is framed by "| " and " |", so one join adds them all
+            markdown_table = "| " + " |\n| ".join(table_lines) + " |"
             
             return ToolResponse.success_response(markdown_table)
             
@@ -170,7 +187,6 @@ class MdTool:
             headers = ["Branch", "Last Commit", "Days Ago"]
             rows = []
             
-            from datetime import datetime, timezone
             now = datetime.now(timezone.utc)
             
             for branch in stale_branches:
@@ -181,7 +197,10 @@ class MdTool:
                 timestamp_str = branch.get("last_commit_timestamp", "")
                 try:
                     if timestamp_str:
-                        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+                        # fromisoformat only accepts a "Z" suffix from Python 3.11
+                        if timestamp_str.endswith('Z'):
+                            timestamp_str = timestamp_str[:-1] + '+00:00'
+                        timestamp = datetime.fromisoformat(timestamp_str)
                         days_ago = (now - timestamp).days
                     else:
                         days_ago = "Unknown"
@@ -191,7 +210,7 @@ class MdTool:
                 rows.append([branch_name, last_commit, str(days_ago)])
             
             # Sort by branch name for deterministic output
-            rows.sort(key=lambda x: x[0])
+            rows.sort(key=itemgetter(0))
             
             return self.render_table(headers, rows, alignment=["left", "left", "right"])
             
@@ -245,23 +264,6 @@ class MdTool:
         except Exception as e:
             return ToolResponse.error_response(f"Error combining sections: {str(e)}")
     
-    def _create_separator(self, width: int, alignment: str) -> str:
-        """Create a table separator cell with proper alignment markers.
-        
-        Args:
-            width: Column width
-            alignment: Alignment type ('left', 'center', 'right')
-            
-        Returns:
-            Separator string for the column
-        """
-        if alignment == 'center':
-            return ":" + "-" * (width - 2) + ":"
-        elif alignment == 'right':
-            return "-" * (width - 1) + ":"
-        else:  # left or default
-            return "-" * width
-    
     def _render_empty_table(self, headers: List[str], alignment: Optional[List[str]] = None) -> str:
         """Render an empty table with just headers.
         
@@ -282,7 +284,7 @@ class MdTool:
         separator_cells = []
         for i, width in enumerate(col_widths):
             align = alignment[i] if alignment and i < len(alignment) else 'left'
-            separator_cells.append(self._create_separator(width, align))
+            separator_cells.append(_create_separator(width, align))
         separator_line = "| " + " | ".join(separator_cells) + " |"
         
         return header_line + "\n" + separator_line
@@ -302,6 +304,7 @@ class MdTool:
             
             headers = ["Developer", "Commits", "Merges", "Changes", "Top Work Type"]
             rows = []
+            commit_counts = []
             
             for user_stats in user_stats_list:
                 username = user_stats.get('username', 'Unknown')
@@ -313,12 +316,12 @@ class MdTool:
                 classifications = user_stats.get('commit_classifications', [])
                 if classifications:
                     work_types = [c.get('work_type', 'unknown') for c in classifications]
-                    from collections import Counter
                     most_common = Counter(work_types).most_common(1)[0]
                     top_work_type = f"{most_common[0]} ({most_common[1]})"
                 else:
                     top_work_type = "N/A"
                 
+                commit_counts.append(int(total_commits))
                 rows.append([
                     username,
                     str(total_commits),
@@ -327,8 +330,10 @@ class MdTool:
                     top_work_type
                 ])
             
-            # Sort by total commits (descending)
-            rows.sort(key=lambda x: int(x[1]), reverse=True)
+            # Sort by total commits (descending), on the numbers rather than
+            # re-parsing the rendered cells
+            order = sorted(range(len(rows)), key=commit_counts.__getitem__, reverse=True)
+            rows = [rows[i] for i in order]
             
             return self.render_table(headers, rows, alignment=["left", "right", "right", "right", "left"])
             
@@ -357,45 +362,41 @@ class MdTool:
             classifications = user_stats.get('commit_classifications', [])
             if classifications:
                 work_types = [c.get('work_type', 'unknown') for c in classifications]
-                from collections import Counter
                 work_type_counts = Counter(work_types)
                 
-                work_breakdown = "**Work Type Distribution:**\n"
+                total_classified = len(classifications)
+                work_breakdown = ["**Work Type Distribution:**"]
                 for work_type, count in work_type_counts.most_common():
-                    percentage = (count / len(classifications)) * 100
-                    work_breakdown += f"- {work_type.title()}: {count} commits ({percentage:.1f}%)\n"
+                    percentage = (count / total_classified) * 100
+                    work_breakdown.append(f"- {work_type.title()}: {count} commits ({percentage:.1f}%)")
                 
-                sections.append(work_breakdown.strip())
+                sections.append("\n".join(work_breakdown))
             
             # Top files
             top_files = user_stats.get('top_files', [])
             if top_files:
-                files_section = "**Most Modified Files:**\n"
+                files_section = ["**Most Modified Files:**"]
                 for file_info in top_files[:5]:  # Top 5 files
                     filename = file_info.get('filename', 'Unknown')
                     mod_count = file_info.get('modification_count', 0)
                     changes = file_info.get('total_changes', 0)
-                    files_section += f"- `{filename}` - {mod_count} modifications ({changes:,} lines)\n"
+                    files_section.append(f"- `{filename}` - {mod_count} modifications ({changes:,} lines)")
                 
-                sections.append(files_section.strip())
+                sections.append("\n".join(files_section))
             
             # Commit patterns
             patterns = user_stats.get('commit_message_patterns', [])
             if patterns:
-                patterns_section = "**Commit Message Patterns:**\n"
-                for pattern in patterns:
-                    patterns_section += f"- {pattern}\n"
-                
-                sections.append(patterns_section.strip())
+                patterns_section = ["**Commit Message Patterns:**"]
+                patterns_section.extend(f"- {pattern}" for pattern in patterns)
+                sections.append("\n".join(patterns_section))
             
             # Recommendations
             recommendations = user_stats.get('recommendations', [])
             if recommendations:
-                rec_section = "**Personalized Recommendations:**\n"
-                for rec in recommendations:
-                    rec_section += f"- {rec}\n"
-                
-                sections.append(rec_section.strip())
+                rec_section = ["**Personalized Recommendations:**"]
+                rec_section.extend(f"- {rec}" for rec in recommendations)
+                sections.append("\n".join(rec_section))
             
             # Code Review Insights (if available)
             code_review_insights = user_stats.get('code_review_insights', '')
@@ -422,14 +423,11 @@ class MdTool:
         Returns:
             Formatted filename: {sysdate in yyyymmdd hh:mm}:repoName[{branchName}]-{periodStart in yyyymmdd}:{periodEnd in yyyymmdd}.md
         """
-        from datetime import datetime, timedelta
-        import re
-        
         # Current system date with time
-        sys_date = datetime.now().strftime("%Y%m%d%H%M")
+        end_date = datetime.now()
+        sys_date = end_date.strftime("%Y%m%d%H%M")
         
         # Calculate date range
-        end_date = datetime.now()
         start_date = end_date - timedelta(days=period_days)
         
         # Format dates as YYYYMMDD
@@ -477,8 +475,8 @@ class MdTool:
                     break
         
         # Clean parts for filename (remove invalid characters)
-        clean_repo = re.sub(r'[^\w\-_.]', '_', repo_part)
-        clean_branch = re.sub(r'[^\w\-_.]', '_', branch_part) if branch_part else ""
+        clean_repo = _UNSAFE_FILENAME_CHARS.sub('_', repo_part)
+        clean_branch = _UNSAFE_FILENAME_CHARS.sub('_', branch_part) if branch_part else ""
         
         if clean_branch:
             return f"{sys_date}:{clean_repo}[{clean_branch}]-{period_start}:{period_end}.md"
@@ -2,7 +2,7 @@
 
 import re
 from collections import defaultdict, Counter
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 from ..types import ToolResponse, UserStats, CommitClassification
@@ -98,10 +98,22 @@ class UserAnalysisTool:
             if not commits:
                 return ToolResponse.success_response([])
             
-            # Get merge commits for merge statistics
-            merge_commits_response = self.git_tool.log_merges(branch, since_days)
+            # Get merge commits for merge statistics (only authors are compared)
+            merge_commits_response = self.git_tool.log_merges(
+                branch, since_days, fields=frozenset({"author"})
+            )
             merge_commits = merge_commits_response.data or [] if merge_commits_response.success else []
             
+            # Get changed files for all commits up front through the diff-tree pool
+            files_responses = self.git_tool.get_commit_files_batch(
+                [commit['hash'] for commit in commits]
+            )
+            commit_files: Dict[str, List[Dict[str, Any]]] = {
+                commit_hash: response.data or []
+                for commit_hash, response in files_responses.items()
+                if response.success
+            }
+            
             # Group commits by user
             user_commits = defaultdict(list)
             for commit in commits:
@@ -111,7 +123,9 @@ class UserAnalysisTool:
             # Analyze each user
             user_stats_list = []
             for (username, email), commits in user_commits.items():
-                user_stats = self._analyze_single_user(username, email, commits, merge_commits)
+                user_stats = self._analyze_single_user(
+                    username, email, commits, merge_commits, commit_files
+                )
                 if user_stats:
                     user_stats_list.append(user_stats.to_dict())
             
@@ -125,7 +139,8 @@ class UserAnalysisTool:
         username: str, 
         email: str, 
         commits: List[Dict[str, Any]], 
-        merge_commits: List[Dict[str, Any]]
+        merge_commits: List[Dict[str, Any]],
+        commit_files: Optional[Dict[str, List[Dict[str, Any]]]] = None
     ) -> UserStats:
         """Analyze a single user's commit patterns.
         
@@ -134,6 +149,7 @@ class UserAnalysisTool:
             email: User's email
             commits: All commits by this user
             merge_commits: All merge commits to check against
+            commit_files: Changed files per commit hash, fetched up front
             
         Returns:
             UserStats object with analysis results
@@ -143,7 +159,7 @@ class UserAnalysisTool:
             user_merges = [mc for mc in merge_commits if mc.get('author') == username]
             
             # Get file hotspots for this user
-            top_files = self._get_user_file_hotspots(commits)
+            top_files = self._get_user_file_hotspots(commits, commit_files)
             
             # Classify commits
             commit_classifications = self._classify_user_commits(commits)
@@ -152,7 +168,7 @@ class UserAnalysisTool:
             commit_message_patterns = self._extract_message_patterns(commits)
             
             # Calculate total changes (requires file-level analysis)
-            total_changes = self._calculate_total_changes(commits)
+            total_changes = self._calculate_total_changes(commits, commit_files)
             
             return UserStats(
                 username=username,
@@ -180,11 +196,16 @@ class UserAnalysisTool:
                 recommendations=None
             )
 
-    def _get_user_file_hotspots(self, commits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _get_user_file_hotspots(
+        self,
+        commits: List[Dict[str, Any]],
+        commit_files: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> List[Dict[str, Any]]:
         """Identify files this user modifies most frequently.
         
         Args:
             commits: User's commits
+            commit_files: Changed files per commit hash, fetched up front
             
         Returns:
             List of files with change counts, sorted by frequency
@@ -269,17 +290,15 @@ class UserAnalysisTool:
         
         for commit in commits:
             # Get files changed in this commit
-            files_response = self.git_tool.get_commit_files(commit['hash'])
-            if files_response.success and files_response.data:
-                for file_change in files_response.data:
-                    filename = file_change['filename']
-                    
-                    # Skip excluded files/directories
-                    if self._should_exclude_file(filename, excluded_patterns):
-                        continue
-                    
-                    file_counts[filename]['count'] += 1
-                    file_counts[filename]['total_changes'] += file_change['total_changes']
+            for file_change in self._get_commit_files(commit['hash'], commit_files):
+                filename = file_change['filename']
+                
+                # Skip excluded files/directories
+                if self._should_exclude_file(filename, excluded_patterns):
+                    continue
+                
+                file_counts[filename]['count'] += 1
+                file_counts[filename]['total_changes'] += file_change['total_changes']
         
         # Sort by frequency and return top 10
         sorted_files = sorted(
@@ -373,11 +392,16 @@ class UserAnalysisTool:
         
         return common_patterns[:5]  # Return top 5 patterns
 
-    def _calculate_total_changes(self, commits: List[Dict[str, Any]]) -> int:
+    def _calculate_total_changes(
+        self,
+        commits: List[Dict[str, Any]],
+        commit_files: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> int:
         """Calculate total lines changed by user across all commits.
         
         Args:
             commits: User's commits
+            commit_files: Changed files per commit hash, fetched up front
             
         Returns:
             Total number of lines added + deleted
@@ -385,13 +409,33 @@ class UserAnalysisTool:
         total_changes = 0
         
         for commit in commits:
-            files_response = self.git_tool.get_commit_files(commit['hash'])
-            if files_response.success and files_response.data:
-                for file_change in files_response.data:
-                    total_changes += file_change['total_changes']
+            for file_change in self._get_commit_files(commit['hash'], commit_files):
+                total_changes += file_change['total_changes']
         
         return total_changes
 
+    def _get_commit_files(
+        self,
+        commit_hash: str,
+        commit_files: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get a commit's changed files, from commit_files when it has them.
+        
+        Args:
+            commit_hash: Hash of the commit
+            commit_files: Changed files per commit hash, fetched up front
+            
+        Returns:
+            List of file changes, empty if git could not provide them
+        """
+        if commit_files is not None and commit_hash in commit_files:
+            return commit_files[commit_hash]
+        
+        files_response = self.git_tool.get_commit_files(commit_hash)
+        if files_response.success and isinstance(files_response.data, list):
+            return files_response.data
+        return []
+
     def generate_user_recommendations(
         self, 
         user_stats: UserStats, 
@@ -1,6 +1,7 @@
 """LangGraph workflow definition for Git Batch Analyzer."""
 
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List
 from langgraph.graph import StateGraph, END
 
 from ..types import AnalysisState
@@ -14,7 +15,8 @@ from .nodes import (
     tables_node,
     exec_summary_node,
     org_trend_node,
-    assembler_node
+    assembler_node,
+    _clone_filter
 )
 
 
@@ -26,12 +28,13 @@ def create_workflow():
     2. collect_node: Gather merge commits and branch data
     3. metrics_node: Calculate PR metrics and aggregations
     4. stale_node: Identify stale branches
-    5. user_analysis_node: Analyze user commit patterns and generate recommendations
-    6. commit_quality_node: Analyze commit message quality vs actual changes
-    7. tables_node: Generate markdown tables including user statistics
-    8. exec_summary_node: Generate LLM executive summary (if enabled)
-    9. org_trend_node: Generate LLM organizational trends (if enabled)
-    10. assembler_node: Combine all sections into final report
+    5. analysis: Run these independent, LLM-bound nodes concurrently:
+       - user_analysis_node: Analyze user commit patterns and generate recommendations
+       - commit_quality_node: Analyze commit message quality vs actual changes
+       - exec_summary_node: Generate LLM executive summary (if enabled)
+       - org_trend_node: Generate LLM organizational trends (if enabled)
+    6. tables_node: Generate markdown tables including user statistics
+    7. assembler_node: Combine all sections into final report
     
     Returns:
         Compiled LangGraph workflow ready for execution
@@ -44,11 +47,10 @@ def create_workflow():
     workflow.add_node("collect", collect_node)
     workflow.add_node("metrics", metrics_node)
     workflow.add_node("stale", stale_node)
-    workflow.add_node("user_analysis", user_analysis_node)
-    workflow.add_node("commit_quality", commit_quality_node)
+    workflow.add_node("analysis", _run_concurrently(
+        user_analysis_node, commit_quality_node, exec_summary_node, org_trend_node
+    ))
     workflow.add_node("tables", tables_node)
-    workflow.add_node("exec_summary", exec_summary_node)
-    workflow.add_node("org_trend", org_trend_node)
     workflow.add_node("assembler", assembler_node)
     
     # Set entry point
@@ -86,23 +88,14 @@ def create_workflow():
         "stale",
         _should_continue_after_stale,
         {
-            "continue": "user_analysis",
+            "continue": "analysis",
             "end": END
         }
     )
     
     workflow.add_conditional_edges(
-        "user_analysis",
-        _should_continue_after_user_analysis,
-        {
-            "continue": "commit_quality",
-            "end": END
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "commit_quality",
-        _should_continue_after_commit_quality,
+        "analysis",
+        _should_continue_after_analysis,
         {
             "continue": "tables",
             "end": END
@@ -112,24 +105,6 @@ def create_workflow():
     workflow.add_conditional_edges(
         "tables",
         _should_continue_after_tables,
-        {
-            "continue": "exec_summary",
-            "end": END
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "exec_summary",
-        _should_continue_after_exec_summary,
-        {
-            "continue": "org_trend",
-            "end": END
-        }
-    )
-    
-    workflow.add_conditional_edges(
-        "org_trend",
-        _should_continue_after_org_trend,
         {
             "continue": "assembler",
             "end": END
@@ -143,6 +118,33 @@ def create_workflow():
     return workflow.compile()
 
 
+def _run_concurrently(
+    *nodes: Callable[[AnalysisState], Dict[str, Any]]
+) -> Callable[[AnalysisState], Dict[str, Any]]:
+    """Combine independent nodes into one node that runs them in threads.
+    
+    The nodes are LLM-bound and read only what earlier nodes produced, so
+    their round trips can overlap. Updates are merged in the order given;
+    every node appends to the same state["errors"] list.
+    
+    Args:
+        nodes: Nodes that do not read each other's output
+        
+    Returns:
+        Node function returning the merged updates
+    """
+    def concurrent_node(state: AnalysisState) -> Dict[str, Any]:
+        with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+            results = list(executor.map(lambda node: node(state), nodes))
+        
+        update: Dict[str, Any] = {}
+        for result in results:
+            update.update(result)
+        return update
+    
+    return concurrent_node
+
+
 def _should_continue_after_sync(state: AnalysisState) -> str:
     """Determine if workflow should continue after sync node.
     
@@ -203,76 +205,37 @@ def _should_continue_after_stale(state: AnalysisState) -> str:
         return "end"
 
 
-def _should_continue_after_tables(state: AnalysisState) -> str:
-    """Determine if workflow should continue after tables node.
+def _should_continue_after_analysis(state: AnalysisState) -> str:
+    """Determine if workflow should continue after the concurrent analysis nodes.
     
     Args:
         state: Current analysis state
         
     Returns:
-        "continue" if tables generation was successful, "end" if it failed
+        "continue" if user analysis, commit quality, exec summary and org
+        trends all succeeded, "end" if any of them failed
     """
-    if state.get("tables_completed", False):
+    if all(state.get(flag, False) for flag in (
+        "user_analysis_completed",
+        "commit_quality_completed",
+        "exec_summary_completed",
+        "org_trend_completed",
+    )):
         return "continue"
     else:
         return "end"
 
 
-def _should_continue_after_exec_summary(state: AnalysisState) -> str:
-    """Determine if workflow should continue after exec_summary node.
-    
-    Args:
-        state: Current analysis state
-        
-    Returns:
-        "continue" if exec summary was successful, "end" if it failed
-    """
-    if state.get("exec_summary_completed", False):
-        return "continue"
-    else:
-        return "end"
-
-
-def _should_continue_after_user_analysis(state: AnalysisState) -> str:
-    """Determine if workflow should continue after user_analysis node.
-    
-    Args:
-        state: Current analysis state
-        
-    Returns:
-        "continue" if user analysis was successful, "end" if it failed
-    """
-    if state.get("user_analysis_completed", False):
-        return "continue"
-    else:
-        return "end"
-
-
-def _should_continue_after_commit_quality(state: AnalysisState) -> str:
-    """Determine if workflow should continue after commit_quality node.
-    
-    Args:
-        state: Current analysis state
-        
-    Returns:
-        "continue" if commit quality analysis was successful, "end" if it failed
-    """
-    if state.get("commit_quality_completed", False):
-        return "continue"
-    else:
-        return "end"
-
-
-def _should_continue_after_org_trend(state: AnalysisState) -> str:
-    """Determine if workflow should continue after org_trend node.
+def _should_continue_after_tables(state: AnalysisState) -> str:
+    """Determine if workflow should continue after tables node.
     
     Args:
         state: Current analysis state
         
     Returns:
-        "continue" if org trend analysis was successful, "end" if it failed
+        "continue" if tables generation was successful, "end" if it failed
     """
-    if state.get("org_trend_completed", False):
+    if state.get("tables_completed", False):
         return "continue"
     else:
         return "end"
@@ -412,30 +375,36 @@ def _process_single_repository(
         if not real_branches:
             real_branches = ["main", "master", "develop"]
         
-        # Clone repository if it doesn't exist
-        if not cache_path.exists():
-            # If we have multiple branches to analyze, do a full clone
-            # Otherwise, use shallow clone for efficiency
-            clone_depth = 0 if len(real_branches) > 1 else 1
-            
-            clone_response = git_tool.clone(repository_url, depth=clone_depth)
-            if not clone_response.success:
-                results["failed_repositories"].append({
-                    "name": repository_name,
-                    "url": repository_url,
-                    "branch": "all",
-                    "errors": [f"Failed to clone repository: {clone_response.error}"]
-                })
-                return results
+        # If we have multiple branches to analyze, do a full clone
+        # Otherwise, use shallow clone for efficiency
+        clone_depth = 0 if len(real_branches) > 1 else 1
+        
+        # Reuse an existing clone of this repository, otherwise clone it
+        clone_response = git_tool.incremental_update(
+            repository_url,
+            depth=clone_depth,
+            filter_spec=_clone_filter(config),
+            since_days=config.get("period_days", 7)
+        )
+        if not clone_response.success:
+            results["failed_repositories"].append({
+                "name": repository_name,
+                "url": repository_url,
+                "branch": "all",
+                "errors": [f"Failed to clone repository: {clone_response.error}"]
+            })
+            return results
         
         # First, fetch all remote branches to make them available locally
-        fetch_all_response = git_tool._run_git_command(["fetch", "origin", "--prune"])
+        # (an incremental update has already fetched origin with --prune)
+        if (clone_response.data or {}).get("incremental"):
+            fetch_all_response = clone_response
+        else:
+            fetch_all_response = git_tool._run_git_command(["fetch", "origin", "--prune"])
         if not fetch_all_response.success:
-            # Try fetching each branch individually as fallback
-            for branch in real_branches:
-                fetch_response = git_tool._run_git_command(["fetch", "origin", branch])
-                if not fetch_response.success:
-                    pass  # Silently continue, checkout will handle missing branches
+            # Try fetching the branches explicitly as fallback; checkout will
+            # handle any branch that is still missing
+            git_tool.fetch_branches(real_branches)
         
         # Analyze each branch separately
         for branch in real_branches:
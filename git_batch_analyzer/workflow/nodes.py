@@ -2,16 +2,87 @@
 
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from ..types import AnalysisState, BranchInfo, PRMetrics
 from ..tools.git_tool import GitTool
 from ..tools.calc_tool import CalcTool
 from ..tools.md_tool import MdTool
-from ..tools.llm_tool import LLMTool
+from ..tools.llm_tool import LLMTool, MAX_REVIEW_FILE_CHARS, TRUNCATION_MARKER
 from ..tools.user_analysis_tool import UserAnalysisTool
 
 
+def _llm_cache_dir(config: Dict[str, Any]) -> Optional[Path]:
+    """Directory where LLM responses are kept across runs, beside the clones.
+    
+    Responses sampled above temperature 0 differ from run to run, so they are
+    only kept when ``llm.cache_nondeterministic`` is set.
+    """
+    llm_config = config.get("llm") or {}
+    if llm_config.get("temperature", 0.7) > 0 and not llm_config.get(
+        "cache_nondeterministic", False
+    ):
+        return None
+    cache_dir = config.get("cache_dir")
+    return Path(cache_dir).expanduser() / ".llm-responses" if cache_dir else None
+
+
+def _clone_filter(config: Dict[str, Any]) -> Optional[str]:
+    """Partial clone filter for new clones, if partial_clone is enabled."""
+    return "blob:none" if config.get("partial_clone", False) else None
+
+
+def _read_review_file(path: Path) -> str:
+    """Read a source file for code review, skipping the middle of large files.
+    
+    Only the head and tail of a long file survive LLMTool's truncation, so for
+    files that are certainly too long just those parts are read.
+    """
+    # A UTF-8 character takes at most 4 bytes, so smaller files may fit whole
+    size = path.stat().st_size
+    if size <= MAX_REVIEW_FILE_CHARS * 4:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    half = MAX_REVIEW_FILE_CHARS // 2
+    with open(path, 'r', encoding='utf-8') as f:
+        head = f.read(half)
+    with open(path, 'rb') as f:
+        f.seek(size - half * 4)
+        # The seek may land inside a character; drop its partial bytes
+        tail = f.read().decode('utf-8', errors='ignore')
+    tail = tail.replace('\r\n', '\n').replace('\r', '\n')[-half:]
+    return f"{head}{TRUNCATION_MARKER}{tail}"
+
+
+def _read_top_files(repo_path: Path, user_stats: Dict[str, Any]) -> Dict[str, str]:
+    """Read a developer's top modified files for code review.
+    
+    Args:
+        repo_path: Path to the cloned repository
+        user_stats: UserStats.to_dict() entry with the developer's top files
+        
+    Returns:
+        Filename to content mapping; files that are missing or unreadable
+        map to an empty string
+    """
+    file_contents = {}
+    for file_info in user_stats.get('top_files', [])[:3]:
+        filename = file_info.get('filename')
+        if filename:
+            full_file_path = repo_path / filename
+            if full_file_path.exists() and full_file_path.is_file():
+                try:
+                    file_contents[filename] = _read_review_file(full_file_path)
+                except Exception as file_read_e:
+                    print(f"Error reading file {full_file_path}: {file_read_e}")
+                    file_contents[filename] = "" # Add empty content if read fails
+            else:
+                print(f"File not found or not a file: {full_file_path}")
+                file_contents[filename] = "" # Add empty content if file not found
+    return file_contents
+
+
 def sync_node(state: AnalysisState) -> Dict[str, Any]:
     """Node for repository cloning and fetching.
     
@@ -34,7 +105,9 @@ def sync_node(state: AnalysisState) -> Dict[str, Any]:
         if not state["cache_path"].exists():
             clone_response = git_tool.clone(
                 state["repository_url"], 
-                depth=config.get("fetch_depth", 200)
+                depth=config.get("fetch_depth", 200),
+                filter_spec=_clone_filter(config),
+                since_days=config.get("period_days", 7)
             )
             if not clone_response.success:
                 state["errors"].append(f"Failed to clone repository: {clone_response.error}")
@@ -91,13 +164,19 @@ def collect_node(state: AnalysisState) -> Dict[str, Any]:
         # Use actual_branch from sync_node instead of configured branch
         branch_to_analyze = state.get("actual_branch", state["branch"])
         
-        # Collect merge commits
-        merges_response = git_tool.log_merges(branch_to_analyze, period_days)
+        # Collect merge commits together with their diff statistics
+        merges_response = git_tool.log_merges_with_stats(
+            branch_to_analyze,
+            period_days,
+            first_parent=config.get("first_parent_merges", False),
+        )
         if not merges_response.success:
             state["errors"].append(f"Failed to collect merge commits: {merges_response.error}")
             return {"collect_completed": False, "errors": state["errors"]}
         
-        merge_commits = merges_response.data or []
+        merges_with_stats = merges_response.data or []
+        merge_commits = [entry["commit"] for entry in merges_with_stats]
+        diff_stats = [entry["diff_stats"] for entry in merges_with_stats]
         
         # Also collect ALL commits (not just merges) to check for direct pushes
         all_commits_response = git_tool.log_all_commits(branch_to_analyze, period_days)
@@ -107,16 +186,6 @@ def collect_node(state: AnalysisState) -> Dict[str, Any]:
         
         all_commits = all_commits_response.data or []
         
-        # Collect diff statistics for each merge commit
-        diff_stats = []
-        for commit in merge_commits:
-            diff_response = git_tool.diff_stats(commit["hash"])
-            if diff_response.success:
-                diff_stats.append(diff_response.data)
-            else:
-                # Log error but continue processing other commits
-                state["errors"].append(f"Failed to get diff stats for {commit['hash']}: {diff_response.error}")
-        
         # Collect branch information
         branches_response = git_tool.remote_branches()
         if not branches_response.success:
@@ -432,7 +501,8 @@ def exec_summary_node(state: AnalysisState) -> Dict[str, Any]:
                 temperature=llm_config.get("temperature", 0.7),
                 api_key=llm_config.get("api_key"),
                 base_url=llm_config.get("base_url"),
-                max_tokens=llm_config.get("max_tokens")
+                max_tokens=llm_config.get("max_tokens"),
+                cache_dir=_llm_cache_dir(config)
             )
         except Exception as e:
             state["errors"].append(f"Failed to initialize LLM tool: {str(e)}")
@@ -496,7 +566,8 @@ def org_trend_node(state: AnalysisState) -> Dict[str, Any]:
                 temperature=llm_config.get("temperature", 0.7),
                 api_key=llm_config.get("api_key"),
                 base_url=llm_config.get("base_url"),
-                max_tokens=llm_config.get("max_tokens")
+                max_tokens=llm_config.get("max_tokens"),
+                cache_dir=_llm_cache_dir(config)
             )
         except Exception as e:
             state["errors"].append(f"Failed to initialize LLM tool: {str(e)}")
@@ -728,13 +799,32 @@ def user_analysis_node(state: AnalysisState) -> Dict[str, Any]:
                     temperature=llm_config.get("temperature", 0.7),
                     api_key=llm_config.get("api_key"),
                     base_url=llm_config.get("base_url"),
-                    max_tokens=llm_config.get("max_tokens")
+                    max_tokens=llm_config.get("max_tokens"),
+                    cache_dir=_llm_cache_dir(config)
                 )
                 
-                # Generate recommendations and code review insights for each user
-                for user_stats in user_stats_list:
-                    # Generate personalized recommendations
-                    recommendations_response = llm_tool.generate_user_recommendations(user_stats)
+                # Request personalized recommendations for all users at once,
+                # optionally describing several users per request
+                users_per_prompt = llm_config.get("users_per_prompt", 1)
+                if users_per_prompt > 1:
+                    recommendations_responses = llm_tool.generate_user_recommendations_grouped(
+                        user_stats_list, users_per_prompt
+                    )
+                else:
+                    recommendations_responses = llm_tool.generate_user_recommendations_batch(
+                        user_stats_list
+                    )
+                
+                # Request code review insights for every user's top files at once
+                repo_path = state["cache_path"] # This is the path to the cloned repository
+                code_review_responses = llm_tool.generate_code_review_insights_batch(
+                    user_stats_list,
+                    [_read_top_files(repo_path, user_stats) for user_stats in user_stats_list]
+                )
+                
+                for user_stats, recommendations_response, code_review_response in zip(
+                    user_stats_list, recommendations_responses, code_review_responses
+                ):
                     if recommendations_response.success:
                         user_stats['recommendations'] = recommendations_response.data
                     else:
@@ -744,34 +834,10 @@ def user_analysis_node(state: AnalysisState) -> Dict[str, Any]:
                             "Focus on maintaining consistent development practices"
                         ]
                     
-                    # Generate code review insights for top files
-                    try:
-                        # Read file contents for top modified files
-                        file_contents = {}
-                        repo_path = state["cache_path"] # This is the path to the cloned repository
-                        for file_info in user_stats.get('top_files', [])[:3]:
-                            filename = file_info.get('filename')
-                            if filename:
-                                full_file_path = repo_path / filename
-                                if full_file_path.exists() and full_file_path.is_file():
-                                    try:
-                                        with open(full_file_path, 'r', encoding='utf-8') as f:
-                                            file_contents[filename] = f.read()
-                                    except Exception as file_read_e:
-                                        print(f"Error reading file {full_file_path}: {file_read_e}")
-                                        file_contents[filename] = "" # Add empty content if read fails
-                                else:
-                                    print(f"File not found or not a file: {full_file_path}")
-                                    file_contents[filename] = "" # Add empty content if file not found
-
-                        code_review_response = llm_tool.generate_code_review_insights(user_stats, file_contents)
-                        if code_review_response.success:
-                            user_stats['code_review_insights'] = code_review_response.data
-                        else:
-                            print(f"Code review insights failed for {user_stats.get('username', 'unknown')}: {code_review_response.error}")
-                            user_stats['code_review_insights'] = ""
-                    except Exception as e:
-                        print(f"Code review insights exception for {user_stats.get('username', 'unknown')}: {str(e)}")
+                    if code_review_response.success:
+                        user_stats['code_review_insights'] = code_review_response.data
+                    else:
+                        print(f"Code review insights failed for {user_stats.get('username', 'unknown')}: {code_review_response.error}")
                         user_stats['code_review_insights'] = ""
                             
             except Exception as e:
@@ -844,17 +910,22 @@ def commit_quality_node(state: AnalysisState) -> Dict[str, Any]:
         commits_with_diffs = []
         max_commits_to_analyze = 15  # Limit to avoid overwhelming LLM
         
-        for i, commit in enumerate(all_commits[:max_commits_to_analyze]):
-            commit_hash = commit.get('hash')
-            if not commit_hash:
-                continue
-                
-            # Get diff stats for this commit
-            diff_response = git_tool.diff_stats(commit_hash)
+        commits_to_analyze = [
+            commit for commit in all_commits[:max_commits_to_analyze] if commit.get('hash')
+        ]
+        commit_hashes = [commit['hash'] for commit in commits_to_analyze]
+        
+        # Get diff stats and changed files for all commits in parallel
+        diff_responses = git_tool.diff_stats_batch(commit_hashes)
+        files_responses = git_tool.get_commit_files_batch(commit_hashes)
+        
+        for commit in commits_to_analyze:
+            commit_hash = commit['hash']
+            
+            diff_response = diff_responses[commit_hash]
             diff_stats = diff_response.data if diff_response.success else {}
             
-            # Get files changed in this commit
-            files_response = git_tool.get_commit_files(commit_hash)
+            files_response = files_responses[commit_hash]
             files_changed = files_response.data if files_response.success else []
             
             commit_data = {
@@ -874,7 +945,8 @@ def commit_quality_node(state: AnalysisState) -> Dict[str, Any]:
                 temperature=llm_config.get("temperature", 0.7),
                 api_key=llm_config.get("api_key"),
                 base_url=llm_config.get("base_url"),
-                max_tokens=llm_config.get("max_tokens")
+                max_tokens=llm_config.get("max_tokens"),
+                cache_dir=_llm_cache_dir(config)
             )
         except Exception as e:
             state["errors"].append(f"Failed to initialize LLM tool: {str(e)}")
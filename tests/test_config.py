@@ -58,6 +58,8 @@ llm:
         assert config.llm.provider == "openai"
         assert config.llm.model == "gpt-4"
         assert config.llm.temperature == 0.5
+        assert config.llm.users_per_prompt == 1
+        assert config.llm.cache_nondeterministic is False
 
 
 def test_config_validation_errors():
@@ -102,6 +104,8 @@ repositories:
         assert config.period_days == 7
         assert config.fetch_depth == 200
         assert config.top_k_files == 10
+        assert config.first_parent_merges is False
+        assert config.partial_clone is False
         assert config.output_file == Path("report.md")
         assert config.stale_days == 7  # Should equal period_days
         assert config.llm is None
@@ -340,6 +344,30 @@ top_k_files: {value}
             
             with pytest.raises(ConfigurationError, match=expected_message):
                 load_config_from_yaml(f.name)
+    
+    # Test first_parent_merges validation
+    config_yaml = """repositories:
+  - "https://github.com/user/repo.git"
+first_parent_merges: "yes please"
+"""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        f.write(config_yaml)
+        f.flush()
+        
+        with pytest.raises(ConfigurationError, match="'first_parent_merges' must be true or false"):
+            load_config_from_yaml(f.name)
+    
+    # Test partial_clone validation
+    config_yaml = """repositories:
+  - "https://github.com/user/repo.git"
+partial_clone: 1
+"""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+        f.write(config_yaml)
+        f.flush()
+        
+        with pytest.raises(ConfigurationError, match="'partial_clone' must be true or false"):
+            load_config_from_yaml(f.name)
 
 
 def test_llm_configuration_validation():
@@ -406,6 +434,9 @@ llm:
         {"provider": "openai", "model": "gpt-4", "temperature": 2.1},
         {"provider": "unsupported", "model": "gpt-4", "temperature": 0.5},
         {"provider": "openrouter", "model": "anthropic/claude-3.5-sonnet", "temperature": 0.5},  # Missing API key
+        {"provider": "openai", "model": "gpt-4", "temperature": 0.5, "users_per_prompt": 0},
+        {"provider": "openai", "model": "gpt-4", "temperature": 0.5, "users_per_prompt": "8"},
+        {"provider": "openai", "model": "gpt-4", "temperature": 0.5, "cache_nondeterministic": "yes"},
     ]
     
     for llm_config in invalid_configs:
@@ -417,6 +448,10 @@ llm:
   model: "{llm_config['model']}"
   temperature: {llm_config['temperature']}
 """
+        if 'users_per_prompt' in llm_config:
+            config_yaml += f'  users_per_prompt: {llm_config["users_per_prompt"]!r}\n'
+        if 'cache_nondeterministic' in llm_config:
+            config_yaml += f'  cache_nondeterministic: {llm_config["cache_nondeterministic"]!r}\n'
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
             f.write(config_yaml)
             f.flush()
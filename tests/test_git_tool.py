@@ -2,9 +2,11 @@
 
 import json
 import subprocess
+import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import ANY, Mock, patch, MagicMock, call
 import pytest
 
 from git_batch_analyzer.tools.git_tool import GitTool
@@ -36,10 +38,13 @@ class TestGitTool:
         mock_run.assert_called_once_with(
             ["git", "status"],
             cwd=self.repo_path,
+            env=ANY,
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=60
         )
+        assert mock_run.call_args[1]["env"]["GIT_OPTIONAL_LOCKS"] == "0"
     
     @patch('subprocess.run')
     def test_run_git_command_failure(self, mock_run):
@@ -56,6 +61,76 @@ class TestGitTool:
         assert "Git command failed" in response.error
         assert "fatal: not a git repository" in response.error
     
+    @patch('subprocess.Popen')
+    def test_run_git_command_streaming_yields_lines(self, mock_popen):
+        """Test streaming git output line by line."""
+        proc = MagicMock()
+        proc.stdout.__iter__.return_value = iter(["line one\n", "line two\n"])
+        proc.stderr.read.return_value = ""
+        proc.wait.return_value = 0
+        proc.poll.return_value = 0
+        mock_popen.return_value = proc
+        
+        lines = list(self.git_tool._run_git_command_streaming(["log"]))
+        
+        assert lines == ["line one", "line two"]
+        assert mock_popen.call_args[0][0] == ["git", "log"]
+        assert mock_popen.call_args[1]["cwd"] == self.repo_path
+        assert mock_popen.call_args[1]["env"]["GIT_OPTIONAL_LOCKS"] == "0"
+    
+    @patch('subprocess.Popen')
+    def test_run_git_command_streaming_failure(self, mock_popen):
+        """Test streaming raises when git exits with an error."""
+        proc = MagicMock()
+        proc.stdout.__iter__.return_value = iter([])
+        proc.stderr.read.return_value = "fatal: bad revision"
+        proc.wait.return_value = 128
+        proc.returncode = 128
+        proc.poll.return_value = 128
+        mock_popen.return_value = proc
+        
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            list(self.git_tool._run_git_command_streaming(["log", "nope"]))
+        
+        assert exc_info.value.stderr == "fatal: bad revision"
+    
+    @patch('subprocess.Popen')
+    def test_run_git_command_streaming_timeout(self, mock_popen):
+        """Test streaming kills git and raises once the deadline passes."""
+        killed = threading.Event()
+
+        def stdout_lines():
+            yield "line one\n"
+            killed.wait(5)
+
+        proc = MagicMock()
+        proc.stdout.__iter__.return_value = stdout_lines()
+        proc.stderr.read.return_value = ""
+        proc.kill.side_effect = killed.set
+        proc.wait.return_value = -9
+        proc.poll.return_value = -9
+        mock_popen.return_value = proc
+        
+        with pytest.raises(subprocess.TimeoutExpired):
+            list(self.git_tool._run_git_command_streaming(["log"], timeout=0.05))
+        
+        assert killed.is_set()
+    
+    @patch.object(GitTool, '_run_git_command_streaming')
+    @patch.object(Path, 'exists')
+    def test_log_merges_git_failure(self, mock_exists, mock_stream_git):
+        """Test log_merges turns a git failure into an error response."""
+        mock_exists.return_value = True
+        mock_stream_git.side_effect = subprocess.CalledProcessError(
+            128, ["git", "log"], stderr="fatal: bad revision"
+        )
+        
+        response = self.git_tool.log_merges("missing", 7)
+        
+        assert response.success is False
+        assert "Git command failed" in response.error
+        assert "fatal: bad revision" in response.error
+    
     @patch('subprocess.run')
     @patch('shutil.rmtree')
     @patch.object(Path, 'exists')
@@ -76,14 +151,163 @@ class TestGitTool:
         assert response.data["message"] == f"Successfully cloned {url}"
         assert response.data["path"] == str(self.repo_path)
         assert response.data["depth"] == 100
+        assert response.data["filter"] is None
         
         mock_run.assert_called_once_with(
             ["git", "clone", "--depth", "100", url, str(self.repo_path)],
             capture_output=True,
             text=True,
-            check=True
+            check=True,
+            timeout=300
         )
     
+    def test_clone_replaces_existing_directory(self):
+        """Test that an existing clone is moved aside and deleted in the background."""
+        from git_batch_analyzer.tools import git_tool as git_tool_module
+
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_path = Path(tmp) / "repo"
+            (repo_path / ".git").mkdir(parents=True)
+            (repo_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+
+            with patch('subprocess.run') as mock_run:
+                response = GitTool(repo_path).clone("https://github.com/test/repo.git", depth=1)
+
+            assert response.success is True
+            assert not repo_path.exists()
+            mock_run.assert_called_once()
+
+            git_tool_module._join_pending_deletes()
+            assert list(Path(tmp).iterdir()) == []
+
+    @patch.object(GitTool, 'clone')
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'is_dir')
+    def test_incremental_update_reuses_existing_clone(self, mock_is_dir, mock_run_git, mock_clone):
+        """Test that an existing clone of the same URL is fetched instead of re-cloned."""
+        url = "https://github.com/test/repo.git"
+        mock_is_dir.return_value = True
+        mock_run_git.side_effect = [
+            ToolResponse.success_response(url),
+            ToolResponse.success_response("true"),
+            ToolResponse.success_response(""),
+        ]
+
+        response = self.git_tool.incremental_update(url, depth=50)
+
+        assert response.success is True
+        assert response.data["incremental"] is True
+        mock_run_git.assert_called_with(["fetch", "--prune", "origin", "--depth", "50"])
+        mock_clone.assert_not_called()
+
+    @patch.object(GitTool, 'clone')
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'is_dir')
+    def test_incremental_update_keeps_full_clone_full(self, mock_is_dir, mock_run_git, mock_clone):
+        """Test that a shallow run does not make an existing full clone shallow."""
+        url = "https://github.com/test/repo.git"
+        mock_is_dir.return_value = True
+        mock_run_git.side_effect = [
+            ToolResponse.success_response(url),
+            ToolResponse.success_response("false"),
+            ToolResponse.success_response(""),
+        ]
+
+        response = self.git_tool.incremental_update(url, depth=1, since_days=7)
+
+        assert response.data["incremental"] is True
+        mock_run_git.assert_called_with(["fetch", "--prune", "origin"])
+
+    @patch.object(GitTool, 'clone')
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'is_dir')
+    def test_incremental_update_unshallows_for_full_history(
+        self, mock_is_dir, mock_run_git, mock_clone
+    ):
+        """Test that a full-history run deepens a clone an earlier run left shallow."""
+        url = "https://github.com/test/repo.git"
+        mock_is_dir.return_value = True
+        mock_run_git.side_effect = [
+            ToolResponse.success_response(url),
+            ToolResponse.success_response("true"),
+            ToolResponse.success_response(""),
+        ]
+
+        response = self.git_tool.incremental_update(url, depth=0)
+
+        assert response.data["incremental"] is True
+        mock_run_git.assert_called_with(["fetch", "--prune", "origin", "--unshallow"])
+
+    @patch.object(GitTool, 'clone')
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'is_dir')
+    def test_incremental_update_reclones_other_remote(self, mock_is_dir, mock_run_git, mock_clone):
+        """Test that a clone of a different URL is replaced by a fresh clone."""
+        url = "https://github.com/test/repo.git"
+        mock_is_dir.return_value = True
+        mock_run_git.return_value = ToolResponse.success_response("https://github.com/other/repo.git")
+        mock_clone.return_value = ToolResponse.success_response({"message": "cloned"})
+
+        response = self.git_tool.incremental_update(url, depth=50, since_days=7)
+
+        assert response.success is True
+        assert response.data["incremental"] is False
+        mock_clone.assert_called_once_with(url, depth=50, filter_spec=None, since_days=7)
+
+    @patch('subprocess.run')
+    @patch.object(Path, 'exists')
+    @patch.object(Path, 'mkdir')
+    def test_clone_partial_with_filter(self, mock_mkdir, mock_exists, mock_run):
+        """Test that a partial clone filter is passed through when requested."""
+        mock_exists.return_value = False
+        mock_run.return_value = Mock(stdout="", returncode=0)
+        
+        url = "https://github.com/test/repo.git"
+        response = self.git_tool.clone(url, depth=0, filter_spec="blob:none")
+        
+        assert response.success is True
+        assert response.data["filter"] == "blob:none"
+        assert mock_run.call_args[0][0] == [
+            "git", "clone", "--filter=blob:none", url, str(self.repo_path)
+        ]
+    
+    @patch('subprocess.run')
+    @patch.object(Path, 'exists')
+    @patch.object(Path, 'mkdir')
+    def test_clone_shallow_since(self, mock_mkdir, mock_exists, mock_run):
+        """Test shallow clone bounded by the analysis window."""
+        mock_exists.return_value = False
+        mock_run.return_value = Mock(stdout="", returncode=0)
+        
+        url = "https://github.com/test/repo.git"
+        response = self.git_tool.clone(url, depth=100, since_days=7)
+        
+        assert response.success is True
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            "git", "clone", "--shallow-since=14 days ago",
+            url, str(self.repo_path)
+        ]
+    
+    @patch('subprocess.run')
+    @patch.object(Path, 'exists')
+    @patch.object(Path, 'mkdir')
+    def test_clone_shallow_since_falls_back_to_depth(self, mock_mkdir, mock_exists, mock_run):
+        """Test fallback to depth-based clone when shallow-since is rejected."""
+        mock_exists.return_value = False
+        error = subprocess.CalledProcessError(128, ["git", "clone"])
+        error.stderr = "fatal: Server does not support --shallow-since"
+        mock_run.side_effect = [error, Mock(stdout="", returncode=0)]
+        
+        url = "https://github.com/test/repo.git"
+        response = self.git_tool.clone(url, depth=100, since_days=7)
+        
+        assert response.success is True
+        assert mock_run.call_count == 2
+        assert mock_run.call_args[0][0] == [
+            "git", "clone", "--depth", "100", url, str(self.repo_path)
+        ]
+    
     @patch('subprocess.run')
     def test_clone_failure(self, mock_run):
         """Test repository cloning failure."""
@@ -114,12 +338,44 @@ class TestGitTool:
         
         # Verify the sequence of git commands called
         expected_calls = [
-            call(["fetch", "origin"]),
-            call(["rev-parse", "--verify", "main"]),
-            call(["checkout", "main"]),
-            call(["pull", "origin", "main"])
+            call(["fetch", "--all"]),
+            call(["checkout", "-B", "main", "origin/main"])
         ]
-        mock_run_git.assert_has_calls(expected_calls)
+        assert mock_run_git.call_args_list == expected_calls
+    
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'exists')
+    def test_fetch_branch_missing_on_remote(self, mock_exists, mock_run_git):
+        """Test that fetch falls back to the local branch when origin lacks it."""
+        mock_exists.return_value = True
+        
+        def run_git(args):
+            if "origin/local-only" in args and args[0] != "reset":
+                return ToolResponse.error_response("not a commit")
+            if args[0] == "reset":
+                return ToolResponse.error_response("unknown revision")
+            return ToolResponse.success_response("")
+        
+        mock_run_git.side_effect = run_git
+        
+        response = self.git_tool.fetch("local-only")
+        
+        assert response.success is True
+        assert call(["rev-parse", "--verify", "local-only"]) in mock_run_git.call_args_list
+        assert call(["checkout", "local-only"]) in mock_run_git.call_args_list
+    
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'exists')
+    def test_fetch_skips_recent_fetch(self, mock_exists, mock_run_git):
+        """Test that a fetch right after another one does not contact the remote again."""
+        mock_exists.return_value = True
+        mock_run_git.return_value = ToolResponse.success_response("")
+        
+        assert self.git_tool.fetch().success is True
+        assert self.git_tool.fetch("main").success is True
+        
+        fetch_calls = [c for c in mock_run_git.call_args_list if c.args[0][0] == "fetch"]
+        assert fetch_calls == [call(["fetch", "--all"])]
     
     @patch.object(Path, 'exists')
     def test_fetch_repo_not_exists(self, mock_exists):
@@ -131,7 +387,7 @@ class TestGitTool:
         assert response.success is False
         assert "Repository path does not exist" in response.error
     
-    @patch.object(GitTool, '_run_git_command')
+    @patch.object(GitTool, '_run_git_command_streaming')
     @patch.object(Path, 'exists')
     def test_log_merges_success(self, mock_exists, mock_run_git):
         """Test successful merge commit retrieval."""
@@ -139,10 +395,10 @@ class TestGitTool:
         
         # Mock git log output
         git_output = (
-            "abc123|1640995200|Merge pull request #1|def456 ghi789|John Doe\n"
-            "xyz789|1640908800|Merge branch 'feature'|jkl012 mno345|Jane Smith"
+            "abc123\x001640995200\x00Merge pull request #1\x00def456 ghi789\x00John Doe\n"
+            "xyz789\x001640908800\x00Merge branch 'feature' | hotfix\x00jkl012 mno345\x00Jane Smith"
         )
-        mock_run_git.return_value = ToolResponse.success_response(git_output)
+        mock_run_git.return_value = iter(git_output.split("\n"))
         
         response = self.git_tool.log_merges("main", 7)
         
@@ -156,8 +412,13 @@ class TestGitTool:
         assert first_commit["parents"] == ["def456", "ghi789"]
         assert first_commit["author"] == "John Doe"
         
+        # "|" in the subject no longer shifts the following fields
+        second_commit = response.data[1]
+        assert second_commit["message"] == "Merge branch 'feature' | hotfix"
+        assert second_commit["parents"] == ["jkl012", "mno345"]
+        
         # Verify git command (now uses local branch instead of origin/branch)
-        expected_format = "%H|%ct|%s|%P|%an"
+        expected_format = "%H%x00%ct%x00%s%x00%P%x00%an"
         mock_run_git.assert_called_once_with([
             "log",
             "--since=7 days ago",
@@ -166,18 +427,110 @@ class TestGitTool:
             "main"
         ])
     
-    @patch.object(GitTool, '_run_git_command')
+    @patch.object(GitTool, '_run_git_command_streaming')
+    @patch.object(Path, 'exists')
+    def test_log_merges_selected_fields(self, mock_exists, mock_stream_git):
+        """Test that log_merges only asks git for the requested fields."""
+        mock_exists.return_value = True
+        mock_stream_git.return_value = iter(["1640995200\x00def456 ghi789", ""])
+        
+        response = self.git_tool.log_merges(
+            "main", 7, fields=frozenset({"parents", "timestamp"})
+        )
+        
+        assert response.success is True
+        assert response.data == [{
+            "timestamp": "2022-01-01T00:00:00+00:00",
+            "parents": ["def456", "ghi789"],
+        }]
+        args = mock_stream_git.call_args[0][0]
+        assert "--format=%ct%x00%P" in args
+    
+    @patch.object(GitTool, '_run_git_command_streaming')
+    @patch.object(Path, 'exists')
+    def test_log_merges_first_parent(self, mock_exists, mock_stream_git):
+        """Test that first_parent limits the merge walk to the branch's own history."""
+        mock_exists.return_value = True
+        mock_stream_git.side_effect = lambda args: iter([])
+        
+        self.git_tool.log_merges("main", 7)
+        assert "--first-parent" not in mock_stream_git.call_args[0][0]
+        
+        self.git_tool.log_merges("main", 7, first_parent=True)
+        assert "--first-parent" in mock_stream_git.call_args[0][0]
+        
+        self.git_tool.log_merges("main", 7, fields=frozenset({"author"}), first_parent=True)
+        assert "--first-parent" in mock_stream_git.call_args[0][0]
+        
+        self.git_tool.log_merges_with_stats("main", 7, first_parent=True)
+        assert "--first-parent" in mock_stream_git.call_args[0][0]
+    
+    @patch.object(Path, 'exists')
+    def test_log_merges_unknown_field(self, mock_exists):
+        """Test that unknown fields are rejected."""
+        mock_exists.return_value = True
+        
+        response = self.git_tool.log_merges("main", 7, fields=frozenset({"hash", "branch"}))
+        
+        assert response.success is False
+        assert "branch" in response.error
+    
+    @patch.object(GitTool, '_run_git_command_streaming')
     @patch.object(Path, 'exists')
     def test_log_merges_empty_result(self, mock_exists, mock_run_git):
         """Test merge commit retrieval with no results."""
         mock_exists.return_value = True
-        mock_run_git.return_value = ToolResponse.success_response("")
+        mock_run_git.return_value = iter([])
         
         response = self.git_tool.log_merges("main", 7)
         
         assert response.success is True
         assert response.data == []
     
+    @patch.object(GitTool, '_run_git_command_streaming')
+    @patch.object(Path, 'exists')
+    def test_log_merges_with_stats_success(self, mock_exists, mock_run_git):
+        """Test merge commits and diff stats are parsed from a single git log."""
+        mock_exists.return_value = True
+        
+        # Mock git log --merges --numstat output
+        git_output = (
+            "__COMMIT__\x00abc123\x001640995200\x00Merge pull request #1\x00def456 ghi789\x00John Doe\n"
+            "\n"
+            "10\t5\tfile1.py\n"
+            "-\t-\timage.png\n"
+            "7\t1\tnode_modules/lib.js\n"
+            "__COMMIT__\x00xyz789\x001640908800\x00Merge branch 'feature'\x00jkl012 mno345\x00Jane Smith"
+        )
+        mock_run_git.return_value = iter(git_output.split("\n"))
+        
+        response = self.git_tool.log_merges_with_stats("main", 7)
+        
+        assert response.success is True
+        assert len(response.data) == 2
+        
+        first = response.data[0]
+        assert first["commit"]["hash"] == "abc123"
+        assert first["commit"]["parents"] == ["def456", "ghi789"]
+        assert first["commit"]["author"] == "John Doe"
+        assert first["diff_stats"] == {
+            "files_changed": 2,
+            "insertions": 10,
+            "deletions": 5,
+            "total_changes": 15,
+        }
+        
+        second = response.data[1]
+        assert second["commit"]["message"] == "Merge branch 'feature'"
+        assert second["diff_stats"]["files_changed"] == 0
+        
+        # Only one git process for all merges
+        mock_run_git.assert_called_once()
+        args = mock_run_git.call_args[0][0]
+        assert "--merges" in args
+        assert "--numstat" in args
+        assert args[-1] == "main"
+    
     @patch.object(GitTool, '_run_git_command')
     @patch.object(Path, 'exists')
     def test_diff_stats_success(self, mock_exists, mock_run_git):
@@ -200,9 +553,12 @@ class TestGitTool:
         assert response.data["deletions"] == 23   # 5 + 15 + 3
         assert response.data["total_changes"] == 53  # 30 + 23
         
-        mock_run_git.assert_called_once_with([
-            "show", "--numstat", "--format=", "abc123"
-        ])
+        mock_run_git.assert_called_once()
+        args = mock_run_git.call_args[0][0]
+        assert args[:6] == [
+            "show", "--numstat", "--format=", "--diff-merges=first-parent", "abc123", "--"
+        ]
+        assert ":(exclude,glob)node_modules/**" in args
     
     @patch.object(GitTool, '_run_git_command')
     @patch.object(Path, 'exists')
@@ -226,19 +582,21 @@ class TestGitTool:
         assert response.data["deletions"] == 20     # 5 + 15 (binary file ignored)
         assert response.data["total_changes"] == 50
     
+    @patch.object(GitTool, '_run_git_command_streaming')
     @patch.object(GitTool, '_run_git_command')
     @patch.object(Path, 'exists')
-    def test_remote_branches_success(self, mock_exists, mock_run_git):
+    def test_remote_branches_success(self, mock_exists, mock_run_git, mock_stream_git):
         """Test successful remote branches retrieval."""
         mock_exists.return_value = True
         
         # Mock git for-each-ref output
         git_output = (
-            "abc123|1640995200|origin/main\n"
-            "def456|1640908800|origin/feature-branch\n"
-            "ghi789|1640822400|origin/develop"
+            "abc123\x001640995200\x00origin/main\n"
+            "def456\x001640908800\x00origin/feature-branch\n"
+            "ghi789\x001640822400\x00origin/develop"
         )
-        mock_run_git.return_value = ToolResponse.success_response(git_output)
+        mock_run_git.return_value = ToolResponse.success_response("")
+        mock_stream_git.return_value = iter(git_output.split("\n"))
         
         response = self.git_tool.remote_branches()
         
@@ -255,25 +613,30 @@ class TestGitTool:
         assert second_branch["name"] == "feature-branch"
         assert second_branch["last_commit_hash"] == "def456"
         
-        mock_run_git.assert_called_once_with([
+        mock_stream_git.assert_called_once_with([
             "for-each-ref",
-            "--format=%(objectname)|%(committerdate:unix)|%(refname:short)",
+            "--sort=-committerdate",
+            "--format=%(if)%(symref)%(then)%(else)"
+            "%(objectname)%00%(committerdate:unix)%00%(refname:short)%(end)",
+            "refs/heads",
             "refs/remotes/origin"
         ])
     
+    @patch.object(GitTool, '_run_git_command_streaming')
     @patch.object(GitTool, '_run_git_command')
     @patch.object(Path, 'exists')
-    def test_remote_branches_filters_head(self, mock_exists, mock_run_git):
+    def test_remote_branches_filters_head(self, mock_exists, mock_run_git, mock_stream_git):
         """Test that remote branches filters out HEAD reference."""
         mock_exists.return_value = True
         
         # Mock git for-each-ref output including HEAD
         git_output = (
-            "abc123|1640995200|origin/main\n"
-            "abc123|1640995200|origin/HEAD\n"
-            "def456|1640908800|origin/feature-branch"
+            "abc123\x001640995200\x00origin/main\n"
+            "abc123\x001640995200\x00origin/HEAD\n"
+            "def456\x001640908800\x00origin/feature-branch"
         )
-        mock_run_git.return_value = ToolResponse.success_response(git_output)
+        mock_run_git.return_value = ToolResponse.success_response("")
+        mock_stream_git.return_value = iter(git_output.split("\n"))
         
         response = self.git_tool.remote_branches()
         
@@ -285,6 +648,265 @@ class TestGitTool:
         assert "feature-branch" in branch_names
         assert "HEAD" not in branch_names
     
+    @patch.object(GitTool, '_run_git_command_streaming')
+    @patch.object(Path, 'exists')
+    def test_branch_refs_keeps_branches_ending_in_head(self, mock_exists, mock_stream_git):
+        """Test that only symbolic refs, which git prints as empty lines, are dropped."""
+        mock_exists.return_value = True
+        mock_stream_git.return_value = iter([
+            "abc123\x001640995200\x00origin/main",
+            "",
+            "def456\x001640908800\x00origin/release/HEAD",
+        ])
+        
+        response = self.git_tool._branch_refs()
+        
+        assert response.success is True
+        assert [branch["name"] for branch in response.data] == ["main", "release/HEAD"]
+        format_arg = mock_stream_git.call_args.args[0][2]
+        assert format_arg.startswith("--format=%(if)%(symref)")
+    
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'exists')
+    def test_get_default_branch_is_cached(self, mock_exists, mock_run_git):
+        """Test the default branch is only looked up once per instance."""
+        mock_exists.return_value = True
+        mock_run_git.return_value = ToolResponse.success_response("refs/remotes/origin/develop")
+        
+        first = self.git_tool.get_default_branch()
+        second = self.git_tool.get_default_branch()
+        
+        assert first.data == "develop"
+        assert second.data == "develop"
+        mock_run_git.assert_called_once_with(["symbolic-ref", "refs/remotes/origin/HEAD"])
+    
+    @patch.object(GitTool, '_run_git_command_streaming')
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'exists')
+    def test_remote_branches_reuses_remote_lookups(self, mock_exists, mock_run_git, mock_stream_git):
+        """Test remote URL and ls-remote output are reused between calls."""
+        mock_exists.return_value = True
+        
+        def mock_git_command(args):
+            if args[0] == "config":
+                return ToolResponse.success_response("https://github.com/test/repo.git")
+            if args[0] == "ls-remote":
+                return ToolResponse.success_response("abc123\trefs/heads/main")
+            return ToolResponse.success_response("")
+        
+        mock_run_git.side_effect = mock_git_command
+        mock_stream_git.side_effect = lambda args: iter(["abc123\x001640995200\x00origin/main"])
+        
+        self.git_tool.remote_branches()
+        self.git_tool.remote_branches()
+        
+        commands = [c[0][0][0] for c in mock_run_git.call_args_list]
+        assert commands.count("config") == 1
+        assert commands.count("ls-remote") == 1
+        assert mock_stream_git.call_count == 2
+    
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'exists')
+    def test_numstat_is_cached_per_commit_hash(self, mock_exists, mock_run_git):
+        """Test that full commit hashes are looked up once, refs every time."""
+        mock_exists.return_value = True
+        mock_run_git.return_value = ToolResponse.success_response("15\t8\tsrc/main.py")
+        commit_hash = "a" * 40
+        
+        stats = self.git_tool.diff_stats(commit_hash)
+        files = self.git_tool.get_commit_files(commit_hash)
+        
+        assert stats.data["total_changes"] == 23
+        assert files.data[0]["filename"] == "src/main.py"
+        assert mock_run_git.call_count == 1
+        
+        self.git_tool.diff_stats("HEAD")
+        self.git_tool.diff_stats("HEAD")
+        assert mock_run_git.call_count == 3
+    
+    @patch.object(GitTool, 'diff_stats')
+    def test_diff_stats_batch(self, mock_diff_stats):
+        """Test that batch diff stats are keyed by commit hash."""
+        mock_diff_stats.side_effect = lambda commit_hash: ToolResponse.success_response(
+            {"hash": commit_hash}
+        )
+
+        results = self.git_tool.diff_stats_batch(["abc", "def", "abc"])
+
+        assert list(results) == ["abc", "def"]
+        assert results["def"].data == {"hash": "def"}
+        assert mock_diff_stats.call_count == 2
+
+    def test_diff_tree_pool_survives_all_workers_dying(self):
+        """Test that threads waiting on a full pool are not stranded when workers die."""
+        from concurrent.futures import ThreadPoolExecutor
+        from git_batch_analyzer.tools.git_tool import GitDiffTreeWorkerPool
+
+        def dead_worker(pool):
+            proc = MagicMock()
+            proc.stdout.readline.return_value = ""  # exited, e.g. on an unknown option
+            return proc
+
+        def numstat(pool):
+            try:
+                return pool.numstat("a" * 40)
+            except OSError:
+                return None
+
+        with patch.object(GitDiffTreeWorkerPool, '_spawn', autospec=True,
+                          side_effect=dead_worker) as mock_spawn:
+            with GitDiffTreeWorkerPool(self.repo_path, max_procs=2) as pool:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = [executor.submit(numstat, pool) for _ in range(8)]
+                    results = [future.result(timeout=5) for future in futures]
+
+        assert results == [None] * 8
+        assert mock_spawn.call_count == 8
+
+    def test_diff_stats_batch_uses_diff_tree_workers(self):
+        """Test that pooled diff-tree workers give the same stats as git show."""
+        from git_batch_analyzer.tools.git_tool import GitDiffTreeWorkerPool
+
+        with tempfile.TemporaryDirectory() as tmp:
+            def git(*args):
+                subprocess.run(
+                    ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+                    cwd=tmp, check=True, capture_output=True
+                )
+
+            git("init", "-q")
+            (Path(tmp) / "app.py").write_text("a\n")
+            (Path(tmp) / "lib.pyc").write_text("x\n")
+            git("add", "-A")
+            git("commit", "-q", "-m", "first")
+            (Path(tmp) / "app.py").write_text("a\nb\nc\n")
+            git("commit", "-q", "-am", "second")
+            git("commit", "-q", "--allow-empty", "-m", "empty")
+
+            tool = GitTool(Path(tmp))
+            hashes = [c["hash"] for c in tool.log_all_commits("HEAD", 7).data]
+
+            with patch.object(
+                GitDiffTreeWorkerPool, '_spawn', autospec=True,
+                side_effect=GitDiffTreeWorkerPool._spawn
+            ) as mock_spawn:
+                stats = tool.diff_stats_batch(hashes)
+                files = tool.get_commit_files_batch(hashes)
+
+            for commit_hash in hashes:
+                assert stats[commit_hash].data == tool.diff_stats(commit_hash).data
+                assert files[commit_hash].data == tool.get_commit_files(commit_hash).data
+            assert stats[hashes[1]].data["insertions"] == 2
+            assert mock_spawn.called
+
+    @patch.object(GitTool, '_run_git_command')
+    def test_fetch_branches_retries_failed_batch_singly(self, mock_run_git):
+        """Test that a failed batch is retried one branch at a time."""
+        def mock_git_command(args):
+            if "gone" in args:
+                return ToolResponse.error_response("couldn't find remote ref gone")
+            return ToolResponse.success_response("")
+
+        mock_run_git.side_effect = mock_git_command
+
+        response = self.git_tool.fetch_branches(["main", "gone", "develop"], batch_size=2)
+
+        assert response.success is True
+        assert response.data == ["gone"]
+        fetched = [c[0][0] for c in mock_run_git.call_args_list]
+        assert ["fetch", "origin", "main", "gone"] in fetched
+        assert ["fetch", "origin", "main"] in fetched
+        assert ["fetch", "origin", "develop"] in fetched
+
+    @patch.object(GitTool, '_run_git_command_streaming')
+    @patch.object(Path, 'exists')
+    def test_log_all_commits_parses_nul_records(self, mock_exists, mock_stream_git):
+        """Test that "|" in subjects and names survives NUL-separated parsing."""
+        mock_exists.return_value = True
+        mock_stream_git.return_value = iter([
+            "abc123\x001640995200\x00fix: a | b\x00Jane | Doe\x00jane@example.com\x00aaa111",
+            "bad\x00not-a-timestamp\x00skipped\x00X\x00x@example.com\x00",
+            "",
+        ])
+
+        response = self.git_tool.log_all_commits("main", 7)
+
+        assert response.success is True
+        assert response.data == [{
+            "hash": "abc123",
+            "timestamp": "2022-01-01T00:00:00+00:00",
+            "message": "fix: a | b",
+            "author_name": "Jane | Doe",
+            "author_email": "jane@example.com",
+        }]
+
+    @patch.object(GitTool, '_run_git_command_streaming')
+    @patch.object(Path, 'exists')
+    def test_log_merges_reuses_commit_walk(self, mock_exists, mock_stream_git):
+        """Test that log_merges after log_all_commits answers from the same walk."""
+        mock_exists.return_value = True
+        mock_stream_git.return_value = iter([
+            "abc123\x001640995200\x00Merge PR #1\x00Jane\x00jane@example.com\x00def456 ghi789",
+            "def456\x001640908800\x00feat: x\x00John\x00john@example.com\x00aaa111",
+        ])
+        
+        commits = self.git_tool.log_all_commits("main", 7).data
+        authors = self.git_tool.log_merges("main", 7, fields=frozenset({"author"})).data
+        merges = self.git_tool.log_merges("main", 7).data
+        
+        assert len(commits) == 2
+        assert authors == [{"author": "Jane"}]
+        assert merges == [{
+            "hash": "abc123",
+            "timestamp": "2022-01-01T00:00:00+00:00",
+            "message": "Merge PR #1",
+            "parents": ["def456", "ghi789"],
+            "author": "Jane",
+        }]
+        assert mock_stream_git.call_count == 1
+    
+    @patch.object(GitTool, '_run_git_command')
+    @patch.object(Path, 'exists')
+    def test_get_committers_uses_shortlog(self, mock_exists, mock_run_git):
+        """Test committer emails are read from git shortlog."""
+        mock_exists.return_value = True
+        mock_run_git.return_value = ToolResponse.success_response(
+            "    12\tJohn Doe <john@example.com>\n"
+            "     3\tJane Smith <jane@example.com>\n"
+            "     1\tJ. Doe <john@example.com>"
+        )
+        
+        response = self.git_tool.get_committers(7)
+        
+        assert response.success is True
+        assert response.data == ["john@example.com", "jane@example.com"]
+        mock_run_git.assert_called_once_with(
+            ["shortlog", "-sne", "--since=7 days ago", "HEAD"]
+        )
+    
+    def test_should_exclude_file(self):
+        """Test generated and build files are excluded from analysis."""
+        for filename in [
+            ".projen/tasks.json",
+            ".projenrc.py",
+            "node_modules/lib/index.js",
+            "dist/bundle.js",
+            "build/output.o",
+            "__pycache__/mod.cpython-311.pyc",
+            "src/module.pyc",
+            ".DS_Store",
+        ]:
+            assert self.git_tool._should_exclude_file(filename) is True, filename
+        
+        for filename in [
+            "src/main.py",
+            "src/dist/helper.py",  # Only top-level build dirs are excluded
+            "docs/.DS_Store",
+            ".projenrc.py.bak",
+            "README.md",
+        ]:
+            assert self.git_tool._should_exclude_file(filename) is False, filename
+    
     @patch.object(Path, 'exists')
     def test_operations_repo_not_exists(self, mock_exists):
         """Test that operations fail when repository doesn't exist."""
@@ -314,9 +936,10 @@ class TestGitToolIntegration:
         self.repo_path = Path("/tmp/test-repo")
         self.git_tool = GitTool(self.repo_path)
     
+    @patch.object(GitTool, '_run_git_command_streaming')
     @patch.object(GitTool, '_run_git_command')
     @patch.object(Path, 'exists')
-    def test_complete_workflow_simulation(self, mock_exists, mock_run_git):
+    def test_complete_workflow_simulation(self, mock_exists, mock_run_git, mock_stream_git):
         """Test a complete workflow simulation with realistic data."""
         mock_exists.return_value = True
         
@@ -325,8 +948,8 @@ class TestGitToolIntegration:
             if args[0] == "log":
                 # Return merge commits
                 return ToolResponse.success_response(
-                    "abc123|1640995200|Merge pull request #1|def456 ghi789|John Doe\n"
-                    "xyz789|1640908800|Merge branch 'feature'|jkl012 mno345|Jane Smith"
+                    "abc123\x001640995200\x00Merge pull request #1\x00def456 ghi789\x00John Doe\n"
+                    "xyz789\x001640908800\x00Merge branch 'feature'\x00jkl012 mno345\x00Jane Smith"
                 )
             elif args[0] == "show":
                 # Return diff stats
@@ -337,14 +960,15 @@ class TestGitToolIntegration:
             elif args[0] == "for-each-ref":
                 # Return branch info
                 return ToolResponse.success_response(
-                    "abc123|1640995200|origin/main\n"
-                    "def456|1640908800|origin/feature\n"
-                    "ghi789|1640822400|origin/old-feature"
+                    "abc123\x001640995200\x00origin/main\n"
+                    "def456\x001640908800\x00origin/feature\n"
+                    "ghi789\x001640822400\x00origin/old-feature"
                 )
             else:
                 return ToolResponse.success_response("")
         
         mock_run_git.side_effect = mock_git_command
+        mock_stream_git.side_effect = lambda args: iter(mock_git_command(args).data.split("\n"))
         
         # Test merge commits
         merge_response = self.git_tool.log_merges("main", 7)
@@ -1,13 +1,28 @@
 """Unit tests for LLMTool with mocked LLM responses."""
 
 import os
-from unittest.mock import Mock, patch, MagicMock
+import threading
+import time
+from unittest.mock import ANY, Mock, patch, MagicMock
 import pytest
 
-from git_batch_analyzer.tools.llm_tool import LLMTool
+from git_batch_analyzer.tools.llm_tool import (
+    LLMTool, RESPONSE_CACHE_TTL_SECONDS, TRUNCATION_MARKER, _CircuitBreaker, truncate_code,
+    truncate_tokens
+)
 from git_batch_analyzer.types import ToolResponse
 
 
+class _CharEncoding:
+    """Stand-in tiktoken encoding with one token per character."""
+    
+    def encode(self, text, disallowed_special=()):
+        return [ord(c) for c in text]
+    
+    def decode(self, tokens):
+        return "".join(chr(t) for t in tokens)
+
+
 class TestLLMTool:
     """Test cases for LLMTool class."""
     
@@ -23,7 +38,13 @@ class TestLLMTool:
             llm_tool = LLMTool(api_key="custom-key")
             
             assert os.environ["OPENAI_API_KEY"] == "custom-key"
+            mock_chat.assert_not_called()
+            
+            assert llm_tool.llm is mock_chat.return_value
+            assert llm_tool.llm is mock_chat.return_value
             mock_chat.assert_called_once_with(
+                http_client=ANY,
+                max_retries=5,
                 model="gpt-3.5-turbo",
                 temperature=0.7
             )
@@ -33,8 +54,11 @@ class TestLLMTool:
         with patch.dict(os.environ, {"OPENAI_API_KEY": "env-key"}):
             with patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI') as mock_chat:
                 llm_tool = LLMTool()
+                llm_tool.llm
                 
                 mock_chat.assert_called_once_with(
+                    http_client=ANY,
+                    max_retries=5,
                     model="gpt-3.5-turbo",
                     temperature=0.7
                 )
@@ -59,12 +83,53 @@ class TestLLMTool:
                     model="gpt-4",
                     temperature=0.3
                 )
+                llm_tool.llm
                 
                 mock_chat.assert_called_once_with(
+                    http_client=ANY,
+                    max_retries=5,
                     model="gpt-4",
                     temperature=0.3
                 )
     
+    def test_tools_share_http_client(self):
+        """Test that every LLMTool's client uses the same connection pool."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            with patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI') as mock_chat:
+                LLMTool().llm
+                LLMTool(model="gpt-4").llm
+                
+                first, second = mock_chat.call_args_list
+                assert first.kwargs["http_client"] is second.kwargs["http_client"]
+    
+    def test_recommendations_cap_response_tokens(self):
+        """Test that recommendations use a capped client unless max_tokens is already lower."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            with patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI') as mock_chat:
+                mock_chat.return_value.invoke.return_value = Mock(
+                    content="Keep reviewing pull requests promptly"
+                )
+                user_stats = {"username": "ann", "total_commits": 5}
+                
+                LLMTool().generate_user_recommendations(user_stats)
+                LLMTool(max_tokens=100).generate_user_recommendations(user_stats)
+                
+                caps = [call.kwargs.get("max_tokens") for call in mock_chat.call_args_list]
+                assert caps == [400, 100]
+    
+    def test_close_all_replaces_shared_http_client(self):
+        """Test that close_all closes the shared pool and later tools get a new one."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            with patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI') as mock_chat:
+                LLMTool().llm
+                LLMTool.close_all()
+                LLMTool().llm
+                
+                first, second = mock_chat.call_args_list
+                assert first.kwargs["http_client"].is_closed
+                assert second.kwargs["http_client"] is not first.kwargs["http_client"]
+                assert not second.kwargs["http_client"].is_closed
+    
     def test_validate_no_source_code_safe_data(self):
         """Test source code validation with safe data."""
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
@@ -114,6 +179,61 @@ class TestLLMTool:
             
             assert llm_tool._validate_no_source_code(unsafe_data) is False
     
+    def test_validate_no_source_code_scans_nested_text(self):
+        """Test that strings nested in lists, tuples and keys are all checked."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            assert llm_tool._validate_no_source_code(
+                [{"week": "2024-W01", "notes": ("ok", "import React from 'react'")}]
+            ) is False
+            assert llm_tool._validate_no_source_code({"console.log(x)": 1}) is False
+            assert llm_tool._validate_no_source_code(
+                [{"week": "2024-W01", "total_prs": 3, "ratio": 0.5, "merged": True}]
+            ) is True
+    
+    def test_truncate_code_keeps_head_and_tail(self):
+        """Test long code is cut to its head and tail, and only once."""
+        code = "a" * 6000 + "b" * 6000
+        
+        truncated = truncate_code(code)
+        
+        assert truncated == "a" * 5000 + TRUNCATION_MARKER + "b" * 5000
+        assert truncate_code(truncated) == truncated
+        assert truncate_code("short") == "short"
+    
+    def test_truncate_tokens_keeps_head_and_tail(self):
+        """Test code over the token budget keeps its first and last tokens."""
+        encoding = _CharEncoding()
+        
+        assert truncate_tokens("abcdefgh", encoding, max_tokens=4) == "ab" + TRUNCATION_MARKER + "gh"
+        assert truncate_tokens("abcd", encoding, max_tokens=4) == "abcd"
+    
+    def test_truncate_for_review_uses_model_encoding(self):
+        """Test review truncation applies the token budget of the model's encoding."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            with patch('git_batch_analyzer.tools.llm_tool.tiktoken') as mock_tiktoken:
+                mock_tiktoken.encoding_for_model.return_value = _CharEncoding()
+                llm_tool = LLMTool(model="gpt-4")
+                
+                code = "x" * 2000 + "y" * 2000
+                
+                assert llm_tool._truncate_for_review(code) == "x" * 1500 + TRUNCATION_MARKER + "y" * 1500
+                mock_tiktoken.encoding_for_model.assert_called_once_with("gpt-4")
+    
+    def test_truncate_for_review_without_tokenizer(self):
+        """Test review truncation falls back to characters if no encoding loads."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            with patch('git_batch_analyzer.tools.llm_tool.tiktoken') as mock_tiktoken:
+                mock_tiktoken.encoding_for_model.side_effect = KeyError("unknown model")
+                mock_tiktoken.get_encoding.side_effect = OSError("offline")
+                llm_tool = LLMTool(model="vendor/model")
+                
+                code = "x" * 4000
+                
+                assert llm_tool._encoding is None
+                assert llm_tool._truncate_for_review(code) == code
+    
     @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
     def test_generate_executive_summary_success(self, mock_chat_class):
         """Test successful executive summary generation."""
@@ -121,7 +241,7 @@ class TestLLMTool:
         mock_llm = Mock()
         mock_response = Mock()
         mock_response.content = "This is a comprehensive executive summary of development metrics showing strong team productivity with 15 total PRs processed. Lead times averaged 24.5 hours at the 50th percentile, indicating efficient code review processes. Change sizes remained manageable with median modifications of 150 lines. Weekly activity shows consistent delivery patterns with peak productivity in week 2. The team demonstrates excellent velocity and code quality maintenance. Overall metrics suggest a well-functioning development workflow with room for minor optimizations in review cycles."
-        mock_llm.invoke.return_value = mock_response
+        mock_llm.stream.return_value = [mock_response]
         mock_chat_class.return_value = mock_llm
         
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
@@ -145,18 +265,16 @@ class TestLLMTool:
             assert response.success is True
             assert "comprehensive executive summary" in response.data
             assert len(response.data.split()) <= 130  # Allow small buffer
-            mock_llm.invoke.assert_called_once()
+            mock_llm.stream.assert_called_once()
     
     @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
     def test_generate_executive_summary_too_long(self, mock_chat_class):
         """Test executive summary generation with response too long."""
         # Setup mock LLM with very long response
         mock_llm = Mock()
-        mock_response = Mock()
-        # Generate a response with more than 130 words
-        long_response = " ".join(["word"] * 150)
-        mock_response.content = long_response
-        mock_llm.invoke.return_value = mock_response
+        # Stream a response with more than 130 words
+        chunks = iter([Mock(content="word ") for _ in range(150)])
+        mock_llm.stream.return_value = chunks
         mock_chat_class.return_value = mock_llm
         
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
@@ -169,6 +287,39 @@ class TestLLMTool:
             
             assert response.success is False
             assert "Generated summary too long" in response.error
+            # Generation was abandoned at the first word over the limit
+            assert len(list(chunks)) == 150 - 131
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_abandoned_stream_is_not_cached(self, mock_chat_class, tmp_path):
+        """Test that a summary cut off for length is generated again on the next call."""
+        mock_llm = Mock()
+        mock_llm.stream.side_effect = lambda messages: iter([Mock(content="word ") for _ in range(150)])
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool(cache_dir=tmp_path)
+            
+            pr_metrics = {"total_prs": 10}
+            weekly_data = {"2024-W01": 5}
+            llm_tool.generate_executive_summary(pr_metrics, weekly_data)
+            response = llm_tool.generate_executive_summary(pr_metrics, weekly_data)
+            
+            assert response.success is False
+            assert mock_llm.stream.call_count == 2
+            assert list(tmp_path.iterdir()) == []
+    
+    def test_stream_words_counts_words_split_across_chunks(self):
+        """Test that a word spread over several chunks is counted once."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            llm = Mock()
+            pieces = ["Sh", "ip", "ped th", "ree ", "", " features"]
+            llm.stream.side_effect = lambda messages: iter([Mock(content=p) for p in pieces])
+            
+            assert llm_tool._stream_words(llm, "prompt", 4) == ("Shipped three  features", False)
+            assert llm_tool._stream_words(llm, "prompt", 2) == ("Shipped three  features", True)
+            assert llm_tool._stream_words(llm, "prompt", 1) == ("Shipped th", True)
     
     @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
     def test_generate_executive_summary_unsafe_data(self, mock_chat_class):
@@ -196,7 +347,7 @@ class TestLLMTool:
         """Test executive summary generation with LLM error."""
         # Setup mock LLM that raises an exception
         mock_llm = Mock()
-        mock_llm.invoke.side_effect = Exception("API rate limit exceeded")
+        mock_llm.stream.side_effect = Exception("API rate limit exceeded")
         mock_chat_class.return_value = mock_llm
         
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
@@ -265,6 +416,30 @@ class TestLLMTool:
             assert "Team Productivity Patterns" in response.data
             assert "Recommendations" in response.data
             mock_llm.invoke.assert_called_once()
+            prompt = mock_llm.invoke.call_args[0][0][0].content
+            assert '{"week":"2024-W01","total_prs":12,' in prompt
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_generate_organizational_trends_states_shared_values_once(self, mock_chat_class):
+        """Test that values repeated in every week are embedded once, in week order."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="Trends analysis")
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            weekly_data = [
+                {"week": week, "repository": "repo1", "pr_count": count, "lead_time_p50": 12.345}
+                for week, count in (("2024-W02", 5), ("2024-W01", 3))
+            ]
+            llm_tool.generate_organizational_trends(weekly_data)
+            
+            prompt = mock_llm.invoke.call_args[0][0][0].content
+            assert prompt.endswith(
+                '{"every_week":{"repository":"repo1","lead_time_p50":12.3},'
+                '"weeks":[{"week":"2024-W01","pr_count":3},{"week":"2024-W02","pr_count":5}]}'
+            )
     
     @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
     def test_generate_organizational_trends_unsafe_data(self, mock_chat_class):
@@ -307,6 +482,351 @@ class TestLLMTool:
             assert "Failed to generate organizational trends" in response.error
             assert "Network timeout" in response.error
 
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_identical_prompt_served_from_cache(self, mock_chat_class):
+        """Test that repeating a prompt does not call the LLM again."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="Trends analysis")
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            weekly_data = [{"week": "2024-W01", "total_prs": 10}]
+            first = llm_tool.generate_organizational_trends(weekly_data)
+            second = llm_tool.generate_organizational_trends(weekly_data)
+            llm_tool.generate_organizational_trends([{"week": "2024-W02", "total_prs": 3}])
+            
+            assert first.data == second.data == "Trends analysis"
+            assert mock_llm.invoke.call_count == 2
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_cache_dir_keeps_responses_across_instances(self, mock_chat_class, tmp_path):
+        """Test that responses stored in cache_dir are reused by a new LLMTool."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="Trends analysis")
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            weekly_data = [{"week": "2024-W01", "total_prs": 10}]
+            LLMTool(cache_dir=tmp_path).generate_organizational_trends(weekly_data)
+            response = LLMTool(cache_dir=tmp_path).generate_organizational_trends(weekly_data)
+            other_model = LLMTool(model="gpt-4", cache_dir=tmp_path)
+            other_model.generate_organizational_trends(weekly_data)
+            
+            assert response.data == "Trends analysis"
+            assert mock_llm.invoke.call_count == 2  # first run and the other model
+            # The run served from disk never built a client
+            assert mock_chat_class.call_count == 2
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_empty_responses_are_not_cached(self, mock_chat_class, tmp_path):
+        """Test that an empty answer is neither kept in memory nor written to disk."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="")
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool(cache_dir=tmp_path)
+            weekly_data = [{"week": "2024-W01", "total_prs": 10}]
+            llm_tool.generate_organizational_trends(weekly_data)
+            llm_tool.generate_organizational_trends(weekly_data)
+            
+            assert mock_llm.invoke.call_count == 2
+            assert list(tmp_path.iterdir()) == []
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_cache_dir_ignores_expired_responses(self, mock_chat_class, tmp_path):
+        """Test that responses older than the cache TTL are generated again."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="Trends analysis")
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            weekly_data = [{"week": "2024-W01", "total_prs": 10}]
+            LLMTool(cache_dir=tmp_path).generate_organizational_trends(weekly_data)
+            
+            later = time.time() + RESPONSE_CACHE_TTL_SECONDS + 1
+            with patch('git_batch_analyzer.tools.llm_tool.time.time', return_value=later):
+                LLMTool(cache_dir=tmp_path).generate_organizational_trends(weekly_data)
+            
+            assert mock_llm.invoke.call_count == 2
+
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_generate_user_recommendations_batch(self, mock_chat_class):
+        """Test that batch recommendations come back in input order, one per user."""
+        def invoke(messages):
+            username = messages[0].content.split("- Username: ")[1].split("\n")[0]
+            return Mock(content=f"Keep reviewing pull requests promptly, {username}")
+        
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = invoke
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            users = [{"username": name, "total_commits": 3} for name in ("ann", "bob", "cy")]
+            responses = llm_tool.generate_user_recommendations_batch(users, max_concurrent=2)
+            
+            assert [r.data for r in responses] == [
+                [f"Keep reviewing pull requests promptly, {name}"] for name in ("ann", "bob", "cy")
+            ]
+            assert mock_llm.invoke.call_count == 3
+            assert llm_tool.generate_user_recommendations_batch([]) == []
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_requests_in_flight_are_bounded_across_tools(self, mock_chat_class):
+        """Test that concurrent batches from separate tools share the in-flight limit."""
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+        
+        def invoke(messages):
+            with lock:
+                in_flight.append(None)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return Mock(content="Keep reviewing pull requests promptly")
+        
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = invoke
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}), \
+                patch('git_batch_analyzer.tools.llm_tool._request_slots', threading.BoundedSemaphore(2)):
+            users = [{"username": f"user{i}", "total_commits": 3} for i in range(6)]
+            threads = [
+                threading.Thread(target=LLMTool().generate_user_recommendations_batch, args=(users,))
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            assert mock_llm.invoke.call_count == 12
+            assert max(peak) == 2
+
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_trivial_inputs_skip_llm(self, mock_chat_class):
+        """Test that periods without PRs and near-empty histories are answered locally."""
+        mock_llm = Mock()
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            summary = llm_tool.generate_executive_summary({"total_prs": 0}, {})
+            recommendations = llm_tool.generate_user_recommendations({"username": "ann", "total_commits": 2})
+            
+            assert summary.success is True
+            assert "No pull requests" in summary.data
+            assert recommendations.data == ["Insufficient commit history for personalized recommendations."]
+            mock_llm.invoke.assert_not_called()
+            mock_llm.stream.assert_not_called()
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_prompts_keep_instructions_before_data(self, mock_chat_class):
+        """Test that prompts for different data share their instruction prefix."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="Keep up the consistent commit cadence")
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            llm_tool.generate_user_recommendations({"username": "ann", "total_commits": 3})
+            llm_tool.generate_user_recommendations({"username": "bob", "total_commits": 9})
+            
+            first, second = (call[0][0][0].content for call in mock_llm.invoke.call_args_list)
+            prefix = first[:first.index("Developer Profile:")]
+            assert "Requirements:" in prefix
+            assert second.startswith(prefix)
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_generate_code_review_insights_batch(self, mock_chat_class):
+        """Test that batch code reviews come back in input order, one per user."""
+        def invoke(messages):
+            filename = messages[0].content.split("File: ")[-1].split(" ---")[0]
+            return Mock(content=f"### File: {filename}")
+        
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = invoke
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            llm_tool._encoding = None
+            
+            users = [{"username": name, "top_files": [{"filename": f"{name}.py"}]} for name in ("ann", "bob")]
+            files = [{"ann.py": "x = 1"}, {"bob.py": "y = 2"}]
+            responses = llm_tool.generate_code_review_insights_batch(users, files, max_concurrent=2)
+            
+            assert [r.data for r in responses] == ["### File: ann.py", "### File: bob.py"]
+            assert llm_tool.generate_code_review_insights_batch([], []) == []
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_generate_user_recommendations_grouped(self, mock_chat_class):
+        """Test that several developers share one request and answers map back in order."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="""```json
+[{"developer": "2", "recommendations": ["Add tests alongside each new feature you ship"]},
+ {"developer": 1, "recommendations": ["Split large pull requests into smaller changes"]}]
+```""")
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            users = [
+                {"username": "ann", "total_commits": 5},
+                {"username": "bob", "total_commits": 1},
+                {"username": "cy", "total_commits": 7},
+            ]
+            responses = llm_tool.generate_user_recommendations_grouped(users, users_per_prompt=8)
+            
+            assert [r.data for r in responses] == [
+                ["Split large pull requests into smaller changes"],
+                ["Insufficient commit history for personalized recommendations."],
+                ["Add tests alongside each new feature you ship"],
+            ]
+            assert mock_llm.invoke.call_count == 1
+            prompt = mock_llm.invoke.call_args[0][0][0].content
+            assert "Developer 1:\n- Username: ann" in prompt
+            assert "Developer 2:\n- Username: cy" in prompt
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_generate_user_recommendations_grouped_falls_back_per_user(self, mock_chat_class):
+        """Test that an unparseable grouped answer is retried one developer at a time."""
+        def invoke(messages):
+            if "JSON array" in messages[0].content:
+                return Mock(content="Sorry, here is some prose instead")
+            username = messages[0].content.split("- Username: ")[1].split("\n")[0]
+            return Mock(content=f"Keep reviewing pull requests promptly, {username}")
+        
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = invoke
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            users = [{"username": name, "total_commits": 5} for name in ("ann", "bob")]
+            responses = llm_tool.generate_user_recommendations_grouped(users)
+            
+            assert [r.data for r in responses] == [
+                ["Keep reviewing pull requests promptly, ann"],
+                ["Keep reviewing pull requests promptly, bob"],
+            ]
+            assert mock_llm.invoke.call_count == 3
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_unparseable_grouped_answer_is_not_cached(self, mock_chat_class, tmp_path):
+        """Test that a grouped answer matching no developer is asked again next run."""
+        def invoke(messages):
+            if "JSON array" in messages[0].content:
+                return Mock(content="Sorry, here is some prose instead")
+            return Mock(content="Keep reviewing pull requests promptly")
+        
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = invoke
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            users = [{"username": name, "total_commits": 5} for name in ("ann", "bob")]
+            LLMTool(cache_dir=tmp_path).generate_user_recommendations_grouped(users)
+            LLMTool(cache_dir=tmp_path).generate_user_recommendations_grouped(users)
+            
+            grouped_calls = [
+                c for c in mock_llm.invoke.call_args_list if "JSON array" in c[0][0][0].content
+            ]
+            assert len(grouped_calls) == 2
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_generate_user_recommendations_filters_intro_and_markers(self, mock_chat_class):
+        """Test that lead-in text, headings and list markers are dropped."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content=(
+            "Here Are some personalized suggestions for you:\n"
+            "## Recommendations\n"
+            "\n"
+            "1. Split large pull requests into smaller focused changes\n"
+            "  - Write commit messages that explain the why\n"
+            "* Too short\n"
+        ))
+        mock_chat_class.return_value = mock_llm
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            result = llm_tool.generate_user_recommendations({"username": "ann", "total_commits": 5})
+            
+            assert result.success is True
+            assert result.data == [
+                "Split large pull requests into smaller focused changes",
+                "Write commit messages that explain the why",
+            ]
+
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_analyze_commit_message_quality_skips_repeated_commits(self, mock_chat_class):
+        """Test that commits repeating an earlier message and files are sent once."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="Quality analysis")
+        mock_chat_class.return_value = mock_llm
+        
+        bump = {"message": "chore: bump deps", "files_changed": [{"filename": "package.json"}]}
+        commits = [
+            {"hash": "a" * 40, **bump},
+            {"hash": "b" * 40, **bump},
+            {"hash": "c" * 40, "message": "chore: bump deps",
+             "files_changed": [{"filename": "package-lock.json"}]},
+        ]
+        
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            response = llm_tool.analyze_commit_message_quality(commits)
+            
+            assert response.data == "Quality analysis"
+            prompt = mock_llm.invoke.call_args[0][0][0].content
+            assert "aaaaaaaa" in prompt
+            assert "bbbbbbbb" not in prompt
+            assert "cccccccc" in prompt
+
+    
+    @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
+    def test_circuit_breaker_fails_fast_after_repeated_errors(self, mock_chat_class):
+        """Test that consecutive provider failures stop further LLM calls."""
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = Exception("Rate limit reached")
+        mock_chat_class.return_value = mock_llm
+        
+        breaker = _CircuitBreaker(failure_threshold=2, reset_seconds=30)
+        with patch('git_batch_analyzer.tools.llm_tool._circuit_breaker', breaker), \
+                patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
+            llm_tool = LLMTool()
+            
+            for week in ("2024-W01", "2024-W02", "2024-W03"):
+                response = llm_tool.generate_organizational_trends([{"week": week, "total_prs": 1}])
+                assert response.success is False
+            
+            assert mock_llm.invoke.call_count == 2
+            assert "LLM provider unavailable" in response.error
+            
+            # Once the reset period is over calls go through again
+            mock_llm.invoke.side_effect = None
+            mock_llm.invoke.return_value = Mock(content="Trends analysis")
+            with patch('git_batch_analyzer.tools.llm_tool.time.monotonic', return_value=time.monotonic() + 31):
+                response = llm_tool.generate_organizational_trends([{"week": "2024-W04", "total_prs": 1}])
+            assert response.data == "Trends analysis"
+
 
 class TestLLMToolIntegration:
     """Integration tests for LLMTool with realistic scenarios."""
@@ -339,6 +859,7 @@ class TestLLMToolIntegration:
             return mock_response
         
         mock_llm.invoke.side_effect = mock_invoke
+        mock_llm.stream.side_effect = lambda messages: iter([mock_invoke(messages)])
         mock_chat_class.return_value = mock_llm
         
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
@@ -388,7 +909,8 @@ class TestLLMToolIntegration:
             assert "Recommendations" in trends_response.data
             
             # Verify both calls were made
-            assert mock_llm.invoke.call_count == 2
+            assert mock_llm.stream.call_count == 1
+            assert mock_llm.invoke.call_count == 1
     
     @patch('git_batch_analyzer.tools.llm_tool.ChatOpenAI')
     def test_safety_validation_comprehensive(self, mock_chat_class):
@@ -183,7 +183,8 @@ class TestExecSummaryNode:
             temperature=0.7,
             api_key=None,
             base_url=None,
-            max_tokens=None
+            max_tokens=None,
+            cache_dir=None
         )
         mock_instance.generate_executive_summary.assert_called_once()
     
@@ -5,7 +5,9 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 
-from git_batch_analyzer.workflow.graph import create_workflow, process_repositories
+import threading
+
+from git_batch_analyzer.workflow.graph import create_workflow, process_repositories, _run_concurrently
 from git_batch_analyzer.types import create_initial_state, AnalysisState
 
 
@@ -54,6 +56,29 @@ class TestWorkflowIntegration:
         assert final_state.get("final_report") is not None
         assert "Git Analysis Report" in final_state["final_report"]
         
+    def test_run_concurrently_overlaps_nodes_and_merges_updates(self):
+        """Test that combined nodes run at the same time and their updates merge."""
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def summary_node(state):
+            barrier.wait()  # Would time out if the nodes ran one after another
+            return {"executive_summary": "summary", "exec_summary_completed": True}
+        
+        def trends_node(state):
+            barrier.wait()
+            state["errors"].append("trends failed")
+            return {"org_trend_completed": False, "errors": state["errors"]}
+        
+        state = {"errors": []}
+        update = _run_concurrently(summary_node, trends_node)(state)
+        
+        assert update == {
+            "executive_summary": "summary",
+            "exec_summary_completed": True,
+            "org_trend_completed": False,
+            "errors": ["trends failed"],
+        }
+    
     @patch('git_batch_analyzer.workflow.nodes.GitTool')
     def test_workflow_stops_on_sync_failure(self, mock_git_tool):
         """Test that workflow stops when sync node fails."""
@@ -3,9 +3,10 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call
 
-from git_batch_analyzer.workflow.nodes import sync_node, collect_node, metrics_node, stale_node
+from git_batch_analyzer.workflow.nodes import sync_node, collect_node, metrics_node, stale_node, _read_review_file, _llm_cache_dir
+from git_batch_analyzer.tools.llm_tool import truncate_code
 from git_batch_analyzer.types import AnalysisState, ToolResponse, create_initial_state
 
 
@@ -36,13 +37,41 @@ class TestSyncNode:
                 result = sync_node(state)
                 
                 # Verify calls
-                mock_git_tool.clone.assert_called_once_with("https://github.com/test/repo.git", depth=100)
-                mock_git_tool.fetch.assert_called_once_with("main")
+                mock_git_tool.clone.assert_called_once_with(
+                    "https://github.com/test/repo.git", depth=100, filter_spec=None, since_days=7
+                )
+                assert mock_git_tool.fetch.call_args_list == [call(), call("main")]
                 
                 # Verify result
                 assert result["sync_completed"] is True
                 assert "errors" not in result or not result["errors"]
     
+    def test_sync_node_partial_clone(self):
+        """Test that partial_clone makes new clones blob-less."""
+        state = create_initial_state(
+            config={"fetch_depth": 100, "partial_clone": True},
+            repository_url="https://github.com/test/repo.git",
+            repository_name="test-repo",
+            branch="main",
+            cache_path=Path("/tmp/test-repo")
+        )
+        
+        with patch('git_batch_analyzer.workflow.nodes.GitTool') as mock_git_tool_class:
+            mock_git_tool = Mock()
+            mock_git_tool_class.return_value = mock_git_tool
+            
+            with patch.object(Path, 'exists', return_value=False):
+                mock_git_tool.clone.return_value = ToolResponse.success_response({"message": "cloned"})
+                mock_git_tool.fetch.return_value = ToolResponse.success_response({"message": "fetched"})
+                
+                result = sync_node(state)
+                
+                mock_git_tool.clone.assert_called_once_with(
+                    "https://github.com/test/repo.git", depth=100, filter_spec="blob:none",
+                    since_days=7
+                )
+                assert result["sync_completed"] is True
+    
     def test_sync_node_success_existing_repo(self):
         """Test successful sync with existing repository."""
         state = create_initial_state(
@@ -155,18 +184,17 @@ class TestCollectNode:
             mock_git_tool_class.return_value = mock_git_tool
             
             # Mock successful responses
-            mock_git_tool.log_merges.return_value = ToolResponse.success_response(mock_commits)
-            mock_git_tool.diff_stats.side_effect = [
-                ToolResponse.success_response(mock_diff_stats[0]),
-                ToolResponse.success_response(mock_diff_stats[1])
-            ]
+            mock_git_tool.log_merges_with_stats.return_value = ToolResponse.success_response([
+                {"commit": commit, "diff_stats": stats}
+                for commit, stats in zip(mock_commits, mock_diff_stats)
+            ])
             mock_git_tool.remote_branches.return_value = ToolResponse.success_response(mock_branches)
             
             result = collect_node(state)
             
             # Verify calls
-            mock_git_tool.log_merges.assert_called_once_with("main", 7)
-            assert mock_git_tool.diff_stats.call_count == 2
+            mock_git_tool.log_merges_with_stats.assert_called_once_with("main", 7, first_parent=False)
+            mock_git_tool.diff_stats.assert_not_called()
             mock_git_tool.remote_branches.assert_called_once()
             
             # Verify result
@@ -208,7 +236,7 @@ class TestCollectNode:
             mock_git_tool_class.return_value = mock_git_tool
             
             # Mock failed merge commits collection
-            mock_git_tool.log_merges.return_value = ToolResponse.error_response("Git log failed")
+            mock_git_tool.log_merges_with_stats.return_value = ToolResponse.error_response("Git log failed")
             
             result = collect_node(state)
             
@@ -436,4 +464,47 @@ class TestStaleNode:
         # Should identify as stale since 10 days > 8 days (period_days)
         assert result["stale_completed"] is True
         assert len(result["stale_branches"]) == 1
-        assert result["stale_branches"][0]["name"] == "old-branch"
\ No newline at end of file
+        assert result["stale_branches"][0]["name"] == "old-branch"
+
+class TestReadReviewFile:
+    """Test cases for reading files for code review."""
+    
+    def test_small_file_read_whole(self, tmp_path):
+        """Test files within the review limit are returned unchanged."""
+        path = tmp_path / "small.py"
+        path.write_text("print('hi')\n", encoding="utf-8")
+        
+        assert _read_review_file(path) == "print('hi')\n"
+    
+    def test_large_file_matches_full_read_truncation(self, tmp_path):
+        """Test large files give the same excerpt as reading them whole."""
+        content = "".join(f"line {i} \u00e9\u20ac\n" for i in range(20000))
+        path = tmp_path / "large.json"
+        path.write_text(content, encoding="utf-8")
+        
+        assert truncate_code(_read_review_file(path)) == truncate_code(content)
+
+
+class TestLLMCacheDir:
+    """Test cases for choosing the LLM response cache directory."""
+    
+    def test_sampled_responses_not_kept_by_default(self):
+        """Test responses sampled above temperature 0 are not kept across runs."""
+        config = {"cache_dir": "/tmp/cache", "llm": {"temperature": 0.7}}
+        
+        assert _llm_cache_dir(config) is None
+    
+    def test_sampled_responses_kept_when_enabled(self):
+        """Test cache_nondeterministic keeps sampled responses across runs."""
+        config = {
+            "cache_dir": "/tmp/cache",
+            "llm": {"temperature": 0.7, "cache_nondeterministic": True},
+        }
+        
+        assert _llm_cache_dir(config) == Path("/tmp/cache") / ".llm-responses"
+    
+    def test_deterministic_responses_kept(self):
+        """Test responses at temperature 0 are kept without the option."""
+        config = {"cache_dir": "/tmp/cache", "llm": {"temperature": 0}}
+        
+        assert _llm_cache_dir(config) == Path("/tmp/cache") / ".llm-responses"